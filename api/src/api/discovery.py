@@ -1,10 +1,10 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from ..schemas.discovery import (
     TickerSearchResult, SearchSuggestion, SectorInfo, 
     IndustryInfo, StockSummary
 )
-from ..services.discovery_service import DiscoveryService
+from ..services.discovery_service import DiscoveryService, get_discovery_service
 
 router = APIRouter(
     prefix="/discovery",
@@ -17,7 +17,8 @@ async def search_tickers(
     query: str = Query(..., description="Search query for ticker symbol or company name"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
     include_delisted: bool = Query(False, description="Include delisted stocks"),
-    market: Optional[str] = Query(None, description="Filter by market (NYSE, NASDAQ, AMEX)")
+    market: Optional[str] = Query(None, description="Filter by market (NYSE, NASDAQ, AMEX)"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Universal search for stocks by ticker symbol or company name.
@@ -32,8 +33,7 @@ async def search_tickers(
     if len(query.strip()) < 1:
         raise HTTPException(status_code=400, detail="Query must be at least 1 character long")
     
-    discovery_service = DiscoveryService()
-    results = discovery_service.search_tickers(
+    results = await discovery_service.search_tickers(
         query=query.strip(),
         limit=limit,
         include_delisted=include_delisted,
@@ -51,7 +51,8 @@ async def search_tickers(
 @router.get("/search/suggestions", response_model=List[SearchSuggestion])
 async def get_search_suggestions(
     query: str = Query(..., description="Partial search query for autocomplete"),
-    limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions")
+    limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get search suggestions for autocomplete functionality.
@@ -64,8 +65,7 @@ async def get_search_suggestions(
     if len(query.strip()) < 1:
         return []
     
-    discovery_service = DiscoveryService()
-    suggestions = discovery_service.get_search_suggestions(
+    suggestions = await discovery_service.get_search_suggestions(
         query=query.strip(),
         limit=limit
     )
@@ -73,21 +73,23 @@ async def get_search_suggestions(
     return suggestions
 
 @router.get("/browse/sectors", response_model=List[SectorInfo])
-async def get_sectors():
+async def get_sectors(
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
+):
     """
     Get all available sectors with stock counts.
     
     Returns list of market sectors like Technology, Healthcare, Finance, etc.
     Each sector includes the number of stocks available.
     """
-    discovery_service = DiscoveryService()
     sectors = discovery_service.get_sectors()
     return sectors
 
 @router.get("/browse/sectors/{sector}", response_model=List[StockSummary])
 async def get_sector_stocks(
     sector: str,
-    limit: int = Query(50, ge=1, le=200, description="Maximum number of stocks to return")
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of stocks to return"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get stocks within a specific sector.
@@ -97,8 +99,7 @@ async def get_sector_stocks(
     
     Returns stocks sorted by market cap or volume.
     """
-    discovery_service = DiscoveryService()
-    stocks = discovery_service.get_sector_stocks(sector, limit)
+    stocks = await discovery_service.get_sector_stocks(sector, limit)
     
     if not stocks:
         raise HTTPException(
@@ -110,7 +111,8 @@ async def get_sector_stocks(
 
 @router.get("/browse/industries", response_model=List[IndustryInfo])
 async def get_industries(
-    sector: Optional[str] = Query(None, description="Filter industries by sector")
+    sector: Optional[str] = Query(None, description="Filter industries by sector"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get available industries, optionally filtered by sector.
@@ -119,14 +121,14 @@ async def get_industries(
     
     Returns list of industries like Software, Biotechnology, Banking, etc.
     """
-    discovery_service = DiscoveryService()
     industries = discovery_service.get_industries(sector)
     return industries
 
 @router.get("/browse/industries/{industry}", response_model=List[StockSummary])
 async def get_industry_stocks(
     industry: str,
-    limit: int = Query(50, ge=1, le=200, description="Maximum number of stocks to return")
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of stocks to return"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get stocks within a specific industry.
@@ -136,8 +138,7 @@ async def get_industry_stocks(
     
     Returns stocks in the specified industry.
     """
-    discovery_service = DiscoveryService()
-    stocks = discovery_service.get_industry_stocks(industry, limit)
+    stocks = await discovery_service.get_industry_stocks(industry, limit)
     
     if not stocks:
         raise HTTPException(
@@ -150,7 +151,8 @@ async def get_industry_stocks(
 @router.get("/browse/market-cap/{category}", response_model=List[StockSummary])
 async def get_stocks_by_market_cap(
     category: str,
-    limit: int = Query(100, ge=1, le=500, description="Maximum number of stocks to return")
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of stocks to return"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get stocks by market capitalization category.
@@ -171,8 +173,7 @@ async def get_stocks_by_market_cap(
             detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
         )
     
-    discovery_service = DiscoveryService()
-    stocks = discovery_service.get_stocks_by_market_cap(category, limit)
+    stocks = await discovery_service.get_stocks_by_market_cap(category, limit)
     
     if not stocks:
         raise HTTPException(
@@ -186,7 +187,8 @@ async def get_stocks_by_market_cap(
 async def get_stocks_by_price_range(
     min_price: float = Query(0, ge=0, description="Minimum stock price"),
     max_price: float = Query(1000, ge=0, description="Maximum stock price"),
-    limit: int = Query(100, ge=1, le=500, description="Maximum number of stocks to return")
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of stocks to return"),
+    discovery_service: DiscoveryService = Depends(get_discovery_service)
 ):
     """
     Get stocks within a specific price range.
@@ -203,8 +205,7 @@ async def get_stocks_by_price_range(
             detail="min_price cannot be greater than max_price"
         )
     
-    discovery_service = DiscoveryService()
-    stocks = discovery_service.get_stocks_by_price_range(min_price, max_price, limit)
+    stocks = await discovery_service.get_stocks_by_price_range(min_price, max_price, limit)
     
     if not stocks:
         raise HTTPException(
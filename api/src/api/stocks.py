@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import date, timedelta
 
-from ..database import get_db
 from ..schemas.stock import Stock, StockPredictionRequest, StockPrediction, StockRecommendation
-from ..services.stock_service import StockService
+from ..services.stock_service import StockService, get_stock_service
+
+# Most tickers one bulk recommendation request may score
+MAX_BULK_RECOMMENDATIONS = 50
 
 router = APIRouter(
     prefix="/stocks",
@@ -13,12 +14,40 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Declared before /{ticker} so "recommendations" isn't read as a ticker symbol
+@router.get("/recommendations", response_model=List[StockRecommendation])
+async def get_stock_recommendations(
+    tickers: List[str] = Query(..., description="Ticker symbols to score, repeated or comma-separated"),
+    stock_service: StockService = Depends(get_stock_service)
+):
+    """
+    Get trading recommendations for several stocks at once.
+    
+    - **tickers**: Up to 50 ticker symbols (e.g., 'AAPL,MSFT'); tickers without enough data are omitted
+    """
+    symbols = list(dict.fromkeys(
+        symbol.strip().upper() for value in tickers for symbol in value.split(',') if symbol.strip()
+    ))
+    if not symbols or len(symbols) > MAX_BULK_RECOMMENDATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Provide between 1 and {MAX_BULK_RECOMMENDATIONS} tickers"
+        )
+    
+    recommendations = await stock_service.get_stock_recommendations(symbols)
+    if not recommendations:
+        raise HTTPException(
+            status_code=404,
+            detail="Could not generate recommendations for the requested tickers. Insufficient data."
+        )
+    return recommendations
+
 @router.get("/{ticker}", response_model=List[dict])
 async def get_stock_data(
     ticker: str,
     start_date: date = date.today() - timedelta(days=30),
     end_date: date = date.today(),
-    db: Session = Depends(get_db)
+    stock_service: StockService = Depends(get_stock_service)
 ):
     """
     Retrieve historical stock data for a given ticker and date range.
@@ -27,7 +56,6 @@ async def get_stock_data(
     - **start_date**: Start date in YYYY-MM-DD format (default: 30 days ago)
     - **end_date**: End date in YYYY-MM-DD format (default: today)
     """
-    stock_service = StockService()
     stocks = await stock_service.get_stock_data(ticker.upper(), start_date, end_date)
     if stocks.empty:
         raise HTTPException(status_code=404, detail=f"No data found for ticker {ticker} in the specified date range")
@@ -37,7 +65,7 @@ async def get_stock_data(
 async def predict_stock_price(
     ticker: str,
     prediction_request: StockPredictionRequest,
-    db: Session = Depends(get_db)
+    stock_service: StockService = Depends(get_stock_service)
 ):
     """
     Predict stock prices for the next N days.
@@ -45,10 +73,9 @@ async def predict_stock_price(
     - **ticker**: Stock ticker symbol (e.g., 'AAPL')
     - **days**: Number of days to predict (1-30)
     """
-    stock_service = StockService()
     predictions = await stock_service.predict_stock_price(
         ticker.upper(), 
-        days=min(prediction_request.days, 30)  # Cap at 30 days
+        days=prediction_request.days
     )
     
     if not predictions:
@@ -61,14 +88,13 @@ async def predict_stock_price(
 @router.get("/{ticker}/recommendation", response_model=StockRecommendation)
 async def get_stock_recommendation(
     ticker: str,
-    db: Session = Depends(get_db)
+    stock_service: StockService = Depends(get_stock_service)
 ):
     """
     Get a trading recommendation for a stock based on technical analysis.
     
     - **ticker**: Stock ticker symbol (e.g., 'AAPL')
     """
-    stock_service = StockService()
     recommendation = await stock_service.get_stock_recommendation(ticker.upper())
     
     if not recommendation:
@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -14,23 +15,52 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_PORT: str = "5432"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_EXTERNAL_POOL: bool = False  # connect through PgBouncer (or similar) without a per-process pool
     
     # Security Configuration
     SECRET_KEY: str = "your-secret-key-here"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     
     # OpenTelemetry Configuration
+    OTEL_SDK_DISABLED: bool = False  # skip telemetry setup and leave decorated methods unwrapped
     JAEGER_ENDPOINT: str = "http://jaeger:4318/v1/traces"  # OTLP HTTP endpoint
     PROMETHEUS_PORT: int = 8001
     OTEL_CONSOLE_EXPORT: bool = False
+    OTEL_INSTRUMENT_URLLIB3: bool = False  # also span raw urllib3 calls (nests under every requests span)
     OTEL_SERVICE_NAME: str = "stock-prediction-api"
     OTEL_SERVICE_VERSION: str = "1.0.0"
+    # Span batching; larger batches amortize export overhead under bursty traffic
+    OTEL_BSP_MAX_QUEUE_SIZE: int = 4096
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE: int = 1024
+    OTEL_BSP_SCHEDULE_DELAY: int = 1000  # milliseconds
+    OTEL_BSP_EXPORT_TIMEOUT: int = 10000  # milliseconds
+    OTEL_METRIC_FLUSH_INTERVAL: float = 1.0  # seconds between batched yfinance metric flushes; 0 records inline
+    OTEL_BSP_WORKERS: Optional[int] = None  # concurrent OTLP exporters; defaults to half the CPU cores
     
     # Monitoring Configuration
     GRAFANA_PASSWORD: Optional[str] = "admin"
     
     # Cache Configuration
     REDIS_URL: Optional[str] = "redis://redis:6379/0"
+    REDIS_RETRY_INTERVAL: int = 30  # seconds before reconnecting after Redis was unreachable
+    YFINANCE_CACHE_MAXSIZE: int = 2048
+    YFINANCE_INFO_CACHE_TTL: int = 60  # seconds
+    YFINANCE_PROFILE_CACHE_TTL: int = 86400  # seconds; names, sector/industry and market cap change slowly
+    YFINANCE_HISTORY_CACHE_TTL: int = 60  # seconds
+    YFINANCE_UNKNOWN_TICKER_TTL: int = 3600  # seconds to remember symbols without info
+    YFINANCE_SECTOR_CACHE_TTL: int = 86400  # seconds; sector top-company lists change slowly
+    DISCOVERY_RESULT_CACHE_TTL: int = 300  # seconds to reuse finished browse/search responses
+    
+    # yfinance Network Configuration
+    YFINANCE_RETRIES: int = 3  # retries for transient network errors, with exponential back-off
+    YFINANCE_REQUESTS_PER_SECOND: float = 20.0  # outbound Yahoo request rate per process (0 disables)
+    
+    # Concurrency Configuration
+    WORKER_THREADS: int = 64  # threads available for blocking yfinance I/O
     
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -40,7 +70,7 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """Construct PostgreSQL database URL"""
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
@@ -55,7 +85,16 @@ class Settings(BaseSettings):
         """Check if running in development environment"""
         return self.ENVIRONMENT.lower() == "development"
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsed from the environment on first use"""
+    return Settings()
 
-# Legacy support - keep for backward compatibility during transition
-DATABASE_URL = settings.database_url
+def __getattr__(name: str):
+    # Legacy support - keep `settings` and `DATABASE_URL` importable during transition
+    # without parsing the environment at import time
+    if name == "settings":
+        return get_settings()
+    if name == "DATABASE_URL":
+        return get_settings().database_url
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
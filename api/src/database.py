@@ -1,10 +1,25 @@
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from .config import settings
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
+from .config import get_settings
 
-# Create SQLAlchemy engine using the new settings structure
-engine = create_engine(settings.database_url)
+settings = get_settings()
+
+if settings.DB_EXTERNAL_POOL:
+    # PgBouncer shares server connections across every worker process, so each session
+    # just opens a cheap client connection to it rather than holding a pool of its own
+    engine = create_engine(settings.database_url, poolclass=NullPool)
+else:
+    # Create SQLAlchemy engine with an explicitly sized connection pool
+    engine = create_engine(
+        settings.database_url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        pool_use_lifo=True
+    )
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
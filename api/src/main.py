@@ -1,27 +1,70 @@
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+import anyio.to_thread
+import asyncio
+import logging
 import time
+import yfinance as yf
 
-from .config import settings
-from .database import engine, Base
+from .config import get_settings
 from .api.stocks import router as stocks_router
 from .api.discovery import router as discovery_router
+from .services.discovery_service import discovery_service
 from .telemetry import init_telemetry, telemetry
 
-# Initialize OpenTelemetry before creating FastAPI app
-init_telemetry()
+logger = logging.getLogger(__name__)
 
 # NOTE: Database tables should be created via Alembic migrations, not auto-created
 # Remove the following line in production and use proper migrations:
 # Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Set up tracing/metrics providers and exporters on startup rather than at import;
+    # the FastAPI instrumentation below resolves the global providers lazily
+    init_telemetry()
+    
+    # Size both thread pools used for blocking yfinance I/O: Starlette's limiter for
+    # sync handlers and the loop's default executor used by asyncio.to_thread
+    settings = get_settings()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.WORKER_THREADS
+    executor = ThreadPoolExecutor(max_workers=settings.WORKER_THREADS)
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    # yfinance already routes every call through one process-wide session (and crumb);
+    # let it retry transient connection errors instead of failing the lookup
+    if hasattr(yf, "config"):
+        yf.config.network.retries = settings.YFINANCE_RETRIES
+    else:
+        logger.warning(
+            f"yfinance {yf.__version__} has no yf.config; YFINANCE_RETRIES is ignored "
+            "and transient connection errors fail the lookup"
+        )
+    
+    # Warm the company name index and popular ticker profiles in the background so
+    # startup isn't blocked on yfinance
+    warm_task = asyncio.create_task(asyncio.to_thread(discovery_service.warmup))
+    yield
+    warm_task.cancel()
+    # Hand the last interval of buffered yfinance metrics to the instruments while the
+    # meter provider (shut down at exit) can still export them
+    telemetry.flush_metrics()
+    discovery_service.close()
+    executor.shutdown(wait=False)
+
 # Initialize FastAPI app
+settings = get_settings()
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    description="Stock Prediction and Recommendation API"
+    description="Stock Prediction and Recommendation API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Initialize OpenTelemetry instrumentation for FastAPI
@@ -36,6 +79,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large list responses (sector/market-cap browsing) on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(stocks_router, prefix="/api")
 app.include_router(discovery_router, prefix="/api")
@@ -43,21 +89,27 @@ app.include_router(discovery_router, prefix="/api")
 # Add custom middleware for request timing
 @app.middleware("http")
 async def add_telemetry_middleware(request, call_next):
-    start_time = time.time()
+    # The histogram is only bound once telemetry has been initialized in lifespan
+    histogram = telemetry.api_request_duration
+    if histogram is None:
+        return await call_next(request)
+    
+    start_time = time.perf_counter_ns()
     
     response = await call_next(request)
     
-    # Record request duration
-    duration = time.time() - start_time
-    if telemetry.api_request_duration:
-        telemetry.api_request_duration.record(
-            duration,
-            {
-                "method": request.method,
-                "endpoint": str(request.url.path),
-                "status_code": str(response.status_code)
-            }
-        )
+    # Record request duration, labelled by route template rather than raw path so
+    # per-ticker URLs don't explode metric cardinality
+    duration = (time.perf_counter_ns() - start_time) / 1e9
+    route = request.scope.get("route")
+    histogram.record(
+        duration,
+        {
+            "method": request.method,
+            "endpoint": route.path if route is not None else "unmatched",
+            "status_code": str(response.status_code)
+        }
+    )
     
     # Add timing header
     response.headers["X-Process-Time"] = str(duration)
@@ -81,5 +133,6 @@ async def health_check():
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
-    from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+    # Include yfinance observations still waiting for the periodic flush
+    telemetry.flush_metrics()
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
\ No newline at end of file
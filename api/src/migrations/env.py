@@ -57,6 +57,17 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Callers (such as the migration tests) can hand over an open connection
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
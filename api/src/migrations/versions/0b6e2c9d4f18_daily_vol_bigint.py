@@ -0,0 +1,47 @@
+"""daily vol bigint
+
+Revision ID: 0b6e2c9d4f18
+Revises: f19c3b7d5e42
+Create Date: 2026-10-15 14:25:39.804317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e2c9d4f18'
+down_revision: Union[str, None] = 'f19c3b7d5e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Stores daily.vol as a BIGINT instead of the text the CSV loaders wrote, so volume
+    sorts and filters compare integers without a per-row cast.
+    """
+    with op.batch_alter_table('daily') as batch_op:
+        batch_op.alter_column(
+            'vol',
+            existing_type=sa.String,
+            type_=sa.BigInteger,
+            existing_nullable=False,
+            # Round through numeric in case a file wrote a fractional volume
+            postgresql_using='round(vol::numeric)::bigint',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily') as batch_op:
+        batch_op.alter_column(
+            'vol',
+            existing_type=sa.BigInteger,
+            type_=sa.String,
+            existing_nullable=False,
+            postgresql_using='vol::text',
+        )
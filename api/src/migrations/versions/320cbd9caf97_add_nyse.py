@@ -9,8 +9,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.ext.automap import automap_base
-from models.daily import Daily
 
 # revision identifiers, used by Alembic.
 revision: str = '320cbd9caf97'
@@ -18,20 +16,25 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-Base = automap_base()
 
 def upgrade() -> None:
     """Upgrade schema."""
-    bind = op.get_bind()
-    Base.prepare(autoload_with=bind)
-    Daily.metadata.create_all(bind=bind)
-    pass
+    # Spelled out rather than created from models.daily, which tracks the latest schema
+    op.create_table(
+        'daily',
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('ticker', sa.String, nullable=False),
+        sa.Column('per', sa.String, nullable=False),
+        sa.Column('date', sa.Date, nullable=False),
+        sa.Column('time', sa.Time, nullable=False),
+        sa.Column('open', sa.Float, nullable=False),
+        sa.Column('high', sa.Float, nullable=False),
+        sa.Column('low', sa.Float, nullable=False),
+        sa.Column('close', sa.Float, nullable=False),
+        sa.Column('vol', sa.String, nullable=False),
+    )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    bind = op.get_bind()
-    Base.prepare(autoload_with=bind)
-    daily = Base.classes.daily
-    op.drop_table(daily.__name__)
-    pass
+    op.drop_table('daily')
@@ -27,9 +27,12 @@ def upgrade() -> None:
     """
     from sqlalchemy.orm import Session
     from pathlib import Path
-    import csv
-    from datetime import datetime
-    from typing import List, Dict
+    import io
+    import os
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+    import pandas as pd
     
     # Get the base directory of the project
     data_dir = Path('F:\\Stock Data\\d_us_txt\\data\\daily\\us\\nyse stocks\\1')
@@ -44,66 +47,93 @@ def upgrade() -> None:
     if not csv_files:
         raise FileNotFoundError("No CSV files found in the data directory")
     
+    columns = ['id', 'ticker', 'per', 'date', 'time', 'open', 'high', 'low', 'close', 'vol']
+    
+    price_columns = {'<OPEN>': 'open', '<HIGH>': 'high', '<LOW>': 'low', '<CLOSE>': 'close'}
+
+    def read_daily(csv_file):
+        """Parse one file into daily columns, converting dates, prices and volume a column at a time"""
+        df = pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+        
+        # Malformed dates, prices or volumes become NaT/NaN and their rows are dropped
+        dt = pd.to_datetime(df['<DATE>'] + ' ' + df['<TIME>'], format='%Y%m%d %H%M%S', errors='coerce')
+        prices = df[list(price_columns)].apply(pd.to_numeric, errors='coerce').rename(columns=price_columns)
+        # Volume is normalised to a plain integer here, once, so nothing downstream
+        # re-parses thousands separators or fractional volumes row by row
+        vol = pd.to_numeric(df['<VOL>'].str.replace(',', '', regex=False), errors='coerce')
+        valid = dt.notna() & prices.notna().all(axis=1) & vol.notna()
+        if not valid.all():
+            print(f"Skipped {(~valid).sum()} malformed rows in {csv_file.name}")
+        df, dt = df[valid], dt[valid]
+        
+        # Create a unique ID using ticker and datetime
+        frame = pd.DataFrame({
+            'id': df['<TICKER>'] + '_' + dt.dt.strftime('%Y%m%d_%H%M%S'),
+            'ticker': df['<TICKER>'],
+            'per': df['<PER>'],
+        })
+        return frame.join(prices[valid]).assign(vol=vol[valid].round().astype('int64').astype(str)), dt
+
     # Create a session
     bind = op.get_bind()
     session = Session(bind=bind)
+    # PostgreSQL streams each file through COPY on the migration's own connection
+    # (and transaction), skipping per-row dicts and INSERT parameter binding
+    use_copy = bind.dialect.name == 'postgresql'
     
     try:
-        for csv_file in csv_files:
-            with open(csv_file, 'r') as f:
-                # Set the fieldnames to match the expected format with angle brackets
-                # fieldnames = ['<TICKER>', '<PER>', '<DATE>', '<TIME>', '<OPEN>', '<HIGH>', '<LOW>', '<CLOSE>', '<VOL>', '<OPENINT>']
-                reader = csv.DictReader(f)
+        if use_copy:
+            # Only this transaction's commit skips waiting on the WAL flush
+            op.execute("SET LOCAL synchronous_commit = off")
+        
+        workers = min(len(csv_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Parse upcoming files on worker threads while the current one loads; loads stay
+            # on the migration connection so they commit or roll back together
+            remaining = iter(csv_files)
+            pending = deque(executor.submit(read_daily, f) for f in islice(remaining, workers))
+            for csv_file in csv_files:
+                frame, dt = pending.popleft().result()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    pending.append(executor.submit(read_daily, next_file))
                 
-                # Process each row and create Daily objects
-                daily_data = []
-                for row in reader:
-                    try:
-                        # Parse date and time
-                        date_str = row['<DATE>']
-                        time_str = row['<TIME>']
-                        
-                        # Create a unique ID using ticker and datetime
-                        dt = datetime.strptime(f"{date_str} {time_str}", "%Y%m%d %H%M%S")
-                        unique_id = f"{row['<TICKER>']}_{dt.strftime('%Y%m%d_%H%M%S')}"
-                        
-                        daily_data.append({
-                            'id': unique_id,
-                            'ticker': row['<TICKER>'],
-                            'per': row['<PER>'],
-                            'date': date_str,
-                            'time': time_str,
-                            'open': float(row['<OPEN>']),
-                            'high': float(row['<HIGH>']),
-                            'low': float(row['<LOW>']),
-                            'close': float(row['<CLOSE>']),
-                            'vol': row['<VOL>']
-                        })
-                    except Exception as e:
-                        print(f"Error processing row in {csv_file.name}: {e}")
-                        continue
+                if use_copy:
+                    buffer = io.StringIO()
+                    frame.assign(
+                        date=dt.dt.strftime('%Y-%m-%d'), time=dt.dt.strftime('%H:%M:%S')
+                    )[columns].to_csv(buffer, index=False, header=False)
+                    buffer.seek(0)
+                    with bind.connection.cursor() as cursor:
+                        cursor.copy_expert(
+                            f"COPY daily ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                            buffer
+                        )
+                        loaded = cursor.rowcount
+                else:
+                    daily_data = frame.assign(date=dt.dt.date, time=dt.dt.time)[columns].to_dict('records')
+                    if daily_data:
+                        op.bulk_insert(
+                            sa.table(
+                                'daily',
+                                sa.column('id', sa.String),
+                                sa.column('ticker', sa.String),
+                                sa.column('per', sa.String),
+                                sa.column('date', sa.Date),
+                                sa.column('time', sa.Time),
+                                sa.column('open', sa.Float),
+                                sa.column('high', sa.Float),
+                                sa.column('low', sa.Float),
+                                sa.column('close', sa.Float),
+                                sa.column('vol', sa.String)
+                            ),
+                            daily_data
+                        )
+                    loaded = len(daily_data)
                 
-                # Bulk insert the data
-                if daily_data:
-                    op.bulk_insert(
-                        sa.table(
-                            'daily',
-                            sa.column('id', sa.String),
-                            sa.column('ticker', sa.String),
-                            sa.column('per', sa.String),
-                            sa.column('date', sa.Date),
-                            sa.column('time', sa.Time),
-                            sa.column('open', sa.Float),
-                            sa.column('high', sa.Float),
-                            sa.column('low', sa.Float),
-                            sa.column('close', sa.Float),
-                            sa.column('vol', sa.String)
-                        ),
-                        daily_data
-                    )
-                    
+                if loaded:
                     print(f"Successfully loaded data from {csv_file.name}")
-                    
+    
     except Exception as e:
         print(f"Error during data loading: {e}")
         raise
@@ -114,18 +144,20 @@ def upgrade() -> None:
 def downgrade() -> None:
     """Downgrade schema by removing data loaded from CSV files.
     
-    This function will remove all records from the daily table that were
-    added during the upgrade process. Since we're using a unique ID format
-    that includes the ticker and datetime, we can safely remove all records
-    that match this pattern.
+    This function will remove all records from the daily table for the tickers
+    found in the CSV files loaded during the upgrade process, deleting by ticker
+    rather than matching every row's id against a pattern.
     """
     from sqlalchemy.orm import Session
     from pathlib import Path
-    import re
+    import pandas as pd
     
     # Get the base directory of the project
-    base_dir = Path(__file__).parent.parent.parent.parent.parent
-    data_dir = base_dir / 'data'
+    data_dir = Path('F:\\Stock Data\\d_us_txt\\data\\daily\\us\\nyse stocks\\1')
+    
+    # Ensure data directory exists
+    if not data_dir.exists():
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
     
     # Create a session
     bind = op.get_bind()
@@ -133,17 +165,17 @@ def downgrade() -> None:
     
     try:
         # Get all CSV files in the data directory
-        csv_files = list(data_dir.glob('*.csv'))
+        csv_files = list(data_dir.glob('*.txt'))
         
-        # Create a regex pattern to match our unique ID format
-        # Format: TICKER_YYYYMMDD_HHMMSS
-        id_pattern = re.compile(r'^[A-Z]+_\d{8}_\d{6}$')
+        # Collect the tickers the upgrade loaded from these files
+        tickers = set()
+        for csv_file in csv_files:
+            tickers.update(pd.read_csv(csv_file, usecols=['<TICKER>'], dtype=str)['<TICKER>'].dropna())
         
-        # Delete records that match our unique ID pattern
-        op.execute(
-            sa.text("DELETE FROM daily WHERE id ~ :pattern"),
-            {'pattern': id_pattern.pattern}
-        )
+        # Delete every row for those tickers
+        if tickers:
+            daily = sa.table('daily', sa.column('ticker', sa.String))
+            op.execute(daily.delete().where(daily.c.ticker.in_(sorted(tickers))))
         
         print("Successfully removed data loaded from CSV files")
         
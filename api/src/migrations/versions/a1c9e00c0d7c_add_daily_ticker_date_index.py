@@ -0,0 +1,61 @@
+"""add daily ticker date index
+
+Revision ID: a1c9e00c0d7c
+Revises: f323c045cc84
+Create Date: 2026-10-15 10:12:31.402187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c9e00c0d7c'
+down_revision: Union[str, None] = 'f323c045cc84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Price columns carried in the index so ticker/date range reads are index-only scans
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'vol']
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Adds a (ticker, date) index for per-ticker date range reads of the daily table.
+    On PostgreSQL it covers the price columns and is built CONCURRENTLY so loading
+    continues meanwhile, and a trigram index backs ILIKE ticker matching.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.create_index('ix_daily_ticker_date', 'daily', ['ticker', 'date'])
+        return
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'ix_daily_ticker_date', 'daily', ['ticker', 'date'],
+            postgresql_include=PRICE_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_daily_ticker_trgm', 'daily', ['ticker'],
+            postgresql_using='gin',
+            postgresql_ops={'ticker': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.drop_index('ix_daily_ticker_date', table_name='daily')
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_daily_ticker_trgm', table_name='daily', postgresql_concurrently=True)
+        op.drop_index('ix_daily_ticker_date', table_name='daily', postgresql_concurrently=True)
@@ -0,0 +1,72 @@
+"""add stock meta
+
+Revision ID: b5e2d7a3f914
+Revises: a1c9e00c0d7c
+Create Date: 2026-10-15 11:04:52.718340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2d7a3f914'
+down_revision: Union[str, None] = 'a1c9e00c0d7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Latest daily row per ticker, read through the (ticker, date) index
+POSTGRES_LATEST_ROWS = """
+    INSERT INTO stock_meta (ticker, latest_close, latest_volume)
+    SELECT DISTINCT ON (ticker) ticker, close, CAST(vol AS DOUBLE PRECISION)
+    FROM daily
+    ORDER BY ticker, date DESC, time DESC
+"""
+
+LATEST_ROWS = """
+    INSERT INTO stock_meta (ticker, latest_close, latest_volume)
+    SELECT d.ticker, d.close, CAST(d.vol AS FLOAT)
+    FROM daily d
+    WHERE d.id = (
+        SELECT latest.id FROM daily latest
+        WHERE latest.ticker = d.ticker
+        ORDER BY latest.date DESC, latest.time DESC
+        LIMIT 1
+    )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Adds a one-row-per-ticker stock_meta table seeded with the latest close and
+    volume from daily. The descriptive columns are nullable and filled as ticker
+    metadata is collected, since daily carries prices only.
+    """
+    op.create_table(
+        'stock_meta',
+        sa.Column('ticker', sa.String, primary_key=True),
+        sa.Column('company_name', sa.String, nullable=True),
+        sa.Column('sector', sa.String, nullable=True),
+        sa.Column('industry', sa.String, nullable=True),
+        sa.Column('market_cap', sa.BigInteger, nullable=True),
+        sa.Column('latest_close', sa.Float, nullable=True),
+        sa.Column('latest_volume', sa.Float, nullable=True),
+        sa.Column('exchange', sa.String, nullable=True),
+    )
+    op.create_index('ix_stock_meta_sector', 'stock_meta', ['sector'])
+    op.create_index('ix_stock_meta_industry', 'stock_meta', ['industry'])
+    op.create_index('ix_stock_meta_market_cap', 'stock_meta', ['market_cap'])
+
+    bind = op.get_bind()
+    op.execute(POSTGRES_LATEST_ROWS if bind.dialect.name == 'postgresql' else LATEST_ROWS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stock_meta_market_cap', table_name='stock_meta')
+    op.drop_index('ix_stock_meta_industry', table_name='stock_meta')
+    op.drop_index('ix_stock_meta_sector', table_name='stock_meta')
+    op.drop_table('stock_meta')
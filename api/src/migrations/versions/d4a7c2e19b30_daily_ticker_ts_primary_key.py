@@ -0,0 +1,97 @@
+"""daily ticker ts primary key
+
+Revision ID: d4a7c2e19b30
+Revises: b5e2d7a3f914
+Create Date: 2026-10-15 12:21:07.553914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e19b30'
+down_revision: Union[str, None] = 'b5e2d7a3f914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Price columns carried in the (ticker, ...) index so range reads are index-only scans
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'vol']
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Replaces the TICKER_YYYYMMDD_HHMMSS string id with a (ticker, ts) primary key,
+    merging the date and time columns into ts. On PostgreSQL the key covers the
+    price columns, taking over from the (ticker, date) index it makes redundant.
+    """
+    bind = op.get_bind()
+    op.drop_index('ix_daily_ticker_date', table_name='daily')
+
+    if bind.dialect.name != 'postgresql':
+        op.add_column('daily', sa.Column('ts', sa.DateTime, nullable=True))
+        op.execute("UPDATE daily SET ts = date || ' ' || time")
+        with op.batch_alter_table('daily') as batch_op:
+            batch_op.alter_column('ts', existing_type=sa.DateTime, nullable=False)
+            batch_op.drop_column('id')
+            batch_op.drop_column('date')
+            batch_op.drop_column('time')
+            batch_op.create_primary_key('pk_daily', ['ticker', 'ts'])
+        return
+
+    op.add_column('daily', sa.Column('ts', sa.DateTime, nullable=True))
+    op.execute('UPDATE daily SET ts = date + time')
+    op.alter_column('daily', 'ts', existing_type=sa.DateTime, nullable=False)
+    op.drop_constraint('daily_pkey', 'daily', type_='primary')
+    op.drop_column('daily', 'id')
+    op.drop_column('daily', 'date')
+    op.drop_column('daily', 'time')
+    op.execute(
+        'ALTER TABLE daily ADD CONSTRAINT daily_pkey '
+        f"PRIMARY KEY (ticker, ts) INCLUDE ({', '.join(PRICE_COLUMNS)})"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+
+    if bind.dialect.name != 'postgresql':
+        with op.batch_alter_table('daily') as batch_op:
+            batch_op.add_column(sa.Column('id', sa.String, nullable=True))
+            batch_op.add_column(sa.Column('date', sa.Date, nullable=True))
+            batch_op.add_column(sa.Column('time', sa.Time, nullable=True))
+        op.execute(
+            "UPDATE daily SET id = ticker || '_' || strftime('%Y%m%d_%H%M%S', ts), "
+            "date = date(ts), time = time(ts)"
+        )
+        with op.batch_alter_table('daily') as batch_op:
+            batch_op.drop_constraint('pk_daily', type_='primary')
+            batch_op.alter_column('id', existing_type=sa.String, nullable=False)
+            batch_op.alter_column('date', existing_type=sa.Date, nullable=False)
+            batch_op.alter_column('time', existing_type=sa.Time, nullable=False)
+            batch_op.drop_column('ts')
+            batch_op.create_primary_key('pk_daily', ['id'])
+        op.create_index('ix_daily_ticker_date', 'daily', ['ticker', 'date'])
+        return
+
+    op.add_column('daily', sa.Column('id', sa.String, nullable=True))
+    op.add_column('daily', sa.Column('date', sa.Date, nullable=True))
+    op.add_column('daily', sa.Column('time', sa.Time, nullable=True))
+    op.execute(
+        "UPDATE daily SET id = ticker || '_' || to_char(ts, 'YYYYMMDD_HH24MISS'), "
+        "date = ts::date, time = ts::time"
+    )
+    op.alter_column('daily', 'id', existing_type=sa.String, nullable=False)
+    op.alter_column('daily', 'date', existing_type=sa.Date, nullable=False)
+    op.alter_column('daily', 'time', existing_type=sa.Time, nullable=False)
+    op.drop_constraint('daily_pkey', 'daily', type_='primary')
+    op.drop_column('daily', 'ts')
+    op.create_primary_key('daily_pkey', 'daily', ['id'])
+    op.create_index(
+        'ix_daily_ticker_date', 'daily', ['ticker', 'date'],
+        postgresql_include=PRICE_COLUMNS,
+    )
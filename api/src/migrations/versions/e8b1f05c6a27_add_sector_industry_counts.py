@@ -0,0 +1,109 @@
+"""add sector industry counts
+
+Revision ID: e8b1f05c6a27
+Revises: d4a7c2e19b30
+Create Date: 2026-10-15 13:02:44.190625
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b1f05c6a27'
+down_revision: Union[str, None] = 'd4a7c2e19b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEED_SECTORS = """
+    INSERT INTO sector_counts (name, stock_count, description)
+    SELECT sector, COUNT(*), 'Companies in the ' || lower(sector) || ' sector'
+    FROM stock_meta
+    WHERE sector IS NOT NULL
+    GROUP BY sector
+"""
+
+SEED_INDUSTRIES = """
+    INSERT INTO industry_counts (name, sector, stock_count)
+    SELECT industry, MAX(sector), COUNT(*)
+    FROM stock_meta
+    WHERE industry IS NOT NULL
+    GROUP BY industry
+"""
+
+# Adjusts the counts for the old and new sector/industry of each changed stock_meta row
+COUNTS_TRIGGER_FUNCTION = """
+    CREATE FUNCTION stock_meta_counts() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE sector_counts SET stock_count = stock_count - 1 WHERE name = OLD.sector;
+            DELETE FROM sector_counts WHERE name = OLD.sector AND stock_count <= 0;
+            UPDATE industry_counts SET stock_count = stock_count - 1 WHERE name = OLD.industry;
+            DELETE FROM industry_counts WHERE name = OLD.industry AND stock_count <= 0;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            IF NEW.sector IS NOT NULL THEN
+                INSERT INTO sector_counts (name, stock_count, description)
+                VALUES (NEW.sector, 1, 'Companies in the ' || lower(NEW.sector) || ' sector')
+                ON CONFLICT (name) DO UPDATE SET stock_count = sector_counts.stock_count + 1;
+            END IF;
+            IF NEW.industry IS NOT NULL THEN
+                INSERT INTO industry_counts (name, sector, stock_count)
+                VALUES (NEW.industry, NEW.sector, 1)
+                ON CONFLICT (name) DO UPDATE SET
+                    stock_count = industry_counts.stock_count + 1,
+                    sector = COALESCE(EXCLUDED.sector, industry_counts.sector);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Adds sector_counts and industry_counts summary tables seeded from stock_meta.
+    On PostgreSQL a row-level trigger on stock_meta keeps them current, so group
+    counts are a primary key lookup instead of a GROUP BY over the catalog.
+    """
+    op.create_table(
+        'sector_counts',
+        sa.Column('name', sa.Text, primary_key=True),
+        sa.Column('stock_count', sa.Integer, nullable=False),
+        sa.Column('description', sa.Text, nullable=True),
+    )
+    op.create_table(
+        'industry_counts',
+        sa.Column('name', sa.Text, primary_key=True),
+        sa.Column('sector', sa.Text, nullable=True),
+        sa.Column('stock_count', sa.Integer, nullable=False),
+    )
+    op.create_index('ix_industry_counts_sector', 'industry_counts', ['sector'])
+
+    op.execute(SEED_SECTORS)
+    op.execute(SEED_INDUSTRIES)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(COUNTS_TRIGGER_FUNCTION)
+        op.execute(
+            'CREATE TRIGGER stock_meta_counts '
+            'AFTER INSERT OR DELETE OR UPDATE OF sector, industry ON stock_meta '
+            'FOR EACH ROW EXECUTE FUNCTION stock_meta_counts()'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute('DROP TRIGGER stock_meta_counts ON stock_meta')
+        op.execute('DROP FUNCTION stock_meta_counts()')
+
+    op.drop_index('ix_industry_counts_sector', table_name='industry_counts')
+    op.drop_table('industry_counts')
+    op.drop_table('sector_counts')
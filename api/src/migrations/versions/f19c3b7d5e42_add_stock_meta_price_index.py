@@ -0,0 +1,37 @@
+"""add stock meta price index
+
+Revision ID: f19c3b7d5e42
+Revises: e8b1f05c6a27
+Create Date: 2026-10-15 13:47:18.662051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19c3b7d5e42'
+down_revision: Union[str, None] = 'e8b1f05c6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes stock_meta by latest close for price range browsing. A B-tree rather than
+    BRIN: rows are stored in ticker order, so prices have no physical correlation for
+    block ranges to exploit. On PostgreSQL it carries ticker and volume so a range
+    read ordered by volume is an index-only scan.
+    """
+    op.create_index(
+        'ix_stock_meta_latest_close', 'stock_meta', ['latest_close'],
+        postgresql_include=['ticker', 'latest_volume'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stock_meta_latest_close', table_name='stock_meta')
@@ -1,6 +1,11 @@
 from datetime import date
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, PlainSerializer
+from typing import Annotated, Optional, List
+
+# JSON output trims prices/changes to 4 decimals and market caps to whole units, which
+# roughly halves the size of long browse responses
+Price = Annotated[float, PlainSerializer(lambda value: round(value, 4), return_type=float, when_used='json')]
+MarketCap = Annotated[float, PlainSerializer(int, return_type=int, when_used='json')]
 
 class TickerSearchResult(BaseModel):
     """Individual ticker search result"""
@@ -8,10 +13,10 @@ class TickerSearchResult(BaseModel):
     company_name: str
     sector: Optional[str] = None
     industry: Optional[str] = None
-    market_cap: Optional[float] = None
-    current_price: Optional[float] = None
-    price_change: Optional[float] = None
-    price_change_percent: Optional[float] = None
+    market_cap: Optional[MarketCap] = None
+    current_price: Optional[Price] = None
+    price_change: Optional[Price] = None
+    price_change_percent: Optional[Price] = None
     volume: Optional[int] = None
     exchange: Optional[str] = None
 
@@ -46,10 +51,10 @@ class StockSummary(BaseModel):
     """Brief stock summary for browsing"""
     ticker: str
     company_name: str
-    current_price: float
-    price_change: float
-    price_change_percent: float
+    current_price: Price
+    price_change: Price
+    price_change_percent: Price
     volume: int
-    market_cap: Optional[float] = None
+    market_cap: Optional[MarketCap] = None
     sector: Optional[str] = None
     industry: Optional[str] = None
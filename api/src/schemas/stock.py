@@ -22,6 +22,7 @@ class Stock(StockBase):
         from_attributes = True
 
 class StockPredictionRequest(BaseModel):
+    # Validation rejects anything outside 1-30 before the handler runs
     days: int = Field(gt=0, le=30, description="Number of days to predict")
 
 class StockPrediction(BaseModel):
@@ -1,9 +1,22 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, ClassVar, Mapping, Tuple
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from datetime import date, timedelta
+from functools import cached_property, lru_cache, partial, wraps
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import json
+import random
+import logging
+import threading
+import time
+from contextlib import suppress
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from cachetools import TTLCache
+from yfinance.data import YfData
+from yfinance.exceptions import YFException, YFRateLimitError
+from ..config import get_settings
 from ..schemas.discovery import (
     TickerSearchResult, SearchSuggestion, SectorInfo, 
     IndustryInfo, MarketCapCategory, StockSummary
@@ -14,262 +27,850 @@ from ..telemetry_decorators import (
     log_method_call,
     time_operation
 )
+from .ticker_trie import TickerTrie
 
-class DiscoveryService:
-    def __init__(self):
-        # Static sector-industry mapping (can be moved to database later)
-        self.sector_industry_mapping = {
-            "Technology": [
-                "Software", "Hardware", "Semiconductors", "Internet Services",
-                "IT Services", "Computer Systems", "Electronic Components"
-            ],
-            "Healthcare": [
-                "Pharmaceuticals", "Biotechnology", "Medical Devices", 
-                "Healthcare Services", "Health Insurance"
-            ],
-            "Financial Services": [
-                "Banks", "Insurance", "Investment Banking", "Asset Management",
-                "Credit Services", "Real Estate"
-            ],
-            "Consumer Cyclical": [
-                "Retail", "Automotive", "Airlines", "Hotels & Restaurants",
-                "Media & Entertainment", "Apparel"
-            ],
-            "Consumer Defensive": [
-                "Food & Beverages", "Household Products", "Personal Care",
-                "Discount Stores", "Grocery Stores"
-            ],
-            "Industrials": [
-                "Aerospace & Defense", "Manufacturing", "Transportation",
-                "Construction", "Industrial Equipment"
-            ],
-            "Energy": [
-                "Oil & Gas", "Renewable Energy", "Utilities", "Coal"
-            ],
-            "Materials": [
-                "Metals & Mining", "Chemicals", "Construction Materials",
-                "Paper & Packaging"
-            ],
-            "Real Estate": [
-                "REITs", "Real Estate Development", "Real Estate Services"
-            ],
-            "Communication Services": [
-                "Telecommunications", "Media", "Internet Services"
-            ],
-            "Utilities": [
-                "Electric Utilities", "Gas Utilities", "Water Utilities",
-                "Renewable Utilities"
-            ]
-        }
+logger = logging.getLogger(__name__)
+
+# Errors a yfinance lookup raises for bad or unreachable symbols; network failures
+# from both requests and curl_cffi (their RequestExceptions) surface as OSError
+# subclasses and malformed responses as ValueError. Anything else is a bug and propagates
+_YF_ERRORS = (YFException, OSError, ValueError)
+
+# Plausible ticker symbols: up to 6 letters, dots and dashes, with at least one letter
+_TICKER_SYMBOL_RE = re.compile(r'(?=.*[A-Z])[A-Z.\-]{1,6}')
+
+# Process-wide yfinance response caches; per-ticker info only feeds names, sector/industry
+# and market cap (prices come from history), so it is kept for the longer profile TTL
+_info_cache = TTLCache(maxsize=get_settings().YFINANCE_CACHE_MAXSIZE, ttl=get_settings().YFINANCE_PROFILE_CACHE_TTL)
+_hist_cache = TTLCache(maxsize=get_settings().YFINANCE_CACHE_MAXSIZE, ttl=get_settings().YFINANCE_HISTORY_CACHE_TTL)
+# Symbols whose info came back without a company name; remembered longer than the
+# info TTL since unknown symbols rarely start resolving within the hour
+_unknown_tickers = TTLCache(maxsize=get_settings().YFINANCE_CACHE_MAXSIZE, ttl=get_settings().YFINANCE_UNKNOWN_TICKER_TTL)
+_cache_lock = threading.Lock()
+
+# Persistent pool for the sync batch paths, created on first use so importing the
+# module (or forking workers) doesn't start threads
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared yfinance worker pool, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=get_settings().WORKER_THREADS, thread_name_prefix="yf")
+        return _executor
+
+class _TokenBucket:
+    """Thread-safe token bucket pacing outbound requests; a rate of 0 disables it"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Shared by every thread making Yahoo requests, so fan-out stays under per-host limits
+_rate_limiter = _TokenBucket(get_settings().YFINANCE_REQUESTS_PER_SECOND)
+
+def _jittered(delay: float) -> float:
+    """Spread a back-off delay so fetches rate limited together don't retry in lockstep"""
+    return delay * random.uniform(0.5, 1.5)
+
+# Process-wide yf.Ticker registry (LRU) so symbols reuse their Ticker state across
+# requests; each Ticker holds its own history caches, which bounds the size
+@lru_cache(maxsize=512)
+def _ticker(symbol: str) -> yf.Ticker:
+    """Return the shared yf.Ticker for symbol"""
+    return yf.Ticker(symbol)
+
+# Optional Redis cache shared across workers; disabled when unset, and skipped for
+# REDIS_RETRY_INTERVAL after a failed connection (e.g. Redis still starting up)
+_REDIS_INFO_PREFIX = "yf:info:"
+_redis_client = None
+_redis_disabled = not get_settings().REDIS_URL
+_redis_retry_at = 0.0
+
+def _get_redis():
+    """Return the shared Redis client, or None when Redis is not available"""
+    global _redis_client, _redis_retry_at
+    if _redis_client is None and not _redis_disabled and time.monotonic() >= _redis_retry_at:
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                get_settings().REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+            client.ping()
+            _redis_client = client
+        except Exception as e:
+            retry_interval = get_settings().REDIS_RETRY_INTERVAL
+            logger.warning(f"Redis cache unavailable, using in-process cache only for {retry_interval}s: {e}")
+            _redis_retry_at = time.monotonic() + retry_interval
+    return _redis_client
+
+def _redis_get_infos(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch cached info for many tickers from Redis in one MGET round trip"""
+    client = _get_redis()
+    if client is None or not tickers:
+        return {}
+    try:
+        values = client.mget([_REDIS_INFO_PREFIX + ticker for ticker in tickers])
+    except Exception as e:
+        logger.warning(f"Redis MGET failed: {e}")
+        return {}
+    return {ticker: json.loads(raw) for ticker, raw in zip(tickers, values) if raw}
+
+def _redis_set_info(ticker: str, info: Dict[str, Any]) -> None:
+    """Store ticker info in Redis with the profile cache TTL"""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.set(_REDIS_INFO_PREFIX + ticker, json.dumps(info, default=str), ex=get_settings().YFINANCE_PROFILE_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Redis SET failed for {ticker}: {e}")
+
+def _prime_info_cache(tickers: List[str]) -> None:
+    """Load info missing from the in-process cache from Redis with a single batched lookup"""
+    with _cache_lock:
+        missing = [ticker for ticker in tickers if ticker not in _info_cache]
+    shared = _redis_get_infos(missing)
+    if shared:
+        with _cache_lock:
+            _info_cache.update(shared)
+
+# In-flight fetches per cache key, so concurrent misses share one outbound call
+_info_inflight: Dict[str, Future] = {}
+_hist_inflight: Dict[Any, Future] = {}
+_download_inflight: Dict[Any, Future] = {}
+
+# Batch downloads keyed by the sorted ticker tuple, so repeated chunks share one call
+_download_cache = TTLCache(maxsize=256, ttl=get_settings().YFINANCE_HISTORY_CACHE_TTL)
+
+def _single_flight(cache: TTLCache, inflight: Dict[Any, Future], key: Any, fetch: Callable[[], Any]) -> Any:
+    """Return cache[key], running fetch() at most once at a time per key on a miss"""
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            return value
+        future = inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = inflight[key] = Future()
+    
+    if not is_owner:
+        # Another thread is already fetching this key; wait for its result
+        return future.result()
+    
+    try:
+        value = fetch()
+    except BaseException as e:
+        with _cache_lock:
+            inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+    
+    with _cache_lock:
+        cache[key] = value
+        inflight.pop(key, None)
+    future.set_result(value)
+    return value
+
+# Finished browse and search responses, so repeat queries skip every per-ticker lookup
+_result_cache = TTLCache(maxsize=1024, ttl=get_settings().DISCOVERY_RESULT_CACHE_TTL)
+_search_cache = TTLCache(maxsize=10_000, ttl=get_settings().DISCOVERY_RESULT_CACHE_TTL)
+
+# Running computations per result cache key, so concurrent identical requests share one
+_result_inflight: Dict[Any, asyncio.Task] = {}
+
+def _cached_result(cache: TTLCache, key: Optional[Callable[..., Any]] = None):
+    """
+    Cache a DiscoveryService coroutine's non-empty result per call arguments, or per
+    key(*args, **kwargs) when given; cached lists are shared, so callers mustn't mutate them.
+    Concurrent misses for the same key await a single run of the coroutine.
+    """
+    def decorator(func):
+        async def compute(self, cache_key, args, kwargs):
+            result = await func(self, *args, **kwargs)
+            if result:
+                with _cache_lock:
+                    cache[cache_key] = result
+            return result
         
-        # Popular tickers for quick search (can be expanded)
-        self.popular_tickers = [
-            "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX",
-            "JPM", "JNJ", "V", "PG", "UNH", "HD", "MA", "DIS", "ADBE", "CRM",
-            "PYPL", "INTC", "CMCSA", "PFE", "VZ", "KO", "PEP", "T", "ABT",
-            "CSCO", "AVGO", "TMO", "ACN", "TXN", "LLY", "ABBV", "COST", "WMT"
-        ]
+        def finished(cache_key, task):
+            _result_inflight.pop(cache_key, None)
+            # Mark a failure as retrieved even if every waiter has gone away
+            if not task.cancelled():
+                task.exception()
+        
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache_key = (func.__name__, key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items()))))
+            with _cache_lock:
+                result = cache.get(cache_key)
+            if result is not None:
+                return result
+            
+            task = _result_inflight.get(cache_key)
+            if task is None:
+                task = asyncio.create_task(compute(self, cache_key, args, kwargs))
+                _result_inflight[cache_key] = task
+                task.add_done_callback(partial(finished, cache_key))
+            # Shielded so one caller disconnecting doesn't cancel the others' shared run
+            return await asyncio.shield(task)
+        return wrapper
+    return decorator
+
+def _search_key(query: str, limit: int = 20, include_delisted: bool = False, market: Optional[str] = None) -> tuple:
+    """search_tickers matching is case-insensitive, so fold the query for the cache key"""
+    return (query.casefold(), limit, include_delisted, market)
+
+def _suggestion_key(query: str, limit: int = 10) -> tuple:
+    """get_search_suggestions matching is case-insensitive too"""
+    return (query.casefold(), limit)
+
+# quoteSummary modules holding every info field discovery reads: names and exchange
+# (quoteType), sector/industry (assetProfile), market cap and price (price)
+_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary"
+_PROFILE_MODULES = "quoteType,assetProfile,price"
+
+def _fetch_profile(ticker: str) -> Dict[str, Any]:
+    """
+    Fetch the info fields discovery uses with one quoteSummary request, flattened into
+    the same keys as `.info` (which requests five modules plus a separate quote call)
+    """
+    params = {"modules": _PROFILE_MODULES, "formatted": "false", "corsDomain": "finance.yahoo.com"}
+    _rate_limiter.acquire()
+    response = YfData().get_raw_json(f"{_QUOTE_SUMMARY_URL}/{ticker}", params=params)
+    results = (response.get("quoteSummary") or {}).get("result") or []
+    
+    info: Dict[str, Any] = {}
+    for module in (results[0].values() if results else ()):
+        if isinstance(module, dict):
+            info.update((key, value) for key, value in module.items() if value is not None)
+    if 'regularMarketPrice' in info:
+        info.setdefault('currentPrice', info['regularMarketPrice'])
+    return info
+
+def _fetch_info(ticker: str) -> Dict[str, Any]:
+    """Fetch info from Redis when shared there, otherwise from Yahoo's quoteSummary"""
+    info = _redis_get_infos([ticker]).get(ticker)
+    if info is None:
+        info = _fetch_profile(ticker)
+        _redis_set_info(ticker, info)
+    if not info or 'longName' not in info:
+        with _cache_lock:
+            _unknown_tickers[ticker] = True
+    return info
 
-    @trace_method("batch_fetch_ticker_info")
+def _cached_info(ticker: str) -> Dict[str, Any]:
+    """
+    Return the ticker's `.info`, served from the in-process or Redis cache when fresh;
+    symbols recently found to be unknown return {} without a round-trip
+    """
+    with _cache_lock:
+        if ticker in _unknown_tickers:
+            return {}
+    return _single_flight(_info_cache, _info_inflight, ticker, lambda: _fetch_info(ticker))
+
+def _cached_history(ticker: str) -> pd.DataFrame:
+    """Return the last two days of history for ticker, cached per ticker and day"""
+    key = (ticker, date.today())
+    
+    def fetch() -> pd.DataFrame:
+        _rate_limiter.acquire()
+        return _ticker(ticker).history(period="2d")
+    
+    return _single_flight(_hist_cache, _hist_inflight, key, fetch)
+
+# Sector top-company lists change slowly, so they are kept far longer than quotes
+_sector_cache = TTLCache(maxsize=64, ttl=get_settings().YFINANCE_SECTOR_CACHE_TTL)
+_sector_inflight: Dict[str, Future] = {}
+
+def _fetch_sector_tickers(sector_key: str) -> Tuple[str, ...]:
+    """Fetch up to 50 valid top-company symbols for a yfinance sector key"""
+    # Use yfinance Sector API to get real-time top companies
+    _rate_limiter.acquire()
+    top_companies_df = yf.Sector(sector_key).top_companies
+    if top_companies_df is None or top_companies_df.empty:
+        return ()
+    
+    # Extract ticker symbols from the DataFrame index or symbol column
+    if hasattr(top_companies_df, 'index'):
+        tickers = list(top_companies_df.index)
+    elif 'Symbol' in top_companies_df.columns:
+        tickers = list(top_companies_df['Symbol'])
+    elif 'symbol' in top_companies_df.columns:
+        tickers = list(top_companies_df['symbol'])
+    else:
+        # Try to get the first column that looks like ticker symbols
+        tickers = list(top_companies_df.iloc[:, 0])
+    
+    # Clean and validate tickers
+    valid_tickers = []
+    for ticker in tickers:
+        if isinstance(ticker, str) and ticker.strip():
+            # Clean ticker symbol
+            clean_ticker = ticker.strip().upper()
+            # Basic validation - should be mostly letters and maybe dots/dashes
+            if _TICKER_SYMBOL_RE.fullmatch(clean_ticker):
+                valid_tickers.append(clean_ticker)
+    
+    return tuple(valid_tickers[:50])  # Limit to top 50 companies
+
+def _cached_sector_tickers(sector_key: str) -> Tuple[str, ...]:
+    """Return a sector's top-company symbols, cached per sector key"""
+    return _single_flight(_sector_cache, _sector_inflight, sector_key, lambda: _fetch_sector_tickers(sector_key))
+
+# Symbols per multi-ticker history download
+_HISTORY_CHUNK_SIZE = 20
+
+def _prefetch_last2d(tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Load the last two days of history for many tickers with one download per chunk,
+    storing each ticker's frame in the per-ticker history cache
+    """
+    today = date.today()
+    with _cache_lock:
+        frames = {ticker: _hist_cache[(ticker, today)] for ticker in tickers if (ticker, today) in _hist_cache}
+    missing = [ticker for ticker in tickers if ticker not in frames]
+    
+    for i in range(0, len(missing), _HISTORY_CHUNK_SIZE):
+        chunk = missing[i:i + _HISTORY_CHUNK_SIZE]
+        _rate_limiter.acquire()
+        data = yf.download(chunk, period="2d", group_by="ticker", auto_adjust=True, threads=True, progress=False)
+        fetched = {}
+        for ticker in chunk:
+            # Older yfinance returns flat columns when a chunk holds a single symbol
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                hist = data[ticker]
+            elif len(chunk) == 1:
+                hist = data
+            else:
+                continue
+            # Rows where this ticker didn't trade but others in the chunk did are all-NaN
+            fetched[ticker] = hist.dropna(how='all')
+        with _cache_lock:
+            _hist_cache.update(((ticker, today), hist) for ticker, hist in fetched.items())
+        frames.update(fetched)
+    return frames
+
+def _price_fields(hist: pd.DataFrame) -> Dict[str, Any]:
+    """Current price, volume and day-over-day change from a short price history"""
+    if hist.empty:
+        return {}
+    close = hist['Close'].to_numpy()
+    fields = {
+        'current_price': float(close[-1]),
+        'volume': int(hist['Volume'].to_numpy()[-1])
+    }
+    if len(close) > 1:
+        prev_price = float(close[-2])
+        fields['price_change'] = fields['current_price'] - prev_price
+        fields['price_change_percent'] = (fields['price_change'] / prev_price) * 100
+    return fields
+
+# Yahoo's multi-symbol quote endpoint: names, market cap and exchange, but no sector/industry
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+_QUOTE_BATCH_SIZE = 200
+_quote_cache = TTLCache(maxsize=get_settings().YFINANCE_CACHE_MAXSIZE, ttl=get_settings().YFINANCE_INFO_CACHE_TTL)
+# Batch responses keyed by the sorted missing symbols, so concurrent identical misses
+# (e.g. cold requests all warming the name index) share one request
+_quote_batch_cache = TTLCache(maxsize=256, ttl=get_settings().YFINANCE_INFO_CACHE_TTL)
+_quote_inflight: Dict[Any, Future] = {}
+
+def _fetch_quote_batch(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch quotes for many symbols with one request per batch, keyed by symbol"""
+    # YfData is yfinance's shared session, so requests carry its cookie and crumb
+    data = YfData()
+    quotes = {}
+    for i in range(0, len(tickers), _QUOTE_BATCH_SIZE):
+        params = {"symbols": ",".join(tickers[i:i + _QUOTE_BATCH_SIZE]), "formatted": "false"}
+        _rate_limiter.acquire()
+        response = data.get_raw_json(_QUOTE_URL, params=params)
+        for quote in (response.get("quoteResponse") or {}).get("result") or []:
+            if quote.get("symbol"):
+                quotes[quote["symbol"]] = quote
+    return quotes
+
+def _cached_quotes(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Return quotes for tickers, fetching every cache miss in a single batch"""
+    with _cache_lock:
+        quotes = {ticker: _quote_cache[ticker] for ticker in tickers if ticker in _quote_cache}
+    missing = [ticker for ticker in tickers if ticker not in quotes]
+    if missing:
+        key = tuple(sorted(missing))
+        fetched = _single_flight(_quote_batch_cache, _quote_inflight, key, lambda: _fetch_quote_batch(list(key)))
+        with _cache_lock:
+            _quote_cache.update(fetched)
+        quotes.update(fetched)
+    return quotes
+
+def _smallest_k(indices: np.ndarray, sort_key: np.ndarray, k: int) -> np.ndarray:
+    """
+    Return the k indices with the smallest sort_key, in key order with ties kept in
+    index order; a partition pass first trims the rows that need a full sort to ~k
+    """
+    if len(indices) > k > 0:
+        # Keep every row tied with the k-th key so ties resolve by index, not partition order
+        keep = sort_key <= np.partition(sort_key, k - 1)[k - 1]
+        indices, sort_key = indices[keep], sort_key[keep]
+    return indices[np.lexsort((indices, sort_key))][:k]
+
+# Price metrics StockSummary requires; rows missing any of them are skipped
+_SUMMARY_PRICE_FIELDS = ('current_price', 'price_change', 'price_change_percent', 'volume')
+
+def _has_summary_prices(info: Dict[str, Any]) -> bool:
+    """Check that info carries every price metric StockSummary requires"""
+    return all(info.get(field) is not None for field in _SUMMARY_PRICE_FIELDS)
+
+# Process-wide ticker -> casefolded company name index for in-memory name matching
+_name_index: Dict[str, str] = {}
+# Set once warm_name_index has covered POPULAR_TICKERS; names folded on first sight
+# land in the index earlier, so its emptiness can't signal that
+_name_index_warmed = threading.Event()
+# Autocomplete trie over popular tickers' symbols and name tokens, built by warm_name_index
+_suggestion_trie: Optional[TickerTrie] = None
+
+def _folded_name(ticker: str, info: Dict[str, Any]) -> str:
+    """Return the casefolded longName for ticker, folding and indexing it on first sight"""
+    folded = _name_index.get(ticker)
+    if folded is None:
+        name = info.get('longName')
+        if not name:
+            return ""
+        folded = _name_index[ticker] = name.casefold()
+    return folded
+
+def _build_prefix_trie(tickers) -> Dict[str, Any]:
+    """Build a nested-dict trie; each node's "" key lists every ticker below it in sorted order"""
+    root: Dict[str, Any] = {"": []}
+    for ticker in sorted(tickers):
+        node = root
+        node[""].append(ticker)
+        for char in ticker:
+            node = node.setdefault(char, {"": []})
+            node[""].append(ticker)
+    return root
+
+def _build_ngram_index(tickers) -> Dict[str, frozenset]:
+    """Map every 1- and 2-character substring to the set of tickers containing it"""
+    index: Dict[str, set] = {}
+    for ticker in tickers:
+        for size in (1, 2):
+            for i in range(len(ticker) - size + 1):
+                index.setdefault(ticker[i:i + size], set()).add(ticker)
+    return {gram: frozenset(members) for gram, members in index.items()}
+
+class DiscoveryService:
+    # Static sector-industry mapping (can be moved to database later)
+    SECTOR_INDUSTRY_MAPPING: ClassVar[Mapping[str, Tuple[str, ...]]] = {
+        "Technology": (
+            "Software", "Hardware", "Semiconductors", "Internet Services",
+            "IT Services", "Computer Systems", "Electronic Components"
+        ),
+        "Healthcare": (
+            "Pharmaceuticals", "Biotechnology", "Medical Devices", 
+            "Healthcare Services", "Health Insurance"
+        ),
+        "Financial Services": (
+            "Banks", "Insurance", "Investment Banking", "Asset Management",
+            "Credit Services", "Real Estate"
+        ),
+        "Consumer Cyclical": (
+            "Retail", "Automotive", "Airlines", "Hotels & Restaurants",
+            "Media & Entertainment", "Apparel"
+        ),
+        "Consumer Defensive": (
+            "Food & Beverages", "Household Products", "Personal Care",
+            "Discount Stores", "Grocery Stores"
+        ),
+        "Industrials": (
+            "Aerospace & Defense", "Manufacturing", "Transportation",
+            "Construction", "Industrial Equipment"
+        ),
+        "Energy": (
+            "Oil & Gas", "Renewable Energy", "Utilities", "Coal"
+        ),
+        "Materials": (
+            "Metals & Mining", "Chemicals", "Construction Materials",
+            "Paper & Packaging"
+        ),
+        "Real Estate": (
+            "REITs", "Real Estate Development", "Real Estate Services"
+        ),
+        "Communication Services": (
+            "Telecommunications", "Media", "Internet Services"
+        ),
+        "Utilities": (
+            "Electric Utilities", "Gas Utilities", "Water Utilities",
+            "Renewable Utilities"
+        )
+    }
+    
+    # Popular tickers for quick search (can be expanded)
+    POPULAR_TICKERS: ClassVar[Tuple[str, ...]] = (
+        "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX",
+        "JPM", "JNJ", "V", "PG", "UNH", "HD", "MA", "DIS", "ADBE", "CRM",
+        "PYPL", "INTC", "CMCSA", "PFE", "VZ", "KO", "PEP", "T", "ABT",
+        "CSCO", "AVGO", "TMO", "ACN", "TXN", "LLY", "ABBV", "COST", "WMT"
+    )
+    # Prefix trie and n-gram index so symbol matching never scans POPULAR_TICKERS
+    _PREFIX_TRIE: ClassVar[Dict[str, Any]] = _build_prefix_trie(POPULAR_TICKERS)
+    _NGRAM_INDEX: ClassVar[Dict[str, frozenset]] = _build_ngram_index(POPULAR_TICKERS)
+    _TICKER_ORDER: ClassVar[Dict[str, int]] = {ticker: i for i, ticker in enumerate(POPULAR_TICKERS)}
+    # O(1) membership checks; POPULAR_TICKERS itself stays the ordered sequence
+    _POPULAR_SET: ClassVar[frozenset] = frozenset(POPULAR_TICKERS)
+    
+    # Concurrency bound for the async batch path, and 429 back-off for info lookups
+    _MAX_CONCURRENT_FETCHES: ClassVar[int] = 64
+    _RATE_LIMIT_RETRIES: ClassVar[int] = 3
+    _RATE_LIMIT_BACKOFF: ClassVar[float] = 0.5  # seconds, doubled per retry
+    
+    # Simplified sector classification used when the yfinance Sector API is unavailable
+    _SECTOR_TICKERS: ClassVar[Mapping[str, Tuple[str, ...]]] = {
+        "Technology": ("AAPL", "MSFT", "GOOGL", "NVDA", "ADBE", "CRM", "INTC", "CSCO", "AVGO", "TXN"),
+        "Healthcare": ("JNJ", "PFE", "ABT", "TMO", "LLY", "ABBV"),
+        "Financial Services": ("JPM", "V", "MA", "PYPL"),
+        "Consumer Cyclical": ("AMZN", "TSLA", "HD", "DIS", "COST"),
+        "Consumer Defensive": ("PG", "KO", "PEP", "WMT"),
+        "Communication Services": ("META", "NFLX", "CMCSA", "VZ", "T"),
+        "Energy": (),
+        "Industrials": (),
+        "Materials": (),
+        "Real Estate": (),
+        "Utilities": ()
+    }
+    
+    # Map our sector names to yfinance sector keys
+    _YFINANCE_SECTOR_KEYS: ClassVar[Mapping[str, str]] = {
+        "Technology": "technology",
+        "Healthcare": "healthcare", 
+        "Financial Services": "financial-services",
+        "Consumer Cyclical": "consumer-cyclical",
+        "Consumer Defensive": "consumer-defensive",
+        "Industrials": "industrials",
+        "Energy": "energy",
+        "Materials": "basic-materials",  # Note: yfinance uses "basic-materials"
+        "Real Estate": "real-estate",
+        "Communication Services": "communication-services",
+        "Utilities": "utilities"
+    }
+    
+    # Market cap ranges (in billions)
+    _CAP_RANGES: ClassVar[Mapping[str, Tuple[float, Optional[float]]]] = {
+        "large-cap": (10, None),      # >$10B
+        "mid-cap": (2, 10),           # $2B-$10B
+        "small-cap": (0.3, 2),        # $300M-$2B
+        "micro-cap": (0, 0.3)         # <$300M
+    }
+    
+    # Additional high-volume/high-market-cap tickers for screening
+    _ADDITIONAL_TICKERS: ClassVar[Tuple[str, ...]] = (
+        # Additional large caps
+        "TSMC", "ASML", "ROCHE", "NESN", "SAP", "TM", "NVO", "UL", "BABA", "TSM",
+        # Additional mid caps that are commonly traded
+        "ROKU", "TWLO", "ZM", "PTON", "UBER", "LYFT", "SHOP", "SQ", "DKNG", "RBLX",
+        # REITs and utilities
+        "SPY", "QQQ", "IWM", "VTI", "EFA", "EEM", "GLD", "SLV", "USO", "XLE",
+        # Additional growth stocks
+        "ARKK", "ARKQ", "ARKG", "MSTR", "COIN", "HOOD", "SOFI", "AFRM", "BNPL", "OPEN"
+    )
+
+    @trace_method("abatch_fetch_ticker_info")
     @measure_yfinance_call("batch")
-    def _batch_fetch_ticker_info(self, tickers: List[str], max_workers: int = 10) -> Dict[str, Dict[str, Any]]:
+    async def _abatch_fetch_ticker_info(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Batch fetch ticker information on the event loop: the price download and every
+        info lookup run concurrently on the shared executor, bounded by a semaphore
+        """
+        if not tickers:
+            return {}
+        
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+        await asyncio.to_thread(_prime_info_cache, tickers)
+        batch_data, infos = await asyncio.gather(
+            asyncio.to_thread(self._bulk_history, tickers),
+            self._afetch_ticker_infos(tickers, semaphore),
+            return_exceptions=True
+        )
+        
+        if isinstance(batch_data, BaseException):
+            # Fall back to individual info + history requests per ticker, with the
+            # history prefetched in smaller batches
+            with suppress(*_YF_ERRORS):
+                await asyncio.to_thread(_prefetch_last2d, tickers)
+            full_infos = await asyncio.gather(
+                *(self._afetch_full_ticker_data(ticker, semaphore) for ticker in tickers)
+            )
+            return {ticker: info for ticker, info in zip(tickers, full_infos) if info}
+        
+        price_metrics = {}
+        with suppress(*_YF_ERRORS):
+            price_metrics = self._batch_price_metrics(batch_data, tickers)
+        
+        ticker_info = {}
+        for ticker, info in zip(tickers, infos):
+            if not info or isinstance(info, BaseException):
+                continue
+            ticker_info[ticker] = self._enrich_info_with_price_data(info, ticker, price_metrics)
+        return ticker_info
+
+    async def _afetch_ticker_infos(self, tickers: List[str], semaphore: asyncio.Semaphore) -> List[Any]:
+        """Fetch basic info for every ticker concurrently, in ticker order"""
+        return await asyncio.gather(
+            *(self._afetch_ticker_info(ticker, semaphore) for ticker in tickers),
+            return_exceptions=True
+        )
+
+    async def _afetch_quote_infos(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Batch fetch ticker information using concurrent requests with chunking strategy
+        Read names, market caps, prices and volumes for every named ticker from batched
+        quotes, for screening; the rows carry no sector/industry or price change
         """
         try:
-            return self._process_ticker_chunks(tickers, max_workers)
-        except Exception:
-            # Final fallback to individual requests
-            return self._fallback_to_individual_requests(tickers, max_workers)
+            quotes = await asyncio.to_thread(_cached_quotes, tickers)
+        except _YF_ERRORS as e:
+            logger.warning(f"Batch quote lookup failed, fetching info per ticker: {e}")
+            semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+            infos = await self._afetch_ticker_infos(tickers, semaphore)
+            quotes = {
+                ticker: info for ticker, info in zip(tickers, infos)
+                if info and not isinstance(info, BaseException)
+            }
+        # Copy so price enrichment doesn't mutate the cached quotes
+        return {ticker: dict(quotes[ticker]) for ticker in tickers if 'longName' in quotes.get(ticker, {})}
 
-    def _process_ticker_chunks(self, tickers: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Process tickers in chunks of optimal size"""
-        ticker_info = {}
-        ticker_chunks = self._create_ticker_chunks(tickers)
+    async def _afill_prices(self, ticker_info: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Add price metrics from one batched two-day download to screened rows"""
+        if not ticker_info:
+            return ticker_info
         
-        for chunk in ticker_chunks:
-            chunk_results = self._process_single_chunk(chunk, max_workers)
-            ticker_info.update(chunk_results)
-            
+        tickers = list(ticker_info)
+        price_metrics = {}
+        try:
+            price_metrics = self._batch_price_metrics(await asyncio.to_thread(self._bulk_history, tickers), tickers)
+        except _YF_ERRORS as e:
+            logger.warning(f"Batch history download failed for {len(tickers)} tickers: {e}")
+            with suppress(*_YF_ERRORS):
+                frames = await asyncio.to_thread(_prefetch_last2d, tickers)
+                price_metrics = {ticker: _price_fields(hist) for ticker, hist in frames.items()}
+        for ticker, row in ticker_info.items():
+            self._enrich_info_with_price_data(row, ticker, price_metrics)
         return ticker_info
 
-    def _create_ticker_chunks(self, tickers: List[str], chunk_size: int = 20) -> List[List[str]]:
-        """Split tickers into optimal chunks for batch processing"""
-        return [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+    async def _afill_profiles(self, ticker_info: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Add sector and industry from each ticker's full info to quote-based rows"""
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+        await asyncio.to_thread(_prime_info_cache, list(ticker_info))
+        infos = await self._afetch_ticker_infos(list(ticker_info), semaphore)
+        for row, info in zip(ticker_info.values(), infos):
+            if info and not isinstance(info, BaseException):
+                row['sector'] = info.get('sector')
+                row['industry'] = info.get('industry')
+        return ticker_info
 
-    def _process_single_chunk(self, chunk: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Process a single chunk of tickers with batch download and concurrent info fetching"""
-        try:
-            return self._process_chunk_with_batch_download(chunk, max_workers)
-        except Exception:
-            # Fallback to individual requests for this chunk
-            return self._process_chunk_individually(chunk, max_workers)
+    async def _afetch_ticker_info(self, ticker: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Fetch basic info for one ticker, backing off exponentially when rate limited"""
+        delay = self._RATE_LIMIT_BACKOFF
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            try:
+                async with semaphore:
+                    info = await asyncio.to_thread(_cached_info, ticker)
+                # Copy so price enrichment doesn't mutate the cached dict
+                return dict(info) if info and 'longName' in info else None
+            except YFRateLimitError:
+                if attempt == self._RATE_LIMIT_RETRIES:
+                    return None
+                await asyncio.sleep(_jittered(delay))
+                delay *= 2
+            except _YF_ERRORS:
+                return None
+        return None
 
-    def _process_chunk_with_batch_download(self, chunk: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Process chunk using batch download for price data and concurrent info fetching"""
-        batch_data = self._download_chunk_price_data(chunk)
-        return self._fetch_chunk_info_concurrently(chunk, batch_data, max_workers)
+    async def _afetch_full_ticker_data(self, ticker: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """Fetch info and price history for one ticker on the shared executor"""
+        async with semaphore:
+            return await asyncio.to_thread(self._get_full_ticker_data, ticker)
 
     @measure_yfinance_call("batch_download")
-    def _download_chunk_price_data(self, chunk: List[str]):
-        """Download price data for a chunk using yfinance batch download"""
-        return yf.download(chunk, period="2d", group_by="ticker", auto_adjust=True, prepost=True)
+    def _bulk_history(self, tickers: List[str]) -> pd.DataFrame:
+        """
+        Download two days of price data for all tickers with a single yfinance batch download,
+        cached per ticker set (the frame is shared, so callers must not mutate it)
+        """
+        key = (tuple(sorted(tickers)), "2d")
+        
+        def fetch() -> pd.DataFrame:
+            _rate_limiter.acquire()
+            return yf.download(
+                list(key[0]), period="2d", group_by="column", auto_adjust=True, prepost=True, threads=True, progress=False
+            )
+        
+        return _single_flight(_download_cache, _download_inflight, key, fetch)
 
-    def _fetch_chunk_info_concurrently(self, chunk: List[str], batch_data, max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Fetch ticker info concurrently and merge with batch price data"""
-        ticker_info = {}
+    @trace_method("bulk_info")
+    def _bulk_info(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch `.info` for many tickers in parallel (I/O bound, so threads overlap the round-trips)"""
+        if not tickers:
+            return {}
         
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunk))) as executor:
-            future_to_ticker = {
-                executor.submit(self._get_single_ticker_info, ticker): ticker 
-                for ticker in chunk
-            }
-            
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
-                try:
-                    info = future.result()
-                    if info:
-                        enriched_info = self._enrich_info_with_price_data(info, ticker, batch_data, chunk)
-                        ticker_info[ticker] = enriched_info
-                except Exception:
-                    # Log but continue with other tickers
-                    pass
-                    
+        _prime_info_cache(tickers)
+        return self._map_tickers(self._get_single_ticker_info, tickers)
+
+    def _map_tickers(self, fetch: Callable[[str], Optional[Dict[str, Any]]], tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run fetch for every ticker on the shared pool, keeping non-empty results"""
+        executor = _get_executor()
+        future_to_ticker = {
+            executor.submit(fetch, ticker): ticker 
+            for ticker in tickers
+        }
+        
+        ticker_info = {}
+        for future in as_completed(future_to_ticker):
+            ticker = future_to_ticker[future]
+            try:
+                info = future.result()
+                if info:
+                    ticker_info[ticker] = info
+            except _YF_ERRORS as e:
+                logger.warning(f"Error fetching {ticker}: {e}")
+                
         return ticker_info
 
-    def _enrich_info_with_price_data(self, info: Dict[str, Any], ticker: str, batch_data, chunk: List[str]) -> Dict[str, Any]:
-        """Enrich ticker info with price data from batch download"""
-        if batch_data.empty:
-            return info
-            
-        ticker_data = self._extract_ticker_data_from_batch(ticker, batch_data, chunk)
-        if ticker_data is not None and not ticker_data.empty:
-            self._add_price_metrics_to_info(info, ticker_data)
-            
+    def close(self) -> None:
+        """Shut down the shared worker pool; it is recreated on next use"""
+        global _executor
+        with _executor_lock:
+            executor, _executor = _executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _enrich_info_with_price_data(self, info: Dict[str, Any], ticker: str, price_metrics: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Enrich ticker info with its precomputed price metrics from the batch download"""
+        metrics = price_metrics.get(ticker)
+        if metrics:
+            info.update(metrics)
         return info
 
-    def _extract_ticker_data_from_batch(self, ticker: str, batch_data, chunk: List[str]):
-        """Extract individual ticker data from batch download results"""
-        if len(chunk) == 1:
-            return batch_data
+    def _batch_price_metrics(self, batch_data: pd.DataFrame, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Compute price metrics (current price, change, volume) for every ticker in one pass
+        over the batch download, instead of slicing the frame per ticker
+        """
+        if batch_data.empty:
+            return {}
+        
+        # Column-grouped downloads are (field, ticker), so each field is a flat
+        # rows x tickers block; newer yfinance keeps the levels even for a single ticker
+        if isinstance(batch_data.columns, pd.MultiIndex):
+            close = batch_data['Close']
+            volume = batch_data['Volume'] if 'Volume' in batch_data.columns.get_level_values(0) else None
         else:
-            return batch_data[ticker] if ticker in batch_data.columns else None
-
-    def _add_price_metrics_to_info(self, info: Dict[str, Any], ticker_data) -> None:
-        """Add price metrics (current price, change, volume) to ticker info"""
-        info['current_price'] = float(ticker_data['Close'].iloc[-1])
+            close = batch_data[['Close']].set_axis(tickers[:1], axis=1)
+            volume = batch_data[['Volume']].set_axis(tickers[:1], axis=1) if 'Volume' in batch_data else None
         
-        if len(ticker_data) > 1:
-            prev_price = float(ticker_data['Close'].iloc[-2])
-            info['price_change'] = info['current_price'] - prev_price
-            info['price_change_percent'] = (info['price_change'] / prev_price) * 100
-            
-        if 'Volume' in ticker_data:
-            info['volume'] = int(ticker_data['Volume'].iloc[-1])
-
-    def _process_chunk_individually(self, chunk: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Fallback: process chunk using individual ticker requests"""
-        ticker_info = {}
+        # Tickers missing a session in the shared batch frame have NaN rows, so take the
+        # last two valid closes per column rather than the last two rows
+        closes = close.to_numpy(dtype=np.float64)
+        rows = np.arange(len(closes))[:, None]
+        valid = ~np.isnan(closes)
+        last_idx = np.where(valid, rows, -1).max(axis=0)
+        prev_idx = np.where(valid & (rows < last_idx), rows, -1).max(axis=0)
+        cols = np.arange(closes.shape[1])
+        current = closes[last_idx, cols]
+        previous = closes[prev_idx, cols]
         
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunk))) as executor:
-            future_to_ticker = {
-                executor.submit(self._get_full_ticker_data, ticker): ticker 
-                for ticker in chunk
-            }
-            
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
-                try:
-                    info = future.result()
-                    if info:
-                        ticker_info[ticker] = info
-                except Exception:
-                    pass
-                    
-        return ticker_info
-
-    def _fallback_to_individual_requests(self, tickers: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
-        """Final fallback: process all tickers individually with concurrency"""
-        ticker_info = {}
+        last_volume = {}
+        if volume is not None:
+            last_volume = volume.ffill().iloc[-1].dropna().to_dict()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_ticker = {
-                executor.submit(self._get_full_ticker_data, ticker): ticker 
-                for ticker in tickers
-            }
-            
-            for future in as_completed(future_to_ticker):
-                ticker = future_to_ticker[future]
-                try:
-                    info = future.result()
-                    if info:
-                        ticker_info[ticker] = info
-                except Exception:
-                    pass
-                    
-        return ticker_info
+        price_metrics = {}
+        for i, ticker in enumerate(close.columns):
+            if last_idx[i] < 0:
+                continue
+            metrics = {'current_price': float(current[i])}
+            if prev_idx[i] >= 0:
+                metrics['price_change'] = float(current[i] - previous[i])
+                metrics['price_change_percent'] = float((current[i] - previous[i]) / previous[i] * 100)
+            if ticker in last_volume:
+                metrics['volume'] = int(last_volume[ticker])
+            price_metrics[ticker] = metrics
+        return price_metrics
 
     @measure_yfinance_call("ticker")
     def _get_single_ticker_info(self, ticker: str) -> Optional[Dict[str, Any]]:
-        """Get basic info for a single ticker"""
-        try:
-            ticker_obj = yf.Ticker(ticker)
-            info = ticker_obj.info
-            return info if info and 'longName' in info else None
-        except:
-            return None
+        """Get basic info for a single ticker, backing off exponentially when rate limited"""
+        delay = self._RATE_LIMIT_BACKOFF
+        for attempt in range(self._RATE_LIMIT_RETRIES + 1):
+            try:
+                info = _cached_info(ticker)
+                # Copy so price enrichment doesn't mutate the cached dict
+                return dict(info) if info and 'longName' in info else None
+            except YFRateLimitError:
+                if attempt == self._RATE_LIMIT_RETRIES:
+                    return None
+                time.sleep(_jittered(delay))
+                delay *= 2
+            except _YF_ERRORS:
+                return None
+        return None
 
     @measure_yfinance_call("ticker")
     def _get_full_ticker_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get full ticker data including price history"""
         try:
-            ticker_obj = yf.Ticker(ticker)
-            info = ticker_obj.info
-            hist = ticker_obj.history(period="2d")
+            info = _cached_info(ticker)
+            hist = _cached_history(ticker)
             
             if not info or 'longName' not in info:
                 return None
-                
-            # Add price data from history
-            if not hist.empty:
-                info['current_price'] = float(hist['Close'].iloc[-1])
-                info['volume'] = int(hist['Volume'].iloc[-1])
-                
-                if len(hist) > 1:
-                    prev_price = float(hist['Close'].iloc[-2])
-                    info['price_change'] = info['current_price'] - prev_price
-                    info['price_change_percent'] = (info['price_change'] / prev_price) * 100
-                    
+            
+            # Copy so the price data doesn't mutate the cached dict
+            info = dict(info)
+            info.update(_price_fields(hist))
             return info
-        except:
+        except _YF_ERRORS:
             return None
 
     @trace_method("batch_create_ticker_results")
     def _batch_create_ticker_results(self, ticker_info_dict: Dict[str, Dict[str, Any]]) -> List[TickerSearchResult]:
         """Create TickerSearchResult objects from batch fetched data"""
-        results = []
-        
-        for ticker, info in ticker_info_dict.items():
-            try:
-                result = TickerSearchResult(
-                    ticker=ticker,
-                    company_name=info.get('longName', ticker),
-                    sector=info.get('sector'),
-                    industry=info.get('industry'),
-                    market_cap=info.get('marketCap'),
-                    current_price=info.get('current_price'),
-                    price_change=info.get('price_change'),
-                    price_change_percent=info.get('price_change_percent'),
-                    volume=info.get('volume'),
-                    exchange=info.get('exchange')
-                )
-                results.append(result)
-            except Exception:
-                # Skip invalid data
-                continue
-                
-        return results
+        # Fields come from our own enrichment, so skip validation; FastAPI's
+        # response_model still validates the outgoing payload
+        return [
+            TickerSearchResult.model_construct(
+                ticker=ticker,
+                company_name=info.get('longName') or ticker,
+                sector=info.get('sector'),
+                industry=info.get('industry'),
+                market_cap=info.get('marketCap'),
+                current_price=info.get('current_price'),
+                price_change=info.get('price_change'),
+                price_change_percent=info.get('price_change_percent'),
+                volume=info.get('volume'),
+                exchange=info.get('exchange')
+            )
+            for ticker, info in ticker_info_dict.items()
+        ]
 
     @trace_method("batch_create_stock_summaries")
     def _batch_create_stock_summaries(self, ticker_info_dict: Dict[str, Dict[str, Any]]) -> List[StockSummary]:
@@ -277,28 +878,29 @@ class DiscoveryService:
         summaries = []
         
         for ticker, info in ticker_info_dict.items():
-            try:
-                summary = StockSummary(
-                    ticker=ticker,
-                    company_name=info.get('longName', ticker),
-                    current_price=info.get('current_price'),
-                    price_change=info.get('price_change'),
-                    price_change_percent=info.get('price_change_percent'),
-                    volume=info.get('volume'),
-                    market_cap=info.get('marketCap'),
-                    sector=info.get('sector'),
-                    industry=info.get('industry')
-                )
-                summaries.append(summary)
-            except Exception:
-                # Skip invalid data
+            # Skip tickers without the price metrics StockSummary requires, since
+            # model_construct doesn't validate them
+            if not _has_summary_prices(info):
                 continue
+            
+            summaries.append(StockSummary.model_construct(
+                ticker=ticker,
+                company_name=info.get('longName') or ticker,
+                current_price=info['current_price'],
+                price_change=info['price_change'],
+                price_change_percent=info['price_change_percent'],
+                volume=info['volume'],
+                market_cap=info.get('marketCap'),
+                sector=info.get('sector'),
+                industry=info.get('industry')
+            ))
                 
         return summaries
 
     @trace_method("search_tickers")
     @log_method_call(include_args=True, include_result=True)
-    def search_tickers(
+    @_cached_result(_search_cache, key=_search_key)
+    async def search_tickers(
         self, 
         query: str, 
         limit: int = 20, 
@@ -309,129 +911,117 @@ class DiscoveryService:
         Search for tickers by symbol or company name
         """
         query_upper = query.upper()
+        query_folded = query.casefold()
         
-        # Find matching tickers first (without API calls)
-        matching_tickers = []
+        # Select candidates entirely in memory; the network is only hit for returned rows
+        matching_tickers = self._ticker_prefix_matches(query_upper)
         
-        # Check for exact match
-        if query_upper in self.popular_tickers:
-            matching_tickers.append(query_upper)
-        
-        # Find partial matches in popular tickers
-        for ticker in self.popular_tickers:
-            if ticker != query_upper and (
-                ticker.startswith(query_upper) or 
-                query_upper in ticker
-            ):
+        # Then substring matches by symbol, company name words starting with the query
+        # (from the suggestion trie) and finally names containing it anywhere
+        if not _name_index_warmed.is_set():
+            await asyncio.to_thread(self.warm_name_index)
+        seen = set(matching_tickers)
+        for ticker in self._ticker_substring_matches(query_upper):
+            if ticker not in seen:
                 matching_tickers.append(ticker)
-                if len(matching_tickers) >= limit * 2:  # Get extra to filter later
-                    break
+                seen.add(ticker)
+        if _suggestion_trie is not None:
+            for ticker, _ in _suggestion_trie.prefix_search(query_folded, limit):
+                if ticker not in seen:
+                    matching_tickers.append(ticker)
+                    seen.add(ticker)
+        for ticker, name in _name_index.items():
+            if len(matching_tickers) >= limit:
+                break
+            if ticker not in seen and query_folded in name:
+                matching_tickers.append(ticker)
+                seen.add(ticker)
         
         # Batch fetch ticker information
         if matching_tickers:
-            ticker_info_dict = self._batch_fetch_ticker_info(matching_tickers[:limit * 2])
+            ticker_info_dict = await self._abatch_fetch_ticker_info(matching_tickers[:limit])
             
-            # Filter by company name if needed and create results
-            results = []
+            # Keep rows whose ticker or company name still matches, in match order
+            matched_info = {}
             for ticker in matching_tickers:
-                if len(results) >= limit:
+                if len(matched_info) >= limit:
                     break
-                    
-                if ticker in ticker_info_dict:
-                    info = ticker_info_dict[ticker]
-                    company_name = info.get('longName', '')
-                    
-                    # Check if query matches ticker or company name
-                    if (query_upper in ticker or 
-                        ticker.startswith(query_upper) or
-                        query.upper() in company_name.upper()):
-                        
-                        result = TickerSearchResult(
-                            ticker=ticker,
-                            company_name=company_name,
-                            sector=info.get('sector'),
-                            industry=info.get('industry'),
-                            market_cap=info.get('marketCap'),
-                            current_price=info.get('current_price'),
-                            price_change=info.get('price_change'),
-                            price_change_percent=info.get('price_change_percent'),
-                            volume=info.get('volume'),
-                            exchange=info.get('exchange')
-                        )
-                        results.append(result)
+                info = ticker_info_dict.get(ticker)
+                if info and (query_upper in ticker or query_folded in _folded_name(ticker, info)):
+                    matched_info[ticker] = info
             
-            return results
+            return self._batch_create_ticker_results(matched_info)
         
         return []
 
-    @trace_method("try_exact_ticker_match") 
-    @measure_yfinance_call("ticker")
-    def _try_exact_ticker_match(self, ticker: str) -> Optional[TickerSearchResult]:
-        """Try to get exact ticker match"""
-        try:
-            ticker_info = yf.Ticker(ticker)
-            info = ticker_info.info
-            if info and 'longName' in info:
-                return self._create_ticker_result(ticker, info)
-        except:
-            pass
-        return None
+    def _ticker_prefix_matches(self, query_upper: str) -> List[str]:
+        """Return popular tickers starting with query_upper, exact match first, via the trie"""
+        node = self._PREFIX_TRIE
+        for char in query_upper:
+            node = node.get(char)
+            if node is None:
+                return []
+        return list(node[""])
 
-    @trace_method("search_popular_tickers")
-    def _search_popular_tickers(self, query: str, query_upper: str, limit: int, existing_results: List) -> List[TickerSearchResult]:
-        """Search through popular tickers"""
-        results = []
-        
-        for ticker in self.popular_tickers:
-            if len(existing_results) + len(results) >= limit:
-                break
-                
-            # Skip if already added
-            if any(r.ticker == ticker for r in existing_results):
-                continue
-                
-            # Check if ticker matches query
-            if (query_upper in ticker or 
-                ticker.startswith(query_upper) or
-                self._company_name_matches(ticker, query)):
-                
-                ticker_result = self._get_ticker_info_safe(ticker)
-                if ticker_result:
-                    results.append(ticker_result)
-        
-        return results
+    def _ticker_substring_matches(self, query_upper: str) -> List[str]:
+        """Return popular tickers containing query_upper, in POPULAR_TICKERS order"""
+        if len(query_upper) == 1:
+            candidates = self._NGRAM_INDEX.get(query_upper, frozenset())
+        else:
+            bigrams = [query_upper[i:i + 2] for i in range(len(query_upper) - 1)]
+            candidates = frozenset.intersection(
+                *(self._NGRAM_INDEX.get(gram, frozenset()) for gram in bigrams)
+            )
+        # Shared bigrams don't guarantee a contiguous match, so confirm the survivors
+        matches = [ticker for ticker in candidates if query_upper in ticker]
+        matches.sort(key=self._TICKER_ORDER.__getitem__)
+        return matches
 
-    @measure_yfinance_call("ticker")
-    def _get_ticker_info_safe(self, ticker: str) -> Optional[TickerSearchResult]:
-        """Safely get ticker info with error handling"""
-        try:
-            ticker_info = yf.Ticker(ticker)
-            info = ticker_info.info
-            if info and 'longName' in info:
-                return self._create_ticker_result(ticker, info)
-        except:
-            pass
-        return None
+    @trace_method("bulk_fetch")
+    async def _bulk_fetch(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch basic info for each ticker concurrently on worker threads"""
+        await asyncio.to_thread(_prime_info_cache, tickers)
+        infos = await asyncio.gather(
+            *(asyncio.to_thread(self._get_single_ticker_info, ticker) for ticker in tickers)
+        )
+        return {ticker: info for ticker, info in zip(tickers, infos) if info}
 
     @trace_method("get_search_suggestions")
-    def get_search_suggestions(self, query: str, limit: int = 10) -> List[SearchSuggestion]:
+    @_cached_result(_search_cache, key=_suggestion_key)
+    async def get_search_suggestions(self, query: str, limit: int = 10) -> List[SearchSuggestion]:
         """
         Get search suggestions for autocomplete
         """
         query_upper = query.upper()
+        query_folded = query.casefold()
         
-        # Find matching tickers first
-        matching_tickers = []
-        for ticker in self.popular_tickers:
-            if (query_upper in ticker or 
-                ticker.startswith(query_upper)):
-                matching_tickers.append(ticker)
-                if len(matching_tickers) >= limit * 2:
-                    break
+        # Serve symbol and name-token prefix matches from the in-memory trie
+        if not _name_index_warmed.is_set():
+            await asyncio.to_thread(self.warm_name_index)
+        if _suggestion_trie is not None:
+            entries = _suggestion_trie.prefix_search(query_folded, limit)
+            if entries:
+                return [
+                    SearchSuggestion.model_construct(
+                        ticker=ticker,
+                        company_name=company_name,
+                        match_type="ticker" if ticker.startswith(query_upper) else "name"
+                    )
+                    for ticker, company_name in entries
+                ]
         
-        # Batch fetch basic info
+        # Otherwise fall back to substring matching, looking names up over the network
+        # Every prefix match is also a substring match, so the n-gram index covers both
+        matching_tickers = self._ticker_substring_matches(query_upper)[:limit * 2]
+        
+        # Suggestions only need names, so one batched quote request replaces a
+        # full .info round-trip per ticker
         if matching_tickers:
-            ticker_info_dict = self._batch_fetch_ticker_info(matching_tickers[:limit * 2])
+            try:
+                ticker_info_dict = await asyncio.to_thread(_cached_quotes, matching_tickers)
+            except _YF_ERRORS as e:
+                logger.warning(f"Batch quote lookup failed, fetching info per ticker: {e}")
+                ticker_info_dict = await self._bulk_fetch(matching_tickers)
             
             suggestions = []
             for ticker in matching_tickers:
@@ -440,24 +1030,13 @@ class DiscoveryService:
                     
                 if ticker in ticker_info_dict:
                     info = ticker_info_dict[ticker]
-                    company_name = info.get('longName', '')
-                    
-                    # Determine match type
-                    match_type = "partial"
-                    if ticker == query_upper:
-                        match_type = "ticker"
-                    elif ticker.startswith(query_upper):
-                        match_type = "ticker"
-                    elif company_name.upper().startswith(query.upper()):
-                        match_type = "name"
-                    elif query.upper() in company_name.upper():
-                        match_type = "name"
-                    else:
+                    match_type = self._suggestion_match_type(ticker, info, query_upper, query_folded)
+                    if match_type is None:
                         continue
                     
-                    suggestions.append(SearchSuggestion(
+                    suggestions.append(SearchSuggestion.model_construct(
                         ticker=ticker,
-                        company_name=company_name,
+                        company_name=info.get('longName') or '',
                         match_type=match_type
                     ))
             
@@ -465,50 +1044,26 @@ class DiscoveryService:
         
         return []
 
-    @measure_yfinance_call("ticker")
-    def _create_suggestion_safe(self, ticker: str, query: str, query_upper: str) -> Optional[SearchSuggestion]:
-        """Safely create suggestion with error handling"""
-        try:
-            ticker_info = yf.Ticker(ticker)
-            info = ticker_info.info
-            
-            if not info or 'longName' not in info:
-                return None
-                
-            company_name = info.get('longName', '')
-            
-            # Determine match type
-            match_type = "partial"
-            if ticker == query_upper:
-                match_type = "ticker"
-            elif ticker.startswith(query_upper):
-                match_type = "ticker"
-            elif company_name.upper().startswith(query.upper()):
-                match_type = "name"
-            elif query.upper() in company_name.upper():
-                match_type = "name"
-            else:
-                return None
-                
-            return SearchSuggestion(
-                ticker=ticker,
-                company_name=company_name,
-                match_type=match_type
-            )
-        except:
-            return None
-
-    @trace_method("get_sectors")
-    def get_sectors(self) -> List[SectorInfo]:
+    def _suggestion_match_type(self, ticker: str, info: Dict[str, Any], query_upper: str, query_folded: str) -> Optional[str]:
         """
-        Get all available sectors with stock counts
+        Classify a suggestion as a ticker-prefix or company-name match using the query
+        normalized once by the caller; None when neither matches
         """
+        if ticker.startswith(query_upper):
+            return "ticker"
+        if query_folded in _folded_name(ticker, info):
+            return "name"
+        return None
+
+    @cached_property
+    def _sectors(self) -> List[SectorInfo]:
+        """SectorInfo models, built once since the mapping is static"""
         sectors = []
-        for sector_name, industries in self.sector_industry_mapping.items():
+        for sector_name, industries in self.SECTOR_INDUSTRY_MAPPING.items():
             # Estimate stock count (in real implementation, query database)
             stock_count = len(industries) * 15  # Rough estimate
             
-            sectors.append(SectorInfo(
+            sectors.append(SectorInfo.model_construct(
                 name=sector_name,
                 stock_count=stock_count,
                 description=f"Companies in the {sector_name.lower()} sector"
@@ -516,87 +1071,105 @@ class DiscoveryService:
         
         return sectors
 
+    @trace_method("get_sectors")
+    def get_sectors(self) -> List[SectorInfo]:
+        """
+        Get all available sectors with stock counts (shared cached list; don't mutate)
+        """
+        return self._sectors
+
     @trace_method("get_sector_stocks")
-    def get_sector_stocks(self, sector: str, limit: int = 50) -> List[StockSummary]:
+    @_cached_result(_result_cache)
+    async def get_sector_stocks(self, sector: str, limit: int = 50) -> List[StockSummary]:
         """
         Get stocks within a specific sector using enhanced yfinance Sector API integration
         """
         try:
             # Use the enhanced method which tries yfinance.Sector() API first, then falls back
-            sector_tickers = self._get_enhanced_tickers_by_sector(sector)[:limit]
+            sector_tickers = (await asyncio.to_thread(self._get_enhanced_tickers_by_sector, sector))[:limit]
             
             if sector_tickers:
                 # Batch fetch all ticker information
-                ticker_info_dict = self._batch_fetch_ticker_info(sector_tickers)
+                ticker_info_dict = await self._abatch_fetch_ticker_info(sector_tickers)
                 
-                # Filter results to ensure they actually belong to the sector
-                filtered_summaries = []
-                for summary in self._batch_create_stock_summaries(ticker_info_dict):
+                # Filter the raw rows to ensure they actually belong to the sector, so
+                # only surviving rows are turned into summaries
+                sector_folded = sector.casefold()
+                is_standard_sector = sector in self.SECTOR_INDUSTRY_MAPPING  # Accept our standard sectors
+                sector_info = {}
+                for ticker, info in ticker_info_dict.items():
+                    if len(sector_info) >= limit:
+                        break
+                    if not _has_summary_prices(info):
+                        continue
                     # More flexible sector validation
-                    if (summary.sector and (
-                        sector.lower() in summary.sector.lower() or
-                        summary.sector.lower() in sector.lower() or
-                        sector in ["Technology", "Healthcare", "Financial Services", 
-                                 "Consumer Cyclical", "Consumer Defensive", "Energy", 
-                                 "Materials", "Real Estate", "Communication Services", 
-                                 "Industrials", "Utilities"]  # Accept our standard sectors
-                    )) or len(filtered_summaries) < limit // 2:  # Allow some flexibility
-                        filtered_summaries.append(summary)
+                    info_sector = (info.get('sector') or "").casefold()
+                    if (info_sector and (
+                        sector_folded in info_sector or
+                        info_sector in sector_folded or
+                        is_standard_sector
+                    )) or len(sector_info) < limit // 2:  # Allow some flexibility
+                        sector_info[ticker] = info
                         
-                return filtered_summaries[:limit]
+                return self._batch_create_stock_summaries(sector_info)
         
-        except Exception:
+        except _YF_ERRORS as e:
             # Fallback to original implementation
+            logger.warning(f"Sector lookup failed for {sector}, using static sector list: {e}")
             sector_tickers = self._get_tickers_by_sector(sector)[:limit]
             
             if sector_tickers:
-                ticker_info_dict = self._batch_fetch_ticker_info(sector_tickers)
+                ticker_info_dict = await self._abatch_fetch_ticker_info(sector_tickers)
                 return self._batch_create_stock_summaries(ticker_info_dict)
         
         return []
 
+    @cached_property
+    def _industries_by_sector(self) -> Dict[str, List[IndustryInfo]]:
+        """IndustryInfo models per sector, built once since the mapping is static"""
+        return {
+            sector_name: [
+                IndustryInfo.model_construct(
+                    name=industry,
+                    sector=sector_name,
+                    stock_count=20,  # Estimate
+                    description=f"Companies in {industry}"
+                )
+                for industry in industry_list
+            ]
+            for sector_name, industry_list in self.SECTOR_INDUSTRY_MAPPING.items()
+        }
+
+    @cached_property
+    def _all_industries(self) -> List[IndustryInfo]:
+        """Every sector's IndustryInfo models, flattened in mapping order"""
+        return [info for infos in self._industries_by_sector.values() for info in infos]
+
     @trace_method("get_industries")
     def get_industries(self, sector: Optional[str] = None) -> List[IndustryInfo]:
         """
-        Get industries, optionally filtered by sector
+        Get industries, optionally filtered by sector (shared cached lists; don't mutate)
         """
-        industries = []
-        
         if sector:
             # Get industries for specific sector
-            sector_industries = self.sector_industry_mapping.get(sector, [])
-            for industry in sector_industries:
-                industries.append(IndustryInfo(
-                    name=industry,
-                    sector=sector,
-                    stock_count=20,  # Estimate
-                    description=f"Companies in {industry}"
-                ))
-        else:
-            # Get all industries
-            for sector_name, industry_list in self.sector_industry_mapping.items():
-                for industry in industry_list:
-                    industries.append(IndustryInfo(
-                        name=industry,
-                        sector=sector_name,
-                        stock_count=20,  # Estimate
-                        description=f"Companies in {industry}"
-                    ))
+            return self._industries_by_sector.get(sector, [])
         
-        return industries
+        # Get all industries
+        return self._all_industries
 
     @trace_method("get_industry_stocks")
-    def get_industry_stocks(self, industry: str, limit: int = 50) -> List[StockSummary]:
+    @_cached_result(_result_cache)
+    async def get_industry_stocks(self, industry: str, limit: int = 50) -> List[StockSummary]:
         """
         Get stocks within specific industry
         """
         # For demo, return subset of popular stocks
         # In real implementation, filter by actual industry classification
-        tickers = self.popular_tickers[:limit]
+        tickers = list(self.POPULAR_TICKERS[:limit])
         
         if tickers:
             # Batch fetch all ticker information
-            ticker_info_dict = self._batch_fetch_ticker_info(tickers)
+            ticker_info_dict = await self._abatch_fetch_ticker_info(tickers)
             
             # Create stock summaries from batch data
             return self._batch_create_stock_summaries(ticker_info_dict)
@@ -604,68 +1177,44 @@ class DiscoveryService:
         return []
 
     @trace_method("get_stocks_by_market_cap")
-    def get_stocks_by_market_cap(self, category: str, limit: int = 100) -> List[StockSummary]:
+    @_cached_result(_result_cache)
+    async def get_stocks_by_market_cap(self, category: str, limit: int = 100) -> List[StockSummary]:
         """
         Get stocks by market capitalization category using comprehensive ticker screening
         """
-        # Define market cap ranges (in billions)
-        cap_ranges = {
-            "large-cap": (10, None),      # >$10B
-            "mid-cap": (2, 10),           # $2B-$10B
-            "small-cap": (0.3, 2),        # $300M-$2B
-            "micro-cap": (0, 0.3)         # <$300M
-        }
-        
-        min_cap, max_cap = cap_ranges.get(category, (0, None))
+        min_cap, max_cap = self._CAP_RANGES.get(category, (0, None))
         
         # Get a more comprehensive list of tickers for screening
-        candidate_tickers = self._get_comprehensive_ticker_list(limit * 3)  # Get 3x to filter down
+        candidate_tickers = await asyncio.to_thread(self._get_comprehensive_ticker_list, limit * 3)  # Get 3x to filter down
         
-        # Batch fetch ticker information
-        ticker_info_dict = self._batch_fetch_ticker_info(candidate_tickers)
+        # Screen on one batched quote request; price history and full profiles are
+        # fetched only for returned rows
+        ticker_info_dict = await self._afetch_quote_infos(candidate_tickers)
         
-        # Filter by market cap and create summaries
-        stocks = []
-        sorted_tickers = []
+        # Filter by market cap with a vectorized mask instead of a per-ticker Python branch
+        tickers = list(ticker_info_dict)
+        infos = list(ticker_info_dict.values())
+        caps = np.fromiter((info.get('marketCap') or 0 for info in infos), dtype=np.float64, count=len(infos))
+        prices = np.fromiter((info.get('regularMarketPrice') or 0 for info in infos), dtype=np.float64, count=len(infos))
         
-        # First, collect and sort by market cap
-        for ticker, info in ticker_info_dict.items():
-            market_cap = info.get('marketCap')
-            if market_cap and info.get('current_price'):  # Ensure we have both market cap and price
-                market_cap_b = market_cap / 1e9  # Convert to billions
-                
-                # Check if within range
-                if market_cap_b >= min_cap and (max_cap is None or market_cap_b <= max_cap):
-                    sorted_tickers.append((ticker, market_cap_b, info))
+        # Ensure we have both market cap and price, and that the cap is within range;
+        # bounds are scaled once rather than dividing every cap by 1e9
+        mask = (caps > 0) & (prices > 0) & (caps >= min_cap * 1e9)
+        if max_cap is not None:
+            mask &= caps <= max_cap * 1e9
+        indices = np.flatnonzero(mask)
         
         # Sort by market cap (descending for large-cap, ascending for others)
-        if category == "large-cap":
-            sorted_tickers.sort(key=lambda x: x[1], reverse=True)
-        else:
-            sorted_tickers.sort(key=lambda x: x[1], reverse=False)
+        sort_key = -caps[indices] if category == "large-cap" else caps[indices]
+        selected = _smallest_k(indices, sort_key, limit)
         
-        # Create summaries from sorted list
-        for ticker, market_cap_b, info in sorted_tickers[:limit]:
-            try:
-                summary = StockSummary(
-                    ticker=ticker,
-                    company_name=info.get('longName', ticker),
-                    current_price=info.get('current_price'),
-                    price_change=info.get('price_change'),
-                    price_change_percent=info.get('price_change_percent'),
-                    volume=info.get('volume'),
-                    market_cap=info.get('marketCap'),
-                    sector=info.get('sector'),
-                    industry=info.get('industry')
-                )
-                stocks.append(summary)
-            except Exception:
-                continue
-                
-        return stocks
+        selected_info = await self._afill_prices({tickers[i]: infos[i] for i in selected})
+        selected_info = await self._afill_profiles(selected_info)
+        return self._batch_create_stock_summaries(selected_info)
 
     @trace_method("get_stocks_by_price_range")
-    def get_stocks_by_price_range(
+    @_cached_result(_result_cache)
+    async def get_stocks_by_price_range(
         self, 
         min_price: float = 0, 
         max_price: float = 1000, 
@@ -675,169 +1224,75 @@ class DiscoveryService:
         Get stocks within specific price range using comprehensive ticker screening
         """
         # Get a comprehensive list of tickers for screening
-        candidate_tickers = self._get_comprehensive_ticker_list(limit * 4)  # Get 4x to filter down
+        candidate_tickers = await asyncio.to_thread(self._get_comprehensive_ticker_list, limit * 4)  # Get 4x to filter down
         
-        # Batch fetch ticker information
-        ticker_info_dict = self._batch_fetch_ticker_info(candidate_tickers)
+        # Screen on one batched quote request; price history and full profiles are
+        # fetched only for returned rows
+        ticker_info_dict = await self._afetch_quote_infos(candidate_tickers)
         
-        # Filter by price range and create summaries
-        stocks = []
-        price_filtered_tickers = []
+        # Filter by price range with a vectorized mask, requiring valid volume (quote
+        # rows are already named)
+        tickers = list(ticker_info_dict)
+        infos = list(ticker_info_dict.values())
+        prices = np.fromiter((info.get('regularMarketPrice') or 0 for info in infos), dtype=np.float64, count=len(infos))
+        volumes = np.fromiter((info.get('regularMarketVolume') or 0 for info in infos), dtype=np.float64, count=len(infos))
         
-        # First pass: filter by price and collect volume data for sorting
-        for ticker, info in ticker_info_dict.items():
-            current_price = info.get('current_price')
-            volume = info.get('volume', 0)
-            
-            if (current_price and min_price <= current_price <= max_price and 
-                info.get('longName') and volume > 0):  # Ensure valid data
-                price_filtered_tickers.append((ticker, current_price, volume, info))
+        mask = (prices > 0) & (prices >= min_price) & (prices <= max_price) & (volumes > 0)
+        indices = np.flatnonzero(mask)
         
         # Sort by volume (descending) to get most liquid stocks first
-        price_filtered_tickers.sort(key=lambda x: x[2], reverse=True)
+        selected = _smallest_k(indices, -volumes[indices], limit)
         
-        # Create summaries from sorted and filtered list
-        for ticker, current_price, volume, info in price_filtered_tickers[:limit]:
-            try:
-                summary = StockSummary(
-                    ticker=ticker,
-                    company_name=info.get('longName', ticker),
-                    current_price=current_price,
-                    price_change=info.get('price_change'),
-                    price_change_percent=info.get('price_change_percent'),
-                    volume=volume,
-                    market_cap=info.get('marketCap'),
-                    sector=info.get('sector'),
-                    industry=info.get('industry')
-                )
-                stocks.append(summary)
-            except Exception:
-                continue
-                
-        return stocks
-
-    def _get_stock_summary_safe(self, ticker: str) -> Optional[StockSummary]:
-        """Get stock summary with error handling"""
-        try:
-            return self._get_stock_summary(ticker)
-        except:
-            return None
-
-    @trace_method("create_ticker_result")
-    @measure_yfinance_call("ticker")
-    def _create_ticker_result(self, ticker: str, info: Dict[str, Any]) -> TickerSearchResult:
-        """
-        Create TickerSearchResult from yfinance info
-        """
-        # Get current price data
-        current_price, price_change, price_change_percent = self._get_price_data(ticker, info)
-
-        return TickerSearchResult(
-            ticker=ticker,
-            company_name=info.get('longName', ticker),
-            sector=info.get('sector'),
-            industry=info.get('industry'),
-            market_cap=info.get('marketCap'),
-            current_price=current_price,
-            price_change=price_change,
-            price_change_percent=price_change_percent,
-            volume=info.get('volume'),
-            exchange=info.get('exchange')
-        )
-
-    @measure_yfinance_call("ticker")
-    def _get_price_data(self, ticker: str, info: Dict[str, Any]) -> tuple:
-        """Get current price data for ticker"""
-        try:
-            ticker_obj = yf.Ticker(ticker)
-            hist = ticker_obj.history(period="2d")
-            
-            current_price = None
-            price_change = None
-            price_change_percent = None
-            
-            if not hist.empty:
-                current_price = float(hist['Close'].iloc[-1])
-                if len(hist) > 1:
-                    prev_price = float(hist['Close'].iloc[-2])
-                    price_change = current_price - prev_price
-                    price_change_percent = (price_change / prev_price) * 100
-                    
-        except:
-            current_price = info.get('currentPrice')
-            price_change = info.get('change')
-            price_change_percent = info.get('changePercent')
-            
-        return current_price, price_change, price_change_percent
+        selected_info = await self._afill_prices({tickers[i]: infos[i] for i in selected})
+        # The history close can differ slightly from the quote, so keep the range exact
+        selected_info = {
+            ticker: info for ticker, info in selected_info.items()
+            if min_price <= info.get('current_price', -1) <= max_price
+        }
+        selected_info = await self._afill_profiles(selected_info)
+        return self._batch_create_stock_summaries(selected_info)
 
-    @measure_yfinance_call("ticker")
-    def _get_stock_summary(self, ticker: str) -> Optional[StockSummary]:
+    @trace_method("warm_name_index")
+    def warm_name_index(self) -> Dict[str, str]:
         """
-        Get stock summary data
+        Populate the company name index and suggestion trie for popular tickers with
+        one batched lookup
         """
-        ticker_obj = yf.Ticker(ticker)
-        info = ticker_obj.info
-        hist = ticker_obj.history(period="2d")
-        
-        if hist.empty or not info or 'longName' not in info:
-            return None
-            
-        current_price = float(hist['Close'].iloc[-1])
-        volume = int(hist['Volume'].iloc[-1])
-        
-        price_change = 0
-        price_change_percent = 0
-        
-        if len(hist) > 1:
-            prev_price = float(hist['Close'].iloc[-2])
-            price_change = current_price - prev_price
-            price_change_percent = (price_change / prev_price) * 100
-        
-        return StockSummary(
-            ticker=ticker,
-            company_name=info.get('longName', ticker),
-            current_price=current_price,
-            price_change=price_change,
-            price_change_percent=price_change_percent,
-            volume=volume,
-            market_cap=info.get('marketCap'),
-            sector=info.get('sector'),
-            industry=info.get('industry')
+        global _suggestion_trie
+        tickers = list(self.POPULAR_TICKERS)
+        try:
+            infos = _cached_quotes(tickers)
+        except _YF_ERRORS as e:
+            logger.warning(f"Batch quote lookup failed, fetching info per ticker: {e}")
+            infos = self._bulk_info(tickers)
+        for ticker, info in infos.items():
+            _folded_name(ticker, info)
+        _suggestion_trie = TickerTrie.from_entries(
+            (ticker, infos[ticker]['longName']) for ticker in tickers
+            if infos.get(ticker, {}).get('longName')
         )
+        _name_index_warmed.set()
+        return _name_index
 
-    @measure_yfinance_call("ticker")
-    def _company_name_matches(self, ticker: str, query: str) -> bool:
+    @trace_method("warmup")
+    def warmup(self) -> None:
         """
-        Check if company name matches query
+        Prefetch what a cold first request would otherwise wait on: the name index and
+        suggestion trie, then the popular tickers' profiles (kept for the profile TTL);
+        failures are logged and left for requests to fill on demand
         """
         try:
-            ticker_info = yf.Ticker(ticker)
-            info = ticker_info.info
-            company_name = info.get('longName', '')
-            return query.upper() in company_name.upper()
-        except:
-            return False
+            self.warm_name_index()
+            self._bulk_info(list(self.POPULAR_TICKERS))
+        except Exception as e:
+            logger.warning(f"Discovery warmup failed, caches will fill on demand: {e}")
 
     def _get_tickers_by_sector(self, sector: str) -> List[str]:
         """
         Get tickers that belong to a specific sector
         This is a simplified implementation - in production, use proper sector classification
         """
-        sector_mappings = {
-            "Technology": ["AAPL", "MSFT", "GOOGL", "NVDA", "ADBE", "CRM", "INTC", "CSCO", "AVGO", "TXN"],
-            "Healthcare": ["JNJ", "PFE", "ABT", "TMO", "LLY", "ABBV"],
-            "Financial Services": ["JPM", "V", "MA", "PYPL"],
-            "Consumer Cyclical": ["AMZN", "TSLA", "HD", "DIS", "COST"],
-            "Consumer Defensive": ["PG", "KO", "PEP", "WMT"],
-            "Communication Services": ["META", "NFLX", "CMCSA", "VZ", "T"],
-            "Energy": [],
-            "Industrials": [],
-            "Materials": [],
-            "Real Estate": [],
-            "Utilities": []
-        }
-        
-        return sector_mappings.get(sector, self.popular_tickers[:10])
+        return list(self._SECTOR_TICKERS.get(sector, self.POPULAR_TICKERS[:10]))
 
     def _get_enhanced_tickers_by_sector(self, sector: str) -> List[str]:
         """
@@ -848,60 +1303,21 @@ class DiscoveryService:
         
         if sector_key_mapping:
             try:
-                # Use yfinance Sector API to get real-time top companies
-                sector_obj = yf.Sector(sector_key_mapping)
-                top_companies_df = sector_obj.top_companies
-                
-                if not top_companies_df.empty:
-                    # Extract ticker symbols from the DataFrame index or symbol column
-                    if hasattr(top_companies_df, 'index'):
-                        tickers = list(top_companies_df.index)
-                    elif 'Symbol' in top_companies_df.columns:
-                        tickers = list(top_companies_df['Symbol'])
-                    elif 'symbol' in top_companies_df.columns:
-                        tickers = list(top_companies_df['symbol'])
-                    else:
-                        # Try to get the first column that looks like ticker symbols
-                        tickers = list(top_companies_df.iloc[:, 0])
-                    
-                    # Clean and validate tickers
-                    valid_tickers = []
-                    for ticker in tickers:
-                        if isinstance(ticker, str) and ticker.strip():
-                            # Clean ticker symbol
-                            clean_ticker = ticker.strip().upper()
-                            # Basic validation - should be mostly letters and maybe dots/dashes
-                            if len(clean_ticker) <= 6 and clean_ticker.replace('.', '').replace('-', '').isalpha():
-                                valid_tickers.append(clean_ticker)
-                    
-                    if valid_tickers:
-                        return valid_tickers[:50]  # Limit to top 50 companies
-            except Exception:
+                tickers = _cached_sector_tickers(sector_key_mapping)
+                if tickers:
+                    return list(tickers)
+            except _YF_ERRORS as e:
                 # If API fails, return basic popular tickers for this sector
-                pass
+                logger.warning(f"yfinance Sector lookup failed for {sector}: {e}")
         
         # Final fallback to popular tickers if sector not found or API fails
-        return self.popular_tickers[:20]
+        return list(self.POPULAR_TICKERS[:20])
 
     def _get_yfinance_sector_key(self, sector: str) -> str:
         """
         Map our sector names to yfinance sector keys
         """
-        sector_key_mapping = {
-            "Technology": "technology",
-            "Healthcare": "healthcare", 
-            "Financial Services": "financial-services",
-            "Consumer Cyclical": "consumer-cyclical",
-            "Consumer Defensive": "consumer-defensive",
-            "Industrials": "industrials",
-            "Energy": "energy",
-            "Materials": "basic-materials",  # Note: yfinance uses "basic-materials"
-            "Real Estate": "real-estate",
-            "Communication Services": "communication-services",
-            "Utilities": "utilities"
-        }
-        
-        return sector_key_mapping.get(sector)
+        return self._YFINANCE_SECTOR_KEYS.get(sector)
 
     def _get_comprehensive_ticker_list(self, target_count: int = 300) -> List[str]:
         """
@@ -910,40 +1326,31 @@ class DiscoveryService:
         comprehensive_tickers = set()
         
         # Start with popular tickers
-        comprehensive_tickers.update(self.popular_tickers)
+        comprehensive_tickers.update(self.POPULAR_TICKERS)
         
         # Add tickers from all sectors
         for sector_tickers in self._get_all_enhanced_sector_tickers().values():
             comprehensive_tickers.update(sector_tickers)
         
         # Add some additional high-volume/high-market-cap tickers
-        additional_tickers = [
-            # Additional large caps
-            "TSMC", "ASML", "ROCHE", "NESN", "SAP", "TM", "NVO", "UL", "BABA", "TSM",
-            # Additional mid caps that are commonly traded
-            "ROKU", "TWLO", "ZM", "PTON", "UBER", "LYFT", "SHOP", "SQ", "DKNG", "RBLX",
-            # REITs and utilities
-            "SPY", "QQQ", "IWM", "VTI", "EFA", "EEM", "GLD", "SLV", "USO", "XLE",
-            # Additional growth stocks
-            "ARKK", "ARKQ", "ARKG", "MSTR", "COIN", "HOOD", "SOFI", "AFRM", "BNPL", "OPEN"
-        ]
-        comprehensive_tickers.update(additional_tickers)
-        
-        # Convert to list and return up to target count
-        ticker_list = list(comprehensive_tickers)
+        comprehensive_tickers.update(self._ADDITIONAL_TICKERS)
         
-        # Prioritize by putting popular tickers first
-        prioritized_list = []
-        prioritized_list.extend([t for t in self.popular_tickers if t in ticker_list])
-        prioritized_list.extend([t for t in ticker_list if t not in self.popular_tickers])
+        # Prioritize by putting popular tickers first (all of them are in the set above)
+        prioritized_list = list(self.POPULAR_TICKERS)
+        prioritized_list.extend([t for t in comprehensive_tickers if t not in self._POPULAR_SET])
         
         return prioritized_list[:target_count]
 
     def _get_all_enhanced_sector_tickers(self) -> Dict[str, List[str]]:
         """
-        Get all enhanced sector ticker mappings
+        Get all enhanced sector ticker mappings, looking the sectors up concurrently
         """
-        return {
-            sector: self._get_enhanced_tickers_by_sector(sector) 
-            for sector in self.sector_industry_mapping.keys()
-        }
+        sectors = list(self.SECTOR_INDUSTRY_MAPPING.keys())
+        return dict(zip(sectors, _get_executor().map(self._get_enhanced_tickers_by_sector, sectors)))
+
+# Shared service instance; the class holds no per-request state
+discovery_service = DiscoveryService()
+
+def get_discovery_service() -> DiscoveryService:
+    """Dependency function that returns the shared DiscoveryService"""
+    return discovery_service
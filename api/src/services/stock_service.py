@@ -1,11 +1,9 @@
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import date, timedelta
 from functools import partial
 import asyncio
-import time
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from ..models.daily import Daily
+import math
+import threading
 from ..schemas.stock import Stock, StockPredictionRequest, StockPrediction, StockRecommendation
 from ..telemetry_decorators import (
     trace_method, 
@@ -16,8 +14,8 @@ from ..telemetry_decorators import (
 )
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import MinMaxScaler
+from cachetools import TTLCache
+from sklearn.ensemble import HistGradientBoostingRegressor
 import yfinance as yf
 import logging
 
@@ -25,52 +23,280 @@ logger = logging.getLogger(__name__)
 
 # Model cache configuration
 MODEL_CACHE_TTL = 300  # 5 minutes
+MODEL_CACHE_MAXSIZE = 128  # trained models kept at once
 CONFIDENCE_INTERVAL_RANGE = 0.02  # 2%
+RSI_WINDOW = 14  # trading days averaged for RSI gains and losses
+RECOMMENDATION_LOOKBACK_DAYS = 90  # calendar days of history behind a recommendation; ~60 trading days for the 50-day SMA
 
-# Simple in-memory model cache
-_model_cache = {}
+# Symbols per multi-ticker yf.download request
+DOWNLOAD_CHUNK_SIZE = 20
+
+# Per-ticker price history cache; entries expire so the latest bar gets refreshed
+HISTORY_CACHE_TTL = 300  # 5 minutes
+HISTORY_CACHE_MAXSIZE = 2048  # tickers kept at once
+# History prefetched when a ticker is viewed, enough for its prediction and recommendation
+PREFETCH_LOOKBACK_DAYS = 90
+
+# Bounded in-memory model cache; entries expire after MODEL_CACHE_TTL
+_model_cache = TTLCache(maxsize=MODEL_CACHE_MAXSIZE, ttl=MODEL_CACHE_TTL)
+_model_cache_lock = threading.RLock()
+# Fetch-and-train tasks in flight per model cache key, shared by concurrent predictions
+_model_inflight: Dict[str, "asyncio.Task[Optional[ModelCacheEntry]]"] = {}
+
+# Price history per ticker, only touched from the event loop
+_history_cache = TTLCache(maxsize=HISTORY_CACHE_MAXSIZE, ttl=HISTORY_CACHE_TTL)
+# Background prefetches, referenced until they finish so they aren't garbage collected
+_prefetch_tasks: Set[asyncio.Task] = set()
+
+def _moving_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean as one convolution, NaN-padded like pandas rolling; a NaN only affects its own windows"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = np.convolve(values, np.full(window, 1.0 / window), mode='valid')
+    return out
+
+def _moving_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sample standard deviation from convolved sums and sums of squares, NaN-padded
+    like _moving_mean; values are centered first (variance is shift invariant) so the
+    subtraction doesn't cancel
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        centered = values - np.nanmean(values)
+        kernel = np.ones(window)
+        sums = np.convolve(centered, kernel, mode='valid')
+        sums_sq = np.convolve(centered * centered, kernel, mode='valid')
+        out[window - 1:] = np.sqrt(np.maximum(sums_sq - sums * sums / window, 0.0) / (window - 1))
+    return out
+
+def _score_recommendations(
+    price: np.ndarray, sma_20: np.ndarray, sma_50: np.ndarray, rsi: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score buy/sell signals for many tickers at once from their latest indicators,
+    returning recommendation labels, confidences and target prices
+    """
+    # Moving average crossover (2% apart), RSI oversold/overbought, price vs both averages
+    buy_signals = (
+        ((sma_20 > sma_50) & ((sma_20 - sma_50) / sma_50 > 0.02)).astype(np.int8)
+        + (rsi < 30)
+        + ((price > sma_20) & (price > sma_50))
+    )
+    sell_signals = (
+        ((sma_20 < sma_50) & ((sma_50 - sma_20) / sma_20 > 0.02)).astype(np.int8)
+        + (rsi > 70)
+        + ((price < sma_20) & (price < sma_50))
+    )
+    
+    net = buy_signals - sell_signals
+    is_buy = net >= 2
+    is_sell = net <= -2
+    recommendations = np.select([is_buy, is_sell], ["BUY", "SELL"], "HOLD")
+    # 0.7 to 0.99 for a decisive signal, 0.6 for HOLD
+    strength = np.where(is_buy, buy_signals, sell_signals)
+    confidences = np.where(is_buy | is_sell, 0.7 + np.minimum(0.29, (strength - 2) * 0.1), 0.6)
+    # 10% upside for BUY, 10% downside for SELL, 5% upside for HOLD
+    targets = price * np.select([is_buy, is_sell], [1.1, 0.9], 1.05)
+    return recommendations, confidences, targets
+
+def _sorted_by_date(stocks: pd.DataFrame) -> pd.DataFrame:
+    """Return stocks in date order, skipping the sort when yfinance already returned it sorted"""
+    if stocks['Date'].is_monotonic_increasing:
+        return stocks
+    return stocks.sort_values('Date')
+
+class HistoryCacheEntry:
+    """Daily rows for one ticker covering every date from start_date to end_date"""
+    __slots__ = ('start_date', 'end_date', 'data', 'days')
+    
+    def __init__(self, start_date: date, end_date: date, data: pd.DataFrame):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.data = data
+        self.days = data['Date'].to_numpy().astype('datetime64[D]')
+    
+    def covers(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= start_date and end_date <= self.end_date
+    
+    def touches(self, start_date: date, end_date: date) -> bool:
+        """Whether the range overlaps or directly adjoins the cached one"""
+        return start_date <= self.end_date + timedelta(days=1) and self.start_date - timedelta(days=1) <= end_date
+    
+    def slice(self, start_date: date, end_date: date) -> pd.DataFrame:
+        mask = (self.days >= np.datetime64(start_date)) & (self.days <= np.datetime64(end_date))
+        return self.data[mask]
 
 class ModelCacheEntry:
-    def __init__(self, model, scaler, features, created_at: float):
+    __slots__ = ('model', 'features', 'data')
+    
+    def __init__(self, model, features, data: pd.DataFrame):
         self.model = model
-        self.scaler = scaler
         self.features = features
-        self.created_at = created_at
-    
-    def is_expired(self, ttl_seconds: int = MODEL_CACHE_TTL) -> bool:
-        return time.time() - self.created_at > ttl_seconds
+        self.data = data  # prepared training frame, reused to seed forecasts
 
 class StockService:
     def __init__(self):
         pass
     
     @trace_method("get_stock_data")
-    @measure_yfinance_call("ticker")
     @log_method_call(include_args=True)
     async def get_stock_data(self, ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
-        """Retrieve stock data for a given ticker and date range using Yahoo Finance, returns a DataFrame"""
-        try:
-            # Run yfinance in executor to avoid blocking event loop
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None, 
-                partial(yf.download, ticker, start=start_date, end=end_date + timedelta(days=1), progress=False)
+        """
+        Retrieve stock data for a given ticker and date range using Yahoo Finance, returns a DataFrame.
+        Ranges are served from the per-ticker history cache when covered, downloading only
+        the missing dates on either side of it; each download also prefetches enough
+        earlier history for the ticker's prediction and recommendation.
+        """
+        entry = _history_cache.get(ticker)
+        if entry is not None and entry.covers(start_date, end_date):
+            return entry.slice(start_date, end_date)
+        
+        if entry is not None and entry.touches(start_date, end_date):
+            # Extend the cached range; the gaps keep it contiguous
+            gaps = []
+            if start_date < entry.start_date:
+                gaps.append((start_date, entry.start_date - timedelta(days=1)))
+            if end_date > entry.end_date:
+                gaps.append((entry.end_date + timedelta(days=1), end_date))
+            fetched = await asyncio.gather(*(self._fetch_stock_data(ticker, start, end) for start, end in gaps))
+            # Widen the cached range by every gap that downloaded, even one with no rows
+            # (a weekend or holiday), so it isn't fetched again; a failed gap stays
+            # uncovered since caching it would hide those dates until expiry
+            filled = [(gap, frame) for gap, frame in zip(gaps, fetched) if frame is not None]
+            if not filled:
+                return entry.slice(start_date, end_date)
+            data = entry.data
+            frames = [frame for _, frame in filled if not frame.empty]
+            if frames:
+                data = pd.concat([data, *frames], ignore_index=True)
+                data = _sorted_by_date(data.drop_duplicates('Date', keep='last'))
+            entry = HistoryCacheEntry(
+                min(entry.start_date, *(start for (start, _), _ in filled)),
+                max(entry.end_date, *(end for (_, end), _ in filled)),
+                data
             )
-            
-            if df.empty:
-                logger.warning(f"No data returned for ticker {ticker}")
+            _history_cache[ticker] = entry
+            if len(filled) < len(gaps):
+                # Leave the failed side to the next call rather than prefetching over it
+                return entry.slice(start_date, end_date)
+        else:
+            data = await self._fetch_stock_data(ticker, start_date, end_date)
+            if data is None or data.empty:
                 return pd.DataFrame()
-            
-            df = df.reset_index()
-            df['Ticker'] = ticker
-            return df
-            
+            entry = HistoryCacheEntry(start_date, end_date, data)
+            _history_cache[ticker] = entry
+        
+        self._schedule_prefetch(ticker, entry)
+        return entry.slice(start_date, end_date)
+    
+    def _schedule_prefetch(self, ticker: str, entry: HistoryCacheEntry) -> None:
+        """Extend a ticker's cached history back PREFETCH_LOOKBACK_DAYS in the background"""
+        prefetch_start = entry.end_date - timedelta(days=PREFETCH_LOOKBACK_DAYS)
+        if entry.start_date <= prefetch_start:
+            return
+        task = asyncio.create_task(self.get_stock_data(ticker, prefetch_start, entry.end_date))
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
+    
+    @measure_yfinance_call("ticker")
+    async def _fetch_stock_data(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """Download one ticker's rows for a date range, returns None on failure and an empty DataFrame when the range has no rows"""
+        if not np.busday_count(start_date, end_date + timedelta(days=1)):
+            # Weekend only, nothing to download
+            return pd.DataFrame()
+        try:
+            stocks = await self._download_bulk([ticker], start_date, end_date)
         except Exception as e:
             logger.error(f"Error fetching data for {ticker}: {e}")
+            return None
+        
+        if ticker not in stocks:
+            logger.warning(f"No data returned for ticker {ticker}")
             return pd.DataFrame()
+        return stocks[ticker]
+    
+    @trace_method("get_stock_data_bulk")
+    @measure_yfinance_call("batch")
+    @log_method_call(include_args=True)
+    async def get_stock_data_bulk(self, tickers: List[str], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+        """
+        Retrieve stock data for many tickers with one multi-symbol yfinance download per
+        chunk of tickers, returns a DataFrame per ticker (tickers without data are omitted).
+        Tickers whose cached history covers the range skip the download, and downloaded
+        ranges seed the cache for later single-ticker reads.
+        """
+        stocks = {}
+        uncached = []
+        for ticker in tickers:
+            entry = _history_cache.get(ticker)
+            if entry is not None and entry.covers(start_date, end_date):
+                stocks[ticker] = entry.slice(start_date, end_date)
+            else:
+                uncached.append(ticker)
+        
+        if uncached:
+            try:
+                fetched = await self._download_bulk(uncached, start_date, end_date)
+            except Exception as e:
+                logger.error(f"Error fetching data for {len(uncached)} tickers: {e}")
+                fetched = {}
+            for ticker, data in fetched.items():
+                # Don't replace a cached range the download doesn't cover
+                entry = _history_cache.get(ticker)
+                if entry is None or (start_date <= entry.start_date and entry.end_date <= end_date):
+                    _history_cache[ticker] = HistoryCacheEntry(start_date, end_date, data)
+            stocks.update(fetched)
+        
+        missing = [ticker for ticker in tickers if ticker not in stocks]
+        if missing:
+            logger.warning(f"No data returned for tickers {missing}")
+        return stocks
+    
+    async def _download_bulk(self, tickers: List[str], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+        """Download chunks of tickers concurrently and split the results per ticker"""
+        # Run yfinance in executor to avoid blocking event loop
+        loop = asyncio.get_running_loop()
+        chunks = [tickers[i:i + DOWNLOAD_CHUNK_SIZE] for i in range(0, len(tickers), DOWNLOAD_CHUNK_SIZE)]
+        frames = await asyncio.gather(*(
+            loop.run_in_executor(
+                None,
+                partial(
+                    yf.download, " ".join(chunk), start=start_date, end=end_date + timedelta(days=1),
+                    group_by='ticker', threads=True, progress=False
+                )
+            )
+            for chunk in chunks
+        ))
+        
+        stocks = {}
+        for chunk, df in zip(chunks, frames):
+            for ticker in chunk:
+                ticker_df = self._split_ticker_frame(df, ticker)
+                if not ticker_df.empty:
+                    stocks[ticker] = ticker_df
+        return stocks
+    
+    def _split_ticker_frame(self, df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        """Slice one ticker's rows out of a (ticker, field) download frame as a flat DataFrame"""
+        # yfinance keeps the ticker column level even for a single symbol in recent releases
+        if isinstance(df.columns, pd.MultiIndex):
+            if ticker not in df.columns.get_level_values(0):
+                return pd.DataFrame()
+            df = df[ticker]
+        
+        # Rows where this ticker didn't trade but others in the chunk did are all-NaN
+        df = df.dropna(how='all')
+        if df.empty:
+            return pd.DataFrame()
+        
+        df = df.reset_index()
+        df.columns.name = None
+        df['Ticker'] = ticker
+        return df
     
     @trace_method("predict_stock_price")
-    @record_prediction_metrics("ticker", "days", "random_forest")
+    @record_prediction_metrics("ticker", "days", "hist_gradient_boosting")
     @log_method_call(include_args=True, include_result=True)
     async def predict_stock_price(
         self, 
@@ -97,71 +323,66 @@ class StockService:
             # Create cache key for model
             cache_key = f"{ticker}_{lookback_days}_{end_date}"
             
-            # Check if model is cached and valid
-            model, scaler, features = self._get_cached_model(cache_key, ticker, start_date, end_date)
+            # A cached model keeps the prepared data it was trained on, so a hit needs no fetch
+            with _model_cache_lock:
+                entry = _model_cache.get(cache_key)
             
-            if model is None:
-                return []
-            
-            # Get latest data for prediction base
-            stocks = await self._fetch_historical_data(ticker, start_date, end_date)
-            if stocks.empty:
-                return []
-            
-            df = self._prepare_ml_data(stocks)
-            if df is None:
-                return []
-            
-            predictions = self._generate_predictions(model, scaler, df, features, end_date, days)
+            if entry is not None:
+                logger.info(f"Using cached model for {ticker}")
+            else:
+                # Concurrent misses for the same key share one fetch-and-train; shield it so
+                # one caller being cancelled doesn't cancel the others
+                task = _model_inflight.get(cache_key)
+                if task is None:
+                    task = asyncio.create_task(self._load_model(cache_key, ticker, start_date, end_date))
+                    _model_inflight[cache_key] = task
+                    task.add_done_callback(lambda _: _model_inflight.pop(cache_key, None))
+                entry = await asyncio.shield(task)
+                if entry is None:
+                    return []
+            
+            predictions = await asyncio.to_thread(
+                self._generate_predictions, entry.model, entry.data, entry.features, end_date, days
+            )
             return predictions
             
         except Exception as e:
             logger.error(f"Error predicting stock price for {ticker}: {e}")
             return []
     
-    def _get_cached_model(self, cache_key: str, ticker: str, start_date: date, end_date: date) -> Tuple[Optional[RandomForestRegressor], Optional[MinMaxScaler], Optional[List[str]]]:
-        """Get model from cache or train new one if expired/missing"""
-        global _model_cache
+    async def _load_model(self, cache_key: str, ticker: str, start_date: date, end_date: date) -> Optional[ModelCacheEntry]:
+        """Fetch history, prepare features and train a model, caching it under cache_key"""
+        stocks = await self._fetch_historical_data(ticker, start_date, end_date)
+        if stocks.empty:
+            return None
         
-        # Check if cached model exists and is valid
-        if cache_key in _model_cache:
-            entry = _model_cache[cache_key]
-            if not entry.is_expired():
-                logger.info(f"Using cached model for {ticker}")
-                return entry.model, entry.scaler, entry.features
-            else:
-                logger.info(f"Model cache expired for {ticker}, retraining...")
-                del _model_cache[cache_key]
+        # Feature engineering, training and prediction are CPU-bound, so keep them
+        # off the event loop and let concurrent predictions overlap
+        df = await asyncio.to_thread(self._prepare_ml_data, stocks)
+        if df is None:
+            return None
         
-        # Train new model and cache it
+        return await asyncio.to_thread(self._train_cached_model, cache_key, ticker, df)
+    
+    def _train_cached_model(self, cache_key: str, ticker: str, df: pd.DataFrame) -> Optional[ModelCacheEntry]:
+        """Train a new model on the prepared data and cache it with that data"""
         logger.info(f"Training new model for {ticker}")
         
-        # We need to fetch data synchronously here for training
-        # This is acceptable as training happens infrequently due to caching
         try:
-            df = yf.download(ticker, start=start_date, end=end_date + timedelta(days=1), progress=False)
-            if df.empty:
-                return None, None, None
-                
-            df = df.reset_index()
-            df['Ticker'] = ticker
-            df = self._prepare_ml_data(df)
-            
-            if df is None:
-                return None, None, None
-                
-            model, scaler, features = self._train_model(df)
-            
-            if model is not None:
-                # Cache the trained model
-                _model_cache[cache_key] = ModelCacheEntry(model, scaler, features, time.time())
-                logger.info(f"Model cached for {ticker}")
+            model, features = self._train_model(df)
+            if model is None:
+                return None
             
-            return model, scaler, features
+            # Cache the trained model
+            entry = ModelCacheEntry(model, features, df)
+            with _model_cache_lock:
+                _model_cache[cache_key] = entry
+            logger.info(f"Model cached for {ticker}")
+            return entry
             
         except Exception as e:
             logger.error(f"Error training model for {ticker}: {e}")
-            return None, None, None
+            return None
     
     @trace_method("fetch_historical_data")
     async def _fetch_historical_data(self, ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
@@ -172,15 +393,21 @@ class StockService:
     def _prepare_ml_data(self, stocks: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Prepare data for ML model with feature engineering"""
         try:
-            df = stocks.copy()
-            df = df.sort_values('Date')
-            
-            # Feature engineering
-            df['returns'] = df['Close'].pct_change()
-            df['sma_5'] = df['Close'].rolling(window=5).mean()
-            df['sma_20'] = df['Close'].rolling(window=20).mean()
-            df['volatility'] = df['returns'].rolling(window=20).std() * np.sqrt(252)
-            df = df.dropna()
+            # Columns are added with assign, which returns a new frame, so no defensive copy
+            df = _sorted_by_date(stocks)
+            
+            # Feature engineering on the raw close array, avoiding per-window pandas overhead
+            close = df['Close'].to_numpy(dtype=np.float64)
+            returns = np.empty_like(close)
+            returns[0] = np.nan
+            returns[1:] = close[1:] / close[:-1] - 1
+            df = df.assign(
+                returns=returns,
+                sma_5=_moving_mean(close, 5),
+                sma_20=_moving_mean(close, 20),
+                volatility=_moving_std(returns, 20) * np.sqrt(252)
+            )
+            df = df[df.notna().all(axis=1).to_numpy()]
             
             if len(df) < 30:  # Not enough data
                 logger.warning("Insufficient data for ML training")
@@ -194,45 +421,62 @@ class StockService:
     
     @trace_method("train_model")
     @time_operation("model_training")
-    def _train_model(self, df: pd.DataFrame) -> Tuple[Optional[RandomForestRegressor], Optional[MinMaxScaler], Optional[List[str]]]:
-        """Train the ML model and return model, scaler, and feature list"""
+    def _train_model(self, df: pd.DataFrame) -> Tuple[Optional[HistGradientBoostingRegressor], Optional[List[str]]]:
+        """Train the ML model and return model and feature list"""
         try:
             # Prepare features and target
             features = ['Open', 'High', 'Low', 'Close', 'Volume', 'sma_5', 'sma_20', 'volatility']
-            X = df[features].values
-            y = df['Close'].shift(-1).dropna().values
+            # HistGradientBoosting bins and predicts in float64, so build the matrix in that
+            # dtype once; float32 input would only be copied back up
+            X = df[features].to_numpy(dtype=np.float64)
+            y = df['Close'].to_numpy(dtype=np.float64)[1:]  # next day's close
             X = X[:-1]  # Remove last row as we don't have y for it
             
-            # Scale features
-            scaler = MinMaxScaler()
-            X_scaled = scaler.fit_transform(X)
-            
-            # Train model
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
-            model.fit(X_scaled, y)
+            # Train model; tree splits are scale-invariant, so features need no scaling
+            model = HistGradientBoostingRegressor(max_iter=100, learning_rate=0.05, random_state=42)
+            model.fit(X, y)
             
-            return model, scaler, features
+            return model, features
             
         except Exception as e:
             logger.error(f"Error training model: {e}")
-            return None, None, None
+            return None, None
     
     @trace_method("generate_predictions")
-    def _generate_predictions(self, model, scaler, df: pd.DataFrame, features: List[str], 
+    def _generate_predictions(self, model, df: pd.DataFrame, features: List[str], 
                             end_date: date, days: int) -> List[StockPrediction]:
         """Generate predictions for the specified number of days"""
         try:
             predictions = []
-            X = df[features].values
-            last_data = X[-1].reshape(1, -1)
+            X = df[features].to_numpy(dtype=np.float64)
+            last_data = X[-1:].copy()
             current_date = end_date
             
+            # Draw all simulated open/high/low shocks up front from a per-call Generator
+            # (forecasts run on worker threads, and Generators aren't thread-safe); as
+            # Python floats, like the rest of the loop state, so the per-day scalar math
+            # below runs on plain floats and math functions rather than numpy scalars
+            rng = np.random.default_rng()
+            open_shocks = rng.normal(0, 0.01, size=days).tolist()
+            high_shocks = np.abs(rng.normal(0, 0.02, size=days)).tolist()
+            low_shocks = np.abs(rng.normal(0, 0.02, size=days)).tolist()
+            
+            # Closes feeding the moving averages, updated incrementally as predictions roll in
+            closes = X[-20:, 3].tolist()
+            sma_5 = sum(closes[-5:]) / 5
+            sma_20 = sum(closes) / 20
+            
+            # The volatility feature is trained as the 20-day sample std of simple returns,
+            # so keep the trailing 20 returns with their mean and sum of squared deviations,
+            # sliding both one return per day (Welford's update for a fixed-size window,
+            # which avoids the cancellation of a sum-of-squares)
+            returns = (X[-21:, 3][1:] / X[-21:, 3][:-1] - 1).tolist()
+            mean_return = sum(returns) / 20
+            m2_returns = sum((r - mean_return) ** 2 for r in returns)
+            
             for i in range(days):
-                # Scale the last data point
-                last_data_scaled = scaler.transform(last_data)
-                
                 # Predict next day's close
-                pred_close = model.predict(last_data_scaled)[0]
+                pred_close = float(model.predict(last_data)[0])
                 
                 # Add some randomness for confidence interval (simplified)
                 confidence_range = pred_close * CONFIDENCE_INTERVAL_RANGE
@@ -246,18 +490,28 @@ class StockService:
                     confidence_interval_upper=pred_close + confidence_range
                 ))
                 
-                # Update last_data for next prediction (using predicted close as next day's close)
-                last_data = np.roll(last_data, -1)
-                last_data[0, -1] = pred_close  # Update close price
-                last_data[0, 0] = pred_close * (1 + np.random.normal(0, 0.01))  # Simulated open
-                last_data[0, 1] = max(pred_close * (1 + abs(np.random.normal(0, 0.02))), last_data[0, 0])  # High
-                last_data[0, 2] = min(pred_close * (1 - abs(np.random.normal(0, 0.02))), last_data[0, 0])  # Low
-                last_data[0, 3] = pred_close  # Close
+                # Roll the predicted close into the moving averages and volatility
+                sma_5 += (pred_close - closes[-5]) / 5
+                sma_20 += (pred_close - closes[-20]) / 20
+                new_return = pred_close / closes[-1] - 1
+                old_return = returns[-20]
+                old_mean = mean_return
+                mean_return += (new_return - old_return) / 20
+                m2_returns += (new_return - old_return) * (new_return - mean_return + old_return - old_mean)
+                returns.append(new_return)
+                closes.append(pred_close)
+                volatility = math.sqrt(max(m2_returns, 0.0) / 19 * 252)
                 
-                # Update SMAs and other features (simplified)
-                last_data[0, 5] = (last_data[0, 3] + X[-4:, 3].sum()) / 5  # SMA_5
-                last_data[0, 6] = (last_data[0, 3] + X[-19:, 3].sum()) / 20  # SMA_20
-                last_data[0, 7] = np.std(np.diff(np.log(np.concatenate([X[:, 3], [pred_close]])))) * np.sqrt(252)  # Volatility
+                # Update last_data for next prediction (using predicted close as next day's close);
+                # volume carries over from the last observed day
+                simulated_open = pred_close * (1 + open_shocks[i])
+                last_data[0, 0] = simulated_open  # Simulated open
+                last_data[0, 1] = max(pred_close * (1 + high_shocks[i]), simulated_open)  # High
+                last_data[0, 2] = min(pred_close * (1 - low_shocks[i]), simulated_open)  # Low
+                last_data[0, 3] = pred_close  # Close
+                last_data[0, 5] = sma_5  # SMA_5
+                last_data[0, 6] = sma_20  # SMA_20
+                last_data[0, 7] = volatility  # Volatility
             
             return predictions
             
@@ -280,7 +534,7 @@ class StockService:
         try:
             # Get recent data
             end_date = date.today()
-            start_date = end_date - timedelta(days=60)  # 2 months of data
+            start_date = end_date - timedelta(days=RECOMMENDATION_LOOKBACK_DAYS)
             
             stocks = await self.get_stock_data(ticker, start_date, end_date)
             if stocks.empty:
@@ -297,87 +551,86 @@ class StockService:
             logger.error(f"Error generating recommendation for {ticker}: {e}")
             return None
     
-    @trace_method("calculate_technical_indicators")
+    @trace_method("get_stock_recommendations")
+    @log_method_call(include_args=True)
+    async def get_stock_recommendations(self, tickers: List[str]) -> List[StockRecommendation]:
+        """
+        Generate recommendations for many tickers from one bulk history download,
+        scoring every ticker's indicators in a single vectorized pass; tickers without
+        enough data are omitted
+        """
+        end_date = date.today()
+        start_date = end_date - timedelta(days=RECOMMENDATION_LOOKBACK_DAYS)
+        stocks = await self.get_stock_data_bulk(tickers, start_date, end_date)
+        
+        scored = []
+        for ticker in tickers:
+            if ticker in stocks:
+                indicators = self._calculate_technical_indicators(stocks[ticker])
+                if indicators is not None:
+                    scored.append((ticker, indicators))
+        if not scored:
+            return []
+        
+        price, sma_20, sma_50, rsi = (
+            np.fromiter((indicators[key] for _, indicators in scored), dtype=np.float64, count=len(scored))
+            for key in ('price', 'sma_20', 'sma_50', 'rsi')
+        )
+        recommendations, confidences, targets = _score_recommendations(price, sma_20, sma_50, rsi)
+        return [
+            StockRecommendation(
+                ticker=ticker,
+                current_price=float(price[i]),
+                target_price=round(float(targets[i]), 2),
+                recommendation=str(recommendations[i]),
+                confidence=round(float(confidences[i]), 2),
+                last_updated=end_date
+            )
+            for i, (ticker, _) in enumerate(scored)
+        ]
+    
+    @trace_method("calculate_technical_indicators", as_event=True)
     def _calculate_technical_indicators(self, stocks: pd.DataFrame) -> Optional[dict]:
         """Calculate technical indicators for recommendation logic"""
         try:
-            # Convert to DataFrame for analysis
-            df = stocks.copy()
-            df = df.sort_values('Date')
+            close = _sorted_by_date(stocks)['Close'].to_numpy(dtype=np.float64)
             
-            # Calculate technical indicators
-            df['sma_20'] = df['Close'].rolling(window=20).mean()
-            df['sma_50'] = df['Close'].rolling(window=50).mean()
-            df['rsi'] = self._calculate_rsi(df['Close'])
+            # Only the latest value of each indicator is used, so average just the
+            # trailing windows instead of rolling over the whole series
+            if len(close) < 50:
+                logger.warning("Insufficient data for technical indicators")
+                return None
             
-            # Get latest values
-            latest = df.iloc[-1]
+            sma_20 = close[-20:].mean()
+            sma_50 = close[-50:].mean()
             
             # Simple recommendation logic (can be enhanced)
-            if pd.isna(latest['sma_20']) or pd.isna(latest['sma_50']):
+            if np.isnan(sma_20) or np.isnan(sma_50):
                 logger.warning("Insufficient data for technical indicators")
                 return None
             
             return {
-                'price': latest['Close'],
-                'sma_20': latest['sma_20'],
-                'sma_50': latest['sma_50'],
-                'rsi': latest['rsi']
+                'price': close[-1],
+                'sma_20': sma_20,
+                'sma_50': sma_50,
+                # The latest RSI only depends on the last window + 1 closes
+                'rsi': self._calculate_rsi(close[-(RSI_WINDOW + 1):], RSI_WINDOW)[-1]
             }
             
         except Exception as e:
             logger.error(f"Error calculating technical indicators: {e}")
             return None
     
-    @trace_method("generate_recommendation_logic")
+    @trace_method("generate_recommendation_logic", as_event=True)
     def _generate_recommendation_logic(self, indicators: dict, ticker: str, end_date: date) -> StockRecommendation:
         """Generate recommendation based on technical indicators"""
         try:
             price = indicators['price']
-            sma_20 = indicators['sma_20']
-            sma_50 = indicators['sma_50']
-            rsi = indicators['rsi']
-            
-            # Simple strategy
-            buy_signals = 0
-            sell_signals = 0
-            
-            # Moving average crossover
-            if sma_20 > sma_50 and (sma_20 - sma_50) / sma_50 > 0.02:  # 2% above
-                buy_signals += 1
-            elif sma_20 < sma_50 and (sma_50 - sma_20) / sma_20 > 0.02:  # 2% below
-                sell_signals += 1
-                
-            # RSI
-            if rsi < 30:  # Oversold
-                buy_signals += 1
-            elif rsi > 70:  # Overbought
-                sell_signals += 1
-                
-            # Price vs moving averages
-            if price > sma_20 and price > sma_50:
-                buy_signals += 1
-            elif price < sma_20 and price < sma_50:
-                sell_signals += 1
-            
-            # Determine final recommendation
-            if buy_signals - sell_signals >= 2:
-                recommendation = "BUY"
-                confidence = 0.7 + min(0.29, (buy_signals - 2) * 0.1)  # 0.7 to 0.99
-            elif sell_signals - buy_signals >= 2:
-                recommendation = "SELL"
-                confidence = 0.7 + min(0.29, (sell_signals - 2) * 0.1)  # 0.7 to 0.99
-            else:
-                recommendation = "HOLD"
-                confidence = 0.6
-                
-            # Simple target price (can be enhanced)
-            if recommendation == "BUY":
-                target_price = price * 1.1  # 10% upside
-            elif recommendation == "SELL":
-                target_price = price * 0.9  # 10% downside
-            else:
-                target_price = price * 1.05  # 5% upside for HOLD
+            recommendations, confidences, targets = _score_recommendations(
+                np.array([price]), np.array([indicators['sma_20']]),
+                np.array([indicators['sma_50']]), np.array([indicators['rsi']])
+            )
+            recommendation, confidence, target_price = str(recommendations[0]), float(confidences[0]), float(targets[0])
             
             return StockRecommendation(
                 ticker=ticker,
@@ -392,14 +645,23 @@ class StockService:
             logger.error(f"Error in recommendation logic: {e}")
             raise
     
-    @trace_method("calculate_rsi")
-    def _calculate_rsi(self, prices: pd.Series, window: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index (RSI)"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    @trace_method("calculate_rsi", as_event=True)
+    def _calculate_rsi(self, close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+        """Calculate Relative Strength Index (RSI) over an array of closes"""
+        delta = np.zeros_like(close)
+        delta[1:] = np.diff(close)
+        gain = _moving_mean(np.where(delta > 0, delta, 0.0), window)
+        loss = _moving_mean(np.where(delta < 0, -delta, 0.0), window)
         
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = gain / loss
+            rsi = 100 - (100 / (1 + rs))
         
         return rsi
+
+# Shared service instance; model state lives in the module-level caches
+stock_service = StockService()
+
+def get_stock_service() -> StockService:
+    """Dependency function that returns the shared StockService"""
+    return stock_service
@@ -0,0 +1,52 @@
+from typing import Dict, Iterable, List, Tuple
+
+# (ticker, company name) pair stored at every node a key passes through
+TrieEntry = Tuple[str, str]
+
+class _TrieNode:
+    __slots__ = ("children", "results")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # First entries inserted below this node, capped so a lookup never walks subtrees
+        self.results: List[TrieEntry] = []
+
+class TickerTrie:
+    """
+    Prefix trie over casefolded ticker symbols and company-name tokens for autocomplete.
+    Each node caches up to max_results entries in insertion order, so a prefix search
+    is a walk of len(prefix) nodes; insert symbols before names to rank them first.
+    """
+
+    def __init__(self, max_results: int = 20):
+        self._root = _TrieNode()
+        self._max_results = max_results
+
+    def insert(self, key: str, entry: TrieEntry) -> None:
+        """Index entry under every prefix of key (already casefolded)"""
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            if len(node.results) < self._max_results and entry not in node.results:
+                node.results.append(entry)
+
+    def prefix_search(self, prefix: str, limit: int) -> List[TrieEntry]:
+        """Return up to limit entries with a symbol or name token starting with prefix"""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.results[:limit]
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TrieEntry], max_results: int = 20) -> "TickerTrie":
+        """Build a trie with every symbol indexed ahead of every name token"""
+        entries = list(entries)
+        trie = cls(max_results)
+        for ticker, company_name in entries:
+            trie.insert(ticker.casefold(), (ticker, company_name))
+        for ticker, company_name in entries:
+            for token in company_name.casefold().split():
+                trie.insert(token, (ticker, company_name))
+        return trie
@@ -1,39 +1,93 @@
 import os
+import itertools
 import logging
-from typing import Optional
+import threading
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
 from opentelemetry import trace, metrics
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, ConsoleMetricExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.exporter.prometheus import PrometheusMetricReader
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
-from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
-from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from prometheus_client import start_http_server
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.context import Context
 import time
-from .config import settings
+from .config import get_settings
+
+# Exporters, readers and instrumentors are imported where they're set up, so
+# importing this module (decorators, tests, OTEL_SDK_DISABLED) doesn't load them
+if TYPE_CHECKING:
+    from opentelemetry.exporter.prometheus import PrometheusMetricReader
+    from opentelemetry.sdk.resources import Resource
 
-# Configure logging
-logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL.upper()))
 logger = logging.getLogger(__name__)
 
+# Metric attribute sets are interned per label combination (ticker cardinality is
+# bounded), so recording a call doesn't build fresh dicts and str() labels each time
+@lru_cache(maxsize=4096)
+def _yfinance_attrs(ticker: str, success: bool) -> Mapping[str, str]:
+    return MappingProxyType({"ticker": ticker, "success": str(success)})
+
+@lru_cache(maxsize=4096)
+def _yfinance_error_attrs(ticker: str) -> Mapping[str, str]:
+    return MappingProxyType({"ticker": ticker})
+
+@lru_cache(maxsize=4096)
+def _prediction_attrs(ticker: str, days: int, model_type: str) -> Mapping[str, str]:
+    return MappingProxyType({"ticker": ticker, "days": str(days), "model": model_type})
+
+class RoundRobinSpanProcessor(SpanProcessor):
+    """
+    Spread finished spans across several batch processors, each with its own queue,
+    export thread and exporter, so bursts export in parallel instead of one batch at a time
+    """
+    
+    def __init__(self, processors: List[SpanProcessor]):
+        self._processors = processors
+        self._next = itertools.cycle(processors)
+    
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        pass
+    
+    def on_end(self, span: ReadableSpan) -> None:
+        next(self._next).on_end(span)
+    
+    def shutdown(self) -> None:
+        for processor in self._processors:
+            processor.shutdown()
+    
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return all(processor.force_flush(timeout_millis) for processor in self._processors)
+
 class TelemetryConfig:
     """OpenTelemetry configuration for the Stock Prediction API"""
     
     def __init__(self):
+        settings = get_settings()
         self.service_name = settings.OTEL_SERVICE_NAME
         self.service_version = settings.OTEL_SERVICE_VERSION
         self.jaeger_endpoint = settings.JAEGER_ENDPOINT
         self.prometheus_port = settings.PROMETHEUS_PORT
         self.enable_console_export = settings.OTEL_CONSOLE_EXPORT
+        self.instrument_urllib3 = settings.OTEL_INSTRUMENT_URLLIB3
+        self.span_processor_options = {
+            "max_queue_size": settings.OTEL_BSP_MAX_QUEUE_SIZE,
+            "max_export_batch_size": settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+            "schedule_delay_millis": settings.OTEL_BSP_SCHEDULE_DELAY,
+            "export_timeout_millis": settings.OTEL_BSP_EXPORT_TIMEOUT,
+        }
+        self.export_workers = settings.OTEL_BSP_WORKERS or max(1, (os.cpu_count() or 2) // 2)
+        self.metric_flush_interval = settings.OTEL_METRIC_FLUSH_INTERVAL
+        
+        # yfinance observations buffered per (ticker, success) until the next flush
+        self._pending_yfinance: Dict[Tuple[str, bool], List[float]] = defaultdict(list)
+        self._pending_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._prometheus_reader: Optional["PrometheusMetricReader"] = None
         
         # Custom metrics
         self.meter = None
-        self.tracer = None
+        # Bound up front so get_tracer never falls back per call; until setup_tracing
+        # installs the SDK provider this is the global proxy, which then delegates to it
+        self.tracer = trace.get_tracer(__name__)
         
         # Metrics for monitoring
         self.api_request_duration = None
@@ -43,33 +97,61 @@ class TelemetryConfig:
         self.yfinance_requests_total = None
         self.yfinance_errors_total = None
         
-    def setup_tracing(self):
-        """Configure distributed tracing"""
-        resource = Resource.create({
+    @cached_property
+    def resource(self) -> "Resource":
+        """Service resource shared by the tracer and meter providers, built on first use"""
+        from opentelemetry.sdk.resources import Resource
+        
+        return Resource.create({
             "service.name": self.service_name,
             "service.version": self.service_version,
         })
+    
+    def setup_tracing(self):
+        """Configure distributed tracing"""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+        from opentelemetry.exporter.otlp.proto.http import Compression
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from requests.adapters import HTTPAdapter
+        import requests
         
         # Create tracer provider
-        tracer_provider = TracerProvider(resource=resource)
+        tracer_provider = TracerProvider(resource=self.resource)
         trace.set_tracer_provider(tracer_provider)
         
-        # Add OTLP exporter for Jaeger (modern approach)
+        # Add OTLP exporter for Jaeger (modern approach); gzip shrinks the large
+        # protobuf batches, and Jaeger accepts OTLP natively, so no thrift framing
         try:
-            otlp_exporter = OTLPSpanExporter(
-                endpoint=self.jaeger_endpoint,
-                headers={}
-            )
-            span_processor = BatchSpanProcessor(otlp_exporter)
+            # One session shared by every export worker, so they reuse a single
+            # keep-alive connection pool (sized to the worker count) to the collector
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.export_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            span_processors = [
+                BatchSpanProcessor(
+                    OTLPSpanExporter(
+                        endpoint=self.jaeger_endpoint,
+                        headers={},
+                        compression=Compression.Gzip,
+                        session=session
+                    ),
+                    **self.span_processor_options
+                )
+                for _ in range(self.export_workers)
+            ]
+            span_processor = span_processors[0] if len(span_processors) == 1 else RoundRobinSpanProcessor(span_processors)
             tracer_provider.add_span_processor(span_processor)
-            logger.info(f"OTLP tracing configured: {self.jaeger_endpoint}")
+            logger.info(f"OTLP tracing configured: {self.jaeger_endpoint} ({self.export_workers} export workers)")
         except Exception as e:
             logger.warning(f"Failed to configure OTLP exporter: {e}")
         
         # Add console exporter for development
         if self.enable_console_export:
             console_exporter = ConsoleSpanExporter()
-            console_processor = BatchSpanProcessor(console_exporter)
+            console_processor = BatchSpanProcessor(console_exporter, **self.span_processor_options)
             tracer_provider.add_span_processor(console_processor)
             logger.info("Console tracing enabled")
         
@@ -78,39 +160,51 @@ class TelemetryConfig:
     
     def setup_metrics(self):
         """Configure metrics collection"""
-        resource = Resource.create({
-            "service.name": self.service_name,
-            "service.version": self.service_version,
-        })
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, ConsoleMetricExporter
+        from opentelemetry.exporter.prometheus import PrometheusMetricReader
+        from prometheus_client import REGISTRY, start_http_server
         
         readers = []
         
-        # Add Prometheus exporter
-        try:
-            prometheus_reader = PrometheusMetricReader()
-            readers.append(prometheus_reader)
-            
-            # Start Prometheus metrics server
-            start_http_server(self.prometheus_port)
-            logger.info(f"Prometheus metrics server started on port {self.prometheus_port}")
-        except Exception as e:
-            logger.warning(f"Failed to configure Prometheus: {e}")
+        # Add Prometheus exporter; the reader registers its collector in the default
+        # registry, so only ever create one (and one server for it) per process or
+        # every scrape would serialize each metric once per reader
+        if self._prometheus_reader is None:
+            try:
+                self._prometheus_reader = PrometheusMetricReader()
+                
+                # Start Prometheus metrics server
+                start_http_server(self.prometheus_port, registry=REGISTRY)
+                logger.info(f"Prometheus metrics server started on port {self.prometheus_port}")
+            except Exception as e:
+                logger.warning(f"Failed to configure Prometheus: {e}")
+        if self._prometheus_reader is not None:
+            readers.append(self._prometheus_reader)
         
         # Add console exporter for development
         if self.enable_console_export:
             console_reader = PeriodicExportingMetricReader(
-                ConsoleMetricExporter(), export_interval_millis=10000
+                ConsoleMetricExporter(), export_interval_millis=60000
             )
             readers.append(console_reader)
             logger.info("Console metrics enabled")
         
         # Create meter provider
         if readers:
-            meter_provider = MeterProvider(resource=resource, metric_readers=readers)
+            meter_provider = MeterProvider(resource=self.resource, metric_readers=readers)
             metrics.set_meter_provider(meter_provider)
         
         self.meter = metrics.get_meter(__name__)
         self._create_custom_metrics()
+        
+        # Hot yfinance paths only append to a buffer; a daemon thread hands the
+        # batched observations to the SDK instruments once per interval
+        if self.metric_flush_interval > 0 and self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="metrics-flush", daemon=True
+            )
+            self._flush_thread.start()
         return self.meter
     
     def _create_custom_metrics(self):
@@ -157,9 +251,15 @@ class TelemetryConfig:
     
     def setup_auto_instrumentation(self):
         """Setup automatic instrumentation for common libraries"""
-        # Instrument HTTP requests (yfinance uses requests internally)
+        from opentelemetry.instrumentation.requests import RequestsInstrumentor
+        from opentelemetry.instrumentation.urllib3 import URLLib3Instrumentor
+        from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+        
+        # Instrument HTTP requests (yfinance uses requests internally); requests sits on
+        # urllib3, so instrumenting both would emit two nested spans per call
         RequestsInstrumentor().instrument()
-        URLLib3Instrumentor().instrument()
+        if self.instrument_urllib3:
+            URLLib3Instrumentor().instrument()
         
         # Instrument SQLAlchemy
         SQLAlchemyInstrumentor().instrument()
@@ -168,6 +268,10 @@ class TelemetryConfig:
     
     def instrument_fastapi(self, app):
         """Instrument FastAPI application"""
+        if get_settings().OTEL_SDK_DISABLED:
+            return
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        
         FastAPIInstrumentor.instrument_app(
             app,
             tracer_provider=trace.get_tracer_provider(),
@@ -177,33 +281,51 @@ class TelemetryConfig:
     
     def record_yfinance_request(self, duration: float, ticker: str, success: bool = True):
         """Record metrics for yfinance API calls"""
+        if not self.yfinance_requests_total:
+            return
+        
+        if self._flush_thread is None:
+            self._record_yfinance_batch(ticker, success, [duration])
+            return
+        
+        with self._pending_lock:
+            self._pending_yfinance[(ticker, success)].append(duration)
+    
+    def flush_metrics(self):
+        """Hand buffered yfinance observations to the metric instruments"""
+        with self._pending_lock:
+            if not self._pending_yfinance:
+                return
+            pending, self._pending_yfinance = self._pending_yfinance, defaultdict(list)
+        
+        for (ticker, success), durations in pending.items():
+            self._record_yfinance_batch(ticker, success, durations)
+    
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.metric_flush_interval)
+            try:
+                self.flush_metrics()
+            except Exception as e:
+                logger.warning(f"Failed to flush yfinance metrics: {e}")
+    
+    def _record_yfinance_batch(self, ticker: str, success: bool, durations: List[float]):
+        attributes = _yfinance_attrs(ticker, success)
         if self.yfinance_request_duration:
-            self.yfinance_request_duration.record(
-                duration, 
-                {"ticker": ticker, "success": str(success)}
-            )
+            for duration in durations:
+                self.yfinance_request_duration.record(duration, attributes)
         
-        if self.yfinance_requests_total:
-            self.yfinance_requests_total.add(
-                1, 
-                {"ticker": ticker, "success": str(success)}
-            )
+        self.yfinance_requests_total.add(len(durations), attributes)
             
         if not success and self.yfinance_errors_total:
-            self.yfinance_errors_total.add(
-                1, 
-                {"ticker": ticker}
-            )
+            self.yfinance_errors_total.add(len(durations), _yfinance_error_attrs(ticker))
     
-    def record_prediction_request(self, ticker: str, days: int, model_type: str = "random_forest"):
+    def record_prediction_request(self, ticker: str, days: int, model_type: str = "hist_gradient_boosting"):
         """Record metrics for prediction requests"""
         if self.prediction_requests_total:
-            self.prediction_requests_total.add(
-                1, 
-                {"ticker": ticker, "days": str(days), "model": model_type}
-            )
+            self.prediction_requests_total.add(1, _prediction_attrs(ticker, days, model_type))
     
-    def record_prediction_accuracy(self, accuracy: float, ticker: str, model_type: str = "random_forest"):
+    def record_prediction_accuracy(self, accuracy: float, ticker: str, model_type: str = "hist_gradient_boosting"):
         """Record prediction accuracy metrics"""
         if self.prediction_accuracy:
             self.prediction_accuracy.record(
@@ -216,6 +338,17 @@ telemetry = TelemetryConfig()
 
 def init_telemetry(app=None):
     """Initialize OpenTelemetry for the application"""
+    settings = get_settings()
+    
+    # Configure logging here rather than at import, and only when the server
+    # (e.g. uvicorn's --log-config) hasn't already set up the root logger
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL.upper()))
+    
+    if settings.OTEL_SDK_DISABLED:
+        logger.info("OpenTelemetry disabled by OTEL_SDK_DISABLED")
+        return telemetry
+    
     logger.info("Initializing OpenTelemetry...")
     
     # Setup tracing and metrics
@@ -232,7 +365,7 @@ def init_telemetry(app=None):
 
 def get_tracer():
     """Get the application tracer"""
-    return telemetry.tracer or trace.get_tracer(__name__)
+    return telemetry.tracer
 
 def get_meter():
     """Get the application meter"""
@@ -1,52 +1,213 @@
 from functools import wraps
-from typing import Callable, Any, Dict, Optional
+from types import MethodType
+from typing import Callable, Any, Dict, Iterable, Optional, Tuple, Union
+import inspect
 import time
 import logging
+import pandas as pd
+from opentelemetry.trace import get_current_span
+from .config import get_settings
 from .telemetry import get_tracer, telemetry
 
 logger = logging.getLogger(__name__)
 
+# Decorators return the function unwrapped when telemetry is switched off
+_TELEMETRY_DISABLED = get_settings().OTEL_SDK_DISABLED
+
+class _TracedMethod:
+    """Callable that runs a sync function inside a span; binds like a plain function"""
+    
+    __slots__ = ("func", "span_name", "tracer", "record_result", "params", "recorded_params", "__name__", "__wrapped__")
+    
+    def __init__(self, func: Callable, span_name: str, record_args: Union[bool, Iterable[str]], record_result: bool):
+        self.func = func
+        self.span_name = span_name
+        # The global proxy tracer follows the provider installed later by init_telemetry
+        self.tracer = get_tracer()
+        self.record_result = record_result
+        self.params = _param_layout(func)[0]
+        self.recorded_params = _recorded_params(self.params, record_args)
+        self.__name__ = func.__name__
+        self.__wrapped__ = func
+    
+    def __get__(self, instance, owner=None):
+        return self if instance is None else MethodType(self, instance)
+    
+    def __call__(self, *args, **kwargs):
+        with self.tracer.start_as_current_span(self.span_name) as span:
+            # Skip attribute work for non-recording (no-op or sampled-out) spans
+            recording = span.is_recording()
+            
+            # Record method arguments
+            if self.recorded_params and recording:
+                span.set_attributes(_method_arg_attributes(self.params, self.recorded_params, args, kwargs))
+            
+            try:
+                # Execute the method
+                result = self.func(*args, **kwargs)
+                
+                # Record result metadata
+                if recording:
+                    if self.record_result:
+                        _record_result_metadata(span, result, self.__name__)
+                    span.set_attribute("result", "success")
+                return result
+                
+            except Exception as e:
+                _record_span_error(span, e, self.__name__)
+                raise
+
+class _AsyncTracedMethod(_TracedMethod):
+    """_TracedMethod for coroutine functions"""
+    
+    __slots__ = ()
+    
+    async def __call__(self, *args, **kwargs):
+        with self.tracer.start_as_current_span(self.span_name) as span:
+            # Skip attribute work for non-recording (no-op or sampled-out) spans
+            recording = span.is_recording()
+            
+            # Record method arguments
+            if self.recorded_params and recording:
+                span.set_attributes(_method_arg_attributes(self.params, self.recorded_params, args, kwargs))
+            
+            try:
+                # Await the coroutine inside the span so its duration is captured
+                result = await self.func(*args, **kwargs)
+                
+                # Record result metadata
+                if recording:
+                    if self.record_result:
+                        _record_result_metadata(span, result, self.__name__)
+                    span.set_attribute("result", "success")
+                return result
+                
+            except Exception as e:
+                _record_span_error(span, e, self.__name__)
+                raise
+
+class _TracedEvent(_TracedMethod):
+    """
+    Callable that records a sync call as an event on the current span instead of
+    opening a child span, for chatty inner helpers; record_result is not used
+    """
+    
+    __slots__ = ()
+    
+    def __call__(self, *args, **kwargs):
+        span = get_current_span()
+        if not span.is_recording():
+            return self.func(*args, **kwargs)
+        
+        attributes = _method_arg_attributes(self.params, self.recorded_params, args, kwargs) if self.recorded_params else {}
+        start_time = time.perf_counter_ns()
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception as e:
+            _add_call_event(span, self.span_name, attributes, start_time, e)
+            raise
+        _add_call_event(span, self.span_name, attributes, start_time)
+        return result
+
+class _AsyncTracedEvent(_TracedMethod):
+    """_TracedEvent for coroutine functions"""
+    
+    __slots__ = ()
+    
+    async def __call__(self, *args, **kwargs):
+        span = get_current_span()
+        if not span.is_recording():
+            return await self.func(*args, **kwargs)
+        
+        attributes = _method_arg_attributes(self.params, self.recorded_params, args, kwargs) if self.recorded_params else {}
+        start_time = time.perf_counter_ns()
+        try:
+            result = await self.func(*args, **kwargs)
+        except Exception as e:
+            _add_call_event(span, self.span_name, attributes, start_time, e)
+            raise
+        _add_call_event(span, self.span_name, attributes, start_time)
+        return result
+
+class _YFinanceCall:
+    """Callable that times a sync yfinance call and records it per ticker"""
+    
+    __slots__ = ("func", "ticker_arg", "param_index", "__name__", "__wrapped__")
+    
+    def __init__(self, func: Callable, ticker_arg: str):
+        self.func = func
+        self.ticker_arg = ticker_arg
+        self.param_index = _param_layout(func)[1]
+        self.__name__ = func.__name__
+        self.__wrapped__ = func
+    
+    def __get__(self, instance, owner=None):
+        return self if instance is None else MethodType(self, instance)
+    
+    def __call__(self, *args, **kwargs):
+        # Extract ticker from arguments
+        ticker = _extract_ticker_from_args(args, kwargs, self.ticker_arg, self.param_index)
+        
+        # Measure execution time
+        start_time = time.perf_counter_ns()
+        
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception:
+            # Record failed call
+            telemetry.record_yfinance_request((time.perf_counter_ns() - start_time) / 1e9, ticker, success=False)
+            raise
+        
+        # Record successful call
+        telemetry.record_yfinance_request((time.perf_counter_ns() - start_time) / 1e9, ticker, success=True)
+        return result
+
+class _AsyncYFinanceCall(_YFinanceCall):
+    """_YFinanceCall for coroutine functions"""
+    
+    __slots__ = ()
+    
+    async def __call__(self, *args, **kwargs):
+        # Extract ticker from arguments
+        ticker = _extract_ticker_from_args(args, kwargs, self.ticker_arg, self.param_index)
+        
+        # Measure execution time
+        start_time = time.perf_counter_ns()
+        
+        try:
+            result = await self.func(*args, **kwargs)
+        except Exception:
+            # Record failed call
+            telemetry.record_yfinance_request((time.perf_counter_ns() - start_time) / 1e9, ticker, success=False)
+            raise
+        
+        # Record successful call
+        telemetry.record_yfinance_request((time.perf_counter_ns() - start_time) / 1e9, ticker, success=True)
+        return result
+
 def trace_method(operation_name: Optional[str] = None, 
-                record_args: bool = True,
-                record_result: bool = True):
+                record_args: Union[bool, Iterable[str]] = True,
+                record_result: bool = True,
+                as_event: bool = False):
     """
     Decorator to add distributed tracing to methods
     
     Args:
         operation_name: Custom operation name (defaults to method name)
-        record_args: Whether to record method arguments as span attributes
+        record_args: Whether to record method arguments as span attributes, or the
+            names of the only arguments to record
         record_result: Whether to record result metadata as span attributes
+        as_event: Record the call as an event on the current span rather than
+            opening a span of its own (for inner helpers called in tight loops)
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            tracer = get_tracer()
-            span_name = operation_name or func.__name__
-            
-            with tracer.start_as_current_span(span_name) as span:
-                # Record method arguments
-                if record_args:
-                    _record_method_args(span, func, args, kwargs)
-                
-                try:
-                    # Execute the method
-                    result = func(*args, **kwargs)
-                    
-                    # Record result metadata
-                    if record_result:
-                        _record_result_metadata(span, result, func.__name__)
-                    
-                    span.set_attribute("result", "success")
-                    return result
-                    
-                except Exception as e:
-                    span.record_exception(e)
-                    span.set_attribute("result", "error")
-                    span.set_attribute("error_type", type(e).__name__)
-                    logger.error(f"Error in {func.__name__}: {e}")
-                    raise
-                    
-        return wrapper
+        if _TELEMETRY_DISABLED:
+            return func
+        if as_event:
+            traced_cls = _AsyncTracedEvent if _is_coroutine_callable(func) else _TracedEvent
+        else:
+            traced_cls = _AsyncTracedMethod if _is_coroutine_callable(func) else _TracedMethod
+        return traced_cls(func, operation_name or func.__name__, record_args, record_result)
     return decorator
 
 def measure_yfinance_call(ticker_arg: str = "ticker"):
@@ -57,36 +218,15 @@ def measure_yfinance_call(ticker_arg: str = "ticker"):
         ticker_arg: Name of the argument containing the ticker symbol
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Extract ticker from arguments
-            ticker = _extract_ticker_from_args(args, kwargs, ticker_arg, func)
-            
-            # Measure execution time
-            start_time = time.time()
-            
-            try:
-                result = func(*args, **kwargs)
-                duration = time.time() - start_time
-                
-                # Record successful call
-                telemetry.record_yfinance_request(duration, ticker, success=True)
-                
-                return result
-                
-            except Exception as e:
-                duration = time.time() - start_time
-                
-                # Record failed call
-                telemetry.record_yfinance_request(duration, ticker, success=False)
-                raise
-                
-        return wrapper
+        if _TELEMETRY_DISABLED:
+            return func
+        call_cls = _AsyncYFinanceCall if _is_coroutine_callable(func) else _YFinanceCall
+        return call_cls(func, ticker_arg)
     return decorator
 
 def record_prediction_metrics(ticker_arg: str = "ticker", 
                             days_arg: str = "days",
-                            model_type: str = "random_forest"):
+                            model_type: str = "hist_gradient_boosting"):
     """
     Decorator to record prediction metrics
     
@@ -96,11 +236,15 @@ def record_prediction_metrics(ticker_arg: str = "ticker",
         model_type: Type of ML model being used
     """
     def decorator(func: Callable) -> Callable:
+        if _TELEMETRY_DISABLED:
+            return func
+        _, param_index = _param_layout(func)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Extract arguments
-            ticker = _extract_ticker_from_args(args, kwargs, ticker_arg, func)
-            days = _extract_arg_from_args(args, kwargs, days_arg, func, default=7)
+            ticker = _extract_ticker_from_args(args, kwargs, ticker_arg, param_index)
+            days = _extract_arg_from_args(args, kwargs, days_arg, param_index, default=7)
             
             # Record prediction request
             telemetry.record_prediction_request(ticker, days, model_type)
@@ -120,18 +264,19 @@ def time_operation(operation_name: Optional[str] = None):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             op_name = operation_name or func.__name__
             
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_time) / 1e9
                 
-                logger.debug(f"{op_name} completed in {duration:.3f}s")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"{op_name} completed in {duration:.3f}s")
                 return result
                 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_time) / 1e9
                 logger.error(f"{op_name} failed after {duration:.3f}s: {e}")
                 raise
                 
@@ -150,10 +295,56 @@ def log_method_call(log_level: int = logging.INFO,
         include_result: Whether to include result summary in log
     """
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                method_name = func.__name__
+                
+                # Below the logger's level only failures are logged, so skip building messages
+                if not logger.isEnabledFor(log_level):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        logger.error(f"{method_name} failed: {e}")
+                        raise
+                
+                # Log method entry
+                if include_args:
+                    args_str = _format_args_for_logging(args, kwargs)
+                    logger.log(log_level, f"Calling {method_name} with args: {args_str}")
+                else:
+                    logger.log(log_level, f"Calling {method_name}")
+                
+                try:
+                    result = await func(*args, **kwargs)
+                    
+                    # Log method completion
+                    if include_result:
+                        result_summary = _summarize_result_for_logging(result)
+                        logger.log(log_level, f"{method_name} completed: {result_summary}")
+                    else:
+                        logger.log(log_level, f"{method_name} completed successfully")
+                    
+                    return result
+                    
+                except Exception as e:
+                    logger.error(f"{method_name} failed: {e}")
+                    raise
+                    
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             method_name = func.__name__
             
+            # Below the logger's level only failures are logged, so skip building messages
+            if not logger.isEnabledFor(log_level):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"{method_name} failed: {e}")
+                    raise
+            
             # Log method entry
             if include_args:
                 args_str = _format_args_for_logging(args, kwargs)
@@ -182,43 +373,106 @@ def log_method_call(log_level: int = logging.INFO,
 
 # Helper functions
 
-def _record_method_args(span, func: Callable, args: tuple, kwargs: dict):
-    """Record method arguments as span attributes"""
+def _is_coroutine_callable(func: Callable) -> bool:
+    """Coroutine function check that also sees through the async wrapper classes above"""
+    return inspect.iscoroutinefunction(func) or isinstance(func, (_AsyncTracedMethod, _AsyncTracedEvent, _AsyncYFinanceCall))
+
+def _add_call_event(span, name: str, attributes: Dict[str, Any], start_time: int,
+                    error: Optional[Exception] = None):
+    """Add a traced-as-event call, with its outcome and duration, to the span"""
+    attributes["duration_ms"] = (time.perf_counter_ns() - start_time) / 1e6
+    if error is None:
+        attributes["result"] = "success"
+    else:
+        attributes["result"] = "error"
+        attributes["error_type"] = type(error).__name__
+        logger.error(f"Error in {name}: {error}")
+    span.add_event(name, attributes)
+
+def _record_span_error(span, error: Exception, method_name: str):
+    """Mark a span as failed and log the error"""
+    span.record_exception(error)
+    span.set_attribute("result", "error")
+    span.set_attribute("error_type", type(error).__name__)
+    logger.error(f"Error in {method_name}: {error}")
+
+def _param_layout(func: Callable) -> Tuple[Tuple[inspect.Parameter, ...], Dict[str, int]]:
+    """Signature parameters and each one's positional index, computed once at decoration time"""
+    params = tuple(inspect.signature(func).parameters.values())
+    return params, {param.name: i for i, param in enumerate(params)}
+
+def _recorded_params(params: Tuple[inspect.Parameter, ...],
+                     record_args: Union[bool, Iterable[str]]) -> Tuple[Tuple[int, inspect.Parameter], ...]:
+    """Parameters (with their positional index) whose arguments go on the span"""
+    if record_args is False:
+        return ()
+    names = None if record_args is True else frozenset(record_args)
+    return tuple(
+        (i, param) for i, param in enumerate(params)
+        if param.name != 'self' and (names is None or param.name in names)
+    )
+
+def _method_arg_attributes(params: Tuple[inspect.Parameter, ...],
+                           recorded_params: Tuple[Tuple[int, inspect.Parameter], ...],
+                           args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Method arguments as span/event attributes"""
+    attributes = {}
     try:
-        # Get function signature
-        import inspect
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
-        
-        # Record specific arguments
-        for param_name, value in bound_args.arguments.items():
-            if param_name == 'self':
+        # Resolve each parameter like Signature.bind_partial, without building a
+        # BoundArguments per call; parameters left at their default aren't recorded
+        for i, param in recorded_params:
+            param_name = param.name
+            
+            if param.kind is inspect.Parameter.VAR_POSITIONAL:
+                value = args[i:]
+                if not value:
+                    continue
+            elif param.kind is inspect.Parameter.VAR_KEYWORD:
+                value = {key: arg for key, arg in kwargs.items() if all(key != p.name for p in params)}
+                if not value:
+                    continue
+            elif i < len(args) and param.kind is not inspect.Parameter.KEYWORD_ONLY:
+                value = args[i]
+            elif param_name in kwargs:
+                value = kwargs[param_name]
+            else:
                 continue
                 
             # Convert common types to string for span attributes
             if isinstance(value, (str, int, float, bool)):
-                span.set_attribute(f"arg.{param_name}", value)
+                attributes[f"arg.{param_name}"] = value
             elif hasattr(value, '__len__'):
-                span.set_attribute(f"arg.{param_name}_length", len(value))
+                attributes[f"arg.{param_name}_length"] = len(value)
             else:
-                span.set_attribute(f"arg.{param_name}_type", type(value).__name__)
+                attributes[f"arg.{param_name}_type"] = type(value).__name__
                 
     except Exception as e:
         logger.debug(f"Failed to record method args: {e}")
+    return attributes
+
+def _result_length(result) -> Optional[int]:
+    """len() of a sized result, or None; common result types are matched before the hasattr probe"""
+    result_type = type(result)
+    if result_type is list or result_type is tuple or result_type is dict or result_type is str:
+        return len(result)
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.shape[0]
+    if hasattr(result, '__len__'):
+        return len(result)
+    return None
 
 def _record_result_metadata(span, result, method_name: str):
     """Record result metadata as span attributes"""
     try:
         if result is None:
             span.set_attribute("result_type", "None")
-        elif isinstance(result, (list, tuple)):
-            span.set_attribute("result_length", len(result))
-            span.set_attribute("result_type", type(result).__name__)
-        elif hasattr(result, '__len__'):
-            span.set_attribute("result_length", len(result))
+            return
+        
+        length = _result_length(result)
+        if length is not None:
+            span.set_attribute("result_length", length)
             span.set_attribute("result_type", type(result).__name__)
-        elif isinstance(result, (str, int, float, bool)):
+        elif isinstance(result, (int, float, bool)):
             span.set_attribute("result_value", str(result))
         else:
             span.set_attribute("result_type", type(result).__name__)
@@ -226,49 +480,22 @@ def _record_result_metadata(span, result, method_name: str):
     except Exception as e:
         logger.debug(f"Failed to record result metadata: {e}")
 
-def _extract_ticker_from_args(args: tuple, kwargs: dict, ticker_arg: str, func: Callable) -> str:
+def _extract_ticker_from_args(args: tuple, kwargs: dict, ticker_arg: str, param_index: Dict[str, int]) -> str:
     """Extract ticker symbol from method arguments"""
-    try:
-        # Try kwargs first
-        if ticker_arg in kwargs:
-            return kwargs[ticker_arg]
-        
-        # Try positional args
-        import inspect
-        sig = inspect.signature(func)
-        param_names = list(sig.parameters.keys())
-        
-        if ticker_arg in param_names:
-            ticker_index = param_names.index(ticker_arg)
-            if ticker_index < len(args):
-                return args[ticker_index]
-        
-        return "unknown"
-        
-    except Exception:
-        return "unknown"
+    return _extract_arg_from_args(args, kwargs, ticker_arg, param_index, default="unknown")
 
-def _extract_arg_from_args(args: tuple, kwargs: dict, arg_name: str, func: Callable, default=None):
+def _extract_arg_from_args(args: tuple, kwargs: dict, arg_name: str, param_index: Dict[str, int], default=None):
     """Extract any argument from method arguments"""
-    try:
-        # Try kwargs first
-        if arg_name in kwargs:
-            return kwargs[arg_name]
-        
-        # Try positional args
-        import inspect
-        sig = inspect.signature(func)
-        param_names = list(sig.parameters.keys())
-        
-        if arg_name in param_names:
-            arg_index = param_names.index(arg_name)
-            if arg_index < len(args):
-                return args[arg_index]
-        
-        return default
-        
-    except Exception:
-        return default
+    # Try kwargs first
+    if arg_name in kwargs:
+        return kwargs[arg_name]
+    
+    # Try positional args
+    index = param_index.get(arg_name)
+    if index is not None and index < len(args):
+        return args[index]
+    
+    return default
 
 def _format_args_for_logging(args: tuple, kwargs: dict) -> str:
     """Format arguments for logging (sanitized)"""
@@ -303,11 +530,11 @@ def _summarize_result_for_logging(result) -> str:
     try:
         if result is None:
             return "None"
-        elif isinstance(result, (list, tuple)):
-            return f"{type(result).__name__}(length={len(result)})"
-        elif hasattr(result, '__len__'):
-            return f"{type(result).__name__}(length={len(result)})"
-        elif isinstance(result, (str, int, float, bool)):
+        
+        length = _result_length(result)
+        if length is not None:
+            return f"{type(result).__name__}(length={length})"
+        elif isinstance(result, (int, float, bool)):
             return f"{type(result).__name__}: {result}"
         else:
             return f"{type(result).__name__}"
@@ -18,13 +18,17 @@ class MigrationTestBase:
         """The ID of the previous migration."""
         return None
     
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Bring the database to the previous migration; override to skip or seed migrations."""
+        if self.previous_migration_id:
+            command.upgrade(alembic_config, self.previous_migration_id)
+    
     def test_upgrade(self, setup_database, alembic_config):
         """Test that the migration can be applied."""
         connection = setup_database
         
         # Apply all migrations up to the one before our target
-        if self.previous_migration_id:
-            command.upgrade(alembic_config, self.previous_migration_id)
+        self.prepare_previous_revision(connection, alembic_config)
         
         # Apply our target migration
         command.upgrade(alembic_config, self.migration_id)
@@ -39,6 +43,7 @@ class MigrationTestBase:
         connection = setup_database
         
         # Apply all migrations up to our target
+        self.prepare_previous_revision(connection, alembic_config)
         command.upgrade(alembic_config, self.migration_id)
         
         # Revert our target migration
@@ -1,6 +1,4 @@
 """Common fixtures for Alembic migration tests."""
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -42,14 +40,10 @@ def alembic_config():
 
 @pytest.fixture(scope="function")
 def temp_db():
-    """Create a temporary SQLite database for testing."""
-    # Create a temporary SQLite database
-    temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-    temp_db.close()
-    
-    # Create an engine and connection
-    db_url = f"sqlite:///{temp_db.name}"
-    engine = create_engine(db_url)
+    """Create an in-memory SQLite database for testing."""
+    # An in-memory database lives as long as its connection, so there is no file to
+    # create, fsync or clean up between tests
+    engine = create_engine("sqlite:///:memory:")
     connection = engine.connect()
     
     # Set up the alembic_version table
@@ -61,7 +55,7 @@ def temp_db():
         yield connection
     finally:
         connection.close()
-        os.unlink(temp_db.name)  # Clean up the temporary database file
+        engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,54 @@
+"""Tests for the 0b6e2c9d4f18_daily_vol_bigint migration."""
+import pytest
+from alembic import command
+from sqlalchemy import inspect, text, BigInteger
+
+from .base import MigrationTestBase
+
+
+class TestDailyVolBigint(MigrationTestBase):
+    """Test the migration that stores daily volume as an integer."""
+
+    @property
+    def migration_id(self):
+        return '0b6e2c9d4f18'
+
+    @property
+    def previous_migration_id(self):
+        return 'f19c3b7d5e42'  # The previous migration
+
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table, mark the data-loading migrations as applied and add a row."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, 'f323c045cc84')
+        command.upgrade(alembic_config, self.previous_migration_id)
+        with connection.begin():
+            connection.execute(text(
+                "INSERT INTO daily (ticker, ts, per, open, high, low, close, vol) VALUES "
+                "('AAPL', '2023-01-03 09:30:00', '1', 125.0, 126.5, 124.5, 126.0, '1000')"
+            ))
+
+    def test_upgrade_converts_volume(self, setup_database, alembic_config):
+        """Test that vol becomes a BIGINT holding the loaded volume."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+
+        with connection.begin():
+            assert connection.execute(text("SELECT vol FROM daily")).scalar() == 1000
+        columns = {column['name']: column for column in inspect(connection).get_columns('daily')}
+        assert isinstance(columns['vol']['type'], BigInteger)
+
+    def test_downgrade_restores_text(self, setup_database, alembic_config):
+        """Test that downgrading turns vol back into text."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+
+        with connection.begin():
+            assert connection.execute(text("SELECT vol FROM daily")).scalar() == '1000'
@@ -0,0 +1,51 @@
+"""Tests for the a1c9e00c0d7c_add_daily_ticker_date_index migration."""
+import pytest
+from alembic import command
+from sqlalchemy import inspect
+
+from .base import MigrationTestBase
+
+
+class TestAddDailyTickerDateIndex(MigrationTestBase):
+    """Test the migration that indexes the daily table by ticker and date."""
+    
+    @property
+    def migration_id(self):
+        return 'a1c9e00c0d7c'
+    
+    @property
+    def previous_migration_id(self):
+        return 'f323c045cc84'  # The previous migration
+    
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table and mark the data-loading migrations as applied."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, self.previous_migration_id)
+    
+    def index_names(self, connection):
+        return {index['name'] for index in inspect(connection).get_indexes('daily')}
+    
+    def test_upgrade_creates_index(self, setup_database, alembic_config):
+        """Test that the migration adds the (ticker, date) index."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        assert 'ix_daily_ticker_date' not in self.index_names(connection)
+        
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+        
+        # Verify the index covers ticker then date
+        indexes = {index['name']: index for index in inspect(connection).get_indexes('daily')}
+        assert indexes['ix_daily_ticker_date']['column_names'] == ['ticker', 'date']
+    
+    def test_downgrade_removes_index(self, setup_database, alembic_config):
+        """Test that downgrading drops the index and keeps the table."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+        
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+        
+        assert self.has_table(connection, 'daily')
+        assert 'ix_daily_ticker_date' not in self.index_names(connection)
@@ -0,0 +1,58 @@
+"""Tests for the b5e2d7a3f914_add_stock_meta migration."""
+import pytest
+from alembic import command
+from sqlalchemy import text
+
+from .base import MigrationTestBase
+
+
+class TestAddStockMeta(MigrationTestBase):
+    """Test the migration that adds the per-ticker stock_meta table."""
+
+    @property
+    def migration_id(self):
+        return 'b5e2d7a3f914'
+
+    @property
+    def previous_migration_id(self):
+        return 'a1c9e00c0d7c'  # The previous migration
+
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table and mark the data-loading migrations as applied."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, 'f323c045cc84')
+        command.upgrade(alembic_config, self.previous_migration_id)
+
+    def test_upgrade_seeds_latest_row_per_ticker(self, setup_database, alembic_config):
+        """Test that stock_meta holds one row per ticker with the latest close."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+
+        with connection.begin():
+            connection.execute(text(
+                "INSERT INTO daily (id, ticker, per, date, time, open, high, low, close, vol) VALUES "
+                "('A.US_20230103_000000', 'A.US', 'D', '2023-01-03', '00:00:00', 1, 1, 1, 10.0, '100'),"
+                "('A.US_20230104_000000', 'A.US', 'D', '2023-01-04', '00:00:00', 1, 1, 1, 11.0, '200'),"
+                "('B.US_20230104_000000', 'B.US', 'D', '2023-01-04', '00:00:00', 1, 1, 1, 20.0, '300')"
+            ))
+
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+
+        with connection.begin():
+            rows = connection.execute(text(
+                "SELECT ticker, latest_close, latest_volume, sector FROM stock_meta ORDER BY ticker"
+            )).fetchall()
+        assert [tuple(row) for row in rows] == [('A.US', 11.0, 200.0, None), ('B.US', 20.0, 300.0, None)]
+
+    def test_downgrade_removes_table(self, setup_database, alembic_config):
+        """Test that downgrading drops stock_meta and keeps daily."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+
+        assert self.has_table(connection, 'daily')
+        assert not self.has_table(connection, 'stock_meta')
@@ -0,0 +1,58 @@
+"""Tests for the d4a7c2e19b30_daily_ticker_ts_primary_key migration."""
+import pytest
+from alembic import command
+from sqlalchemy import inspect, text
+
+from .base import MigrationTestBase
+
+
+class TestDailyTickerTsPrimaryKey(MigrationTestBase):
+    """Test the migration that keys the daily table by (ticker, ts)."""
+
+    @property
+    def migration_id(self):
+        return 'd4a7c2e19b30'
+
+    @property
+    def previous_migration_id(self):
+        return 'b5e2d7a3f914'  # The previous migration
+
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table, mark the data-loading migrations as applied and add a row."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, 'f323c045cc84')
+        command.upgrade(alembic_config, self.previous_migration_id)
+        with connection.begin():
+            connection.execute(text(
+                "INSERT INTO daily (id, ticker, per, date, time, open, high, low, close, vol) VALUES "
+                "('AAPL_20230103_093000', 'AAPL', '1', '2023-01-03', '09:30:00', 125.0, 126.5, 124.5, 126.0, '1000')"
+            ))
+
+    def test_upgrade_merges_date_and_time(self, setup_database, alembic_config):
+        """Test that rows are keyed by ticker and the merged timestamp."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+
+        with connection.begin():
+            ts = connection.execute(text("SELECT ts FROM daily WHERE ticker = 'AAPL'")).scalar()
+        assert str(ts).startswith('2023-01-03 09:30:00')
+        assert inspect(connection).get_pk_constraint('daily')['constrained_columns'] == ['ticker', 'ts']
+        columns = {column['name'] for column in inspect(connection).get_columns('daily')}
+        assert not columns & {'id', 'date', 'time'}
+
+    def test_downgrade_restores_id(self, setup_database, alembic_config):
+        """Test that downgrading rebuilds the string id from ticker and timestamp."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+
+        with connection.begin():
+            result = connection.execute(text("SELECT id FROM daily")).scalar()
+        assert result == 'AAPL_20230103_093000'
+        assert inspect(connection).get_pk_constraint('daily')['constrained_columns'] == ['id']
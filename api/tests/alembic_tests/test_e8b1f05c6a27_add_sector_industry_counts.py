@@ -0,0 +1,66 @@
+"""Tests for the e8b1f05c6a27_add_sector_industry_counts migration."""
+import pytest
+from alembic import command
+from sqlalchemy import text
+
+from .base import MigrationTestBase
+
+
+class TestAddSectorIndustryCounts(MigrationTestBase):
+    """Test the migration that adds the sector and industry count tables."""
+
+    @property
+    def migration_id(self):
+        return 'e8b1f05c6a27'
+
+    @property
+    def previous_migration_id(self):
+        return 'd4a7c2e19b30'  # The previous migration
+
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table, mark the data-loading migrations as applied and fill stock_meta."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, 'f323c045cc84')
+        command.upgrade(alembic_config, self.previous_migration_id)
+        with connection.begin():
+            connection.execute(text(
+                "INSERT INTO stock_meta (ticker, sector, industry) VALUES "
+                "('AAPL', 'Technology', 'Consumer Electronics'),"
+                "('MSFT', 'Technology', 'Software'),"
+                "('XOM', 'Energy', 'Oil & Gas'),"
+                "('NEW', NULL, NULL)"
+            ))
+
+    def test_upgrade_seeds_counts(self, setup_database, alembic_config):
+        """Test that the count tables are seeded from stock_meta."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+
+        with connection.begin():
+            sectors = connection.execute(text(
+                "SELECT name, stock_count FROM sector_counts ORDER BY name"
+            )).fetchall()
+            industries = connection.execute(text(
+                "SELECT name, sector, stock_count FROM industry_counts WHERE sector = 'Technology' ORDER BY name"
+            )).fetchall()
+        assert [tuple(row) for row in sectors] == [('Energy', 1), ('Technology', 2)]
+        assert [tuple(row) for row in industries] == [
+            ('Consumer Electronics', 'Technology', 1),
+            ('Software', 'Technology', 1),
+        ]
+
+    def test_downgrade_removes_tables(self, setup_database, alembic_config):
+        """Test that downgrading drops both count tables and keeps stock_meta."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+
+        assert self.has_table(connection, 'stock_meta')
+        assert not self.has_table(connection, 'sector_counts')
+        assert not self.has_table(connection, 'industry_counts')
@@ -0,0 +1,49 @@
+"""Tests for the f19c3b7d5e42_add_stock_meta_price_index migration."""
+import pytest
+from alembic import command
+from sqlalchemy import inspect
+
+from .base import MigrationTestBase
+
+
+class TestAddStockMetaPriceIndex(MigrationTestBase):
+    """Test the migration that indexes stock_meta by latest close."""
+
+    @property
+    def migration_id(self):
+        return 'f19c3b7d5e42'
+
+    @property
+    def previous_migration_id(self):
+        return 'e8b1f05c6a27'  # The previous migration
+
+    def prepare_previous_revision(self, connection, alembic_config):
+        """Create the daily table and mark the data-loading migrations as applied."""
+        command.upgrade(alembic_config, '320cbd9caf97')
+        command.stamp(alembic_config, 'f323c045cc84')
+        command.upgrade(alembic_config, self.previous_migration_id)
+
+    def index_names(self, connection):
+        return {index['name'] for index in inspect(connection).get_indexes('stock_meta')}
+
+    def test_upgrade_creates_index(self, setup_database, alembic_config):
+        """Test that the migration adds the latest close index."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+
+        # Apply the migration
+        command.upgrade(alembic_config, self.migration_id)
+
+        indexes = {index['name']: index for index in inspect(connection).get_indexes('stock_meta')}
+        assert indexes['ix_stock_meta_latest_close']['column_names'] == ['latest_close']
+
+    def test_downgrade_removes_index(self, setup_database, alembic_config):
+        """Test that downgrading drops the index."""
+        connection = setup_database
+        self.prepare_previous_revision(connection, alembic_config)
+        command.upgrade(alembic_config, self.migration_id)
+
+        # Revert the migration
+        command.downgrade(alembic_config, self.previous_migration_id)
+
+        assert 'ix_stock_meta_latest_close' not in self.index_names(connection)
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from src.services import stock_service
+from src.services.stock_service import StockService
+
+TODAY = date(2026, 10, 15)
+
+def daily_rows(start_date, end_date):
+    days = pd.date_range(start_date, end_date, name="Date")
+    return pd.DataFrame({"Date": days, "Close": range(len(days))}).assign(Ticker="AAPL")
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(stock_service, "_history_cache", {})
+    service = StockService()
+    service.downloads = []
+    service.fail = False
+    service.empty = False
+    
+    async def download_bulk(tickers, start_date, end_date):
+        service.downloads.append((start_date, end_date))
+        if service.fail:
+            raise RuntimeError("429 Too Many Requests")
+        if service.empty:
+            return {}
+        return {ticker: daily_rows(start_date, end_date) for ticker in tickers}
+    
+    monkeypatch.setattr(service, "_download_bulk", download_bulk)
+    monkeypatch.setattr(service, "_schedule_prefetch", lambda ticker, entry: None)
+    return service
+
+def test_extends_cached_range_with_missing_dates(service):
+    asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=59), TODAY))
+    data = asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=89), TODAY))
+    
+    assert len(data) == 90
+    assert service.downloads[1] == (TODAY - timedelta(days=89), TODAY - timedelta(days=60))
+    entry = stock_service._history_cache["AAPL"]
+    assert (entry.start_date, entry.end_date) == (TODAY - timedelta(days=89), TODAY)
+
+def test_failed_gap_fill_keeps_cached_range(service):
+    asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=59), TODAY))
+    service.fail = True
+    data = asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=89), TODAY))
+    
+    # The partial slice is served, but the cache doesn't claim the failed dates
+    assert len(data) == 60
+    entry = stock_service._history_cache["AAPL"]
+    assert (entry.start_date, entry.end_date) == (TODAY - timedelta(days=59), TODAY)
+    
+    # So the next call retries the gap
+    service.fail = False
+    data = asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=89), TODAY))
+    assert len(data) == 90
+    assert len(service.downloads) == 3
+
+def test_empty_gap_fill_advances_cached_range(service):
+    asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=59), TODAY - timedelta(days=2)))
+    service.empty = True
+    data = asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=59), TODAY))
+    
+    # A holiday gap has no rows but still counts as covered
+    assert len(data) == 58
+    entry = stock_service._history_cache["AAPL"]
+    assert entry.end_date == TODAY
+    asyncio.run(service.get_stock_data("AAPL", TODAY - timedelta(days=59), TODAY))
+    assert len(service.downloads) == 2
+
+def test_weekend_gap_skips_download(service):
+    friday = date(2026, 10, 16)
+    asyncio.run(service.get_stock_data("AAPL", friday - timedelta(days=59), friday))
+    data = asyncio.run(service.get_stock_data("AAPL", friday - timedelta(days=59), friday + timedelta(days=2)))
+    
+    assert len(data) == 60
+    assert stock_service._history_cache["AAPL"].end_date == friday + timedelta(days=2)
+    assert len(service.downloads) == 1
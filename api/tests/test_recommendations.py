@@ -0,0 +1,43 @@
+import asyncio
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services import stock_service
+from src.services.stock_service import RECOMMENDATION_LOOKBACK_DAYS, StockService
+
+def trading_rows(ticker, start_date, end_date):
+    days = pd.bdate_range(start_date, end_date, name="Date")
+    close = 100 + np.cumsum(np.random.default_rng(len(ticker)).normal(0, 1, len(days)))
+    return pd.DataFrame({"Date": days, "Close": close}).assign(Ticker=ticker)
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(stock_service, "_history_cache", {})
+    service = StockService()
+    
+    async def download_bulk(tickers, start_date, end_date):
+        return {ticker: trading_rows(ticker, start_date, end_date) for ticker in tickers}
+    
+    monkeypatch.setattr(service, "_download_bulk", download_bulk)
+    monkeypatch.setattr(service, "_schedule_prefetch", lambda ticker, entry: None)
+    return service
+
+def test_lookback_covers_fifty_trading_days():
+    end_date = date(2026, 10, 15)
+    start_date = end_date - timedelta(days=RECOMMENDATION_LOOKBACK_DAYS)
+    assert len(pd.bdate_range(start_date, end_date)) >= 60
+
+def test_bulk_recommendations(service):
+    recommendations = asyncio.run(service.get_stock_recommendations(["AAPL", "MSFT"]))
+    
+    assert [r.ticker for r in recommendations] == ["AAPL", "MSFT"]
+    assert all(r.recommendation in ("BUY", "SELL", "HOLD") for r in recommendations)
+
+def test_single_recommendation(service):
+    recommendation = asyncio.run(service.get_stock_recommendation("AAPL"))
+    
+    assert recommendation is not None
+    assert recommendation.ticker == "AAPL"
@@ -0,0 +1,21 @@
+from src.services.ticker_trie import TickerTrie
+
+trie = TickerTrie.from_entries([
+    ("AAPL", "Apple Inc."),
+    ("AMZN", "Amazon.com, Inc."),
+    ("MSFT", "Microsoft Corporation"),
+])
+
+def test_symbol_prefix_ranks_before_name_tokens():
+    assert trie.prefix_search("a", 10) == [
+        ("AAPL", "Apple Inc."),
+        ("AMZN", "Amazon.com, Inc."),
+    ]
+
+def test_name_token_prefix():
+    assert trie.prefix_search("micro", 10) == [("MSFT", "Microsoft Corporation")]
+    assert trie.prefix_search("inc", 10) == [("AAPL", "Apple Inc."), ("AMZN", "Amazon.com, Inc.")]
+
+def test_no_match_and_limit():
+    assert trie.prefix_search("zz", 10) == []
+    assert trie.prefix_search("a", 1) == [("AAPL", "Apple Inc.")]